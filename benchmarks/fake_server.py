@@ -0,0 +1,50 @@
+"""
+Runs concurrent record reads and batch changes against the in-process fake server, to measure the overhead of the
+client itself without any network.
+
+    python -m benchmarks.fake_server
+"""
+from dnsimple import Client, ZoneReconciler
+from dnsimple.fake import FakeDNSimple
+from dnsimple.struct import ZoneRecordInput
+from benchmarks.support import measure, report
+
+
+def run(zones=20, records=500, workers=16):
+    server = FakeDNSimple()
+    names = ['zone{index}.example'.format(index=index) for index in range(zones)]
+    for name in names:
+        server.add_zone(1010, name)
+        for index in range(records):
+            server.add_record(1010, name, 'host{index}'.format(index=index), 'A', '192.0.2.{index}'.format(
+                index=index % 256))
+    client = Client(access_token='fake', transport=server, pool_maxsize=workers)
+
+    targets = [(name, server.records(1010, name)[10]['id']) for name in names]
+
+    def get_records():
+        client.map([(client.zones.get_record, 1010, name, record_id) for name, record_id in targets] * 10,
+                   max_workers=workers)
+
+    def list_records():
+        client.map([(lambda name=name: list(client.zones.iter_records(1010, name))) for name in names],
+                   max_workers=workers)
+
+    reconciler = ZoneReconciler(client)
+    desired = [ZoneRecordInput('host{index}'.format(index=index), 'A', '198.51.100.{index}'.format(index=index % 256))
+               for index in range(records)]
+
+    def reconcile():
+        reconciler.apply(1010, names[0], desired)
+        reconciler.apply(1010, names[0], desired[:-1])
+
+    report('{zones} zones of {records} records, {workers} workers'.format(zones=zones, records=records,
+                                                                         workers=workers), [
+        ('{count} record reads'.format(count=zones * 10), measure(get_records, number=1, repeat=5)),
+        ('{count} records listed'.format(count=zones * records), measure(list_records, number=1, repeat=3)),
+        ('2 reconciliations of {records} records'.format(records=records), measure(reconcile, number=1, repeat=3)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,56 @@
+"""
+Compares the JSON decoding done by dnsimple.Response before and after decoding the payload only once.
+
+    python -m benchmarks.json_decode
+"""
+import json
+
+from dnsimple.json_backend import JSON_BACKENDS, decode, load_json_backend
+from dnsimple.response import Response
+from dnsimple.struct import DnsAnalytics, ZoneRecord
+from benchmarks.support import dns_analytics_payload, http_response, measure, report, zone_records_payload
+
+
+def decode_like_before(body):
+    """What Response used to do: json() for the data and twice for the pagination, through requests"""
+    response = http_response(body)
+    response.json()
+    response.json()
+    response.json()
+
+
+def decode_once(body, loads):
+    response = http_response(body)
+    response.json_loads = loads
+    decode(response)
+    decode(response)
+    decode(response)
+
+
+def run():
+    backends = []
+    for name in JSON_BACKENDS:
+        try:
+            backends.append((name, load_json_backend(name)))
+        except ImportError:
+            continue
+
+    for title, payload, obj in [
+        ('dns_analytics.query, 10000 rows', dns_analytics_payload(10000), DnsAnalytics),
+        ('zones.list_records, 5000 records', zone_records_payload(5000), ZoneRecord),
+    ]:
+        body = json.dumps(payload).encode('utf-8')
+        results = [('before: requests json() x3', measure(lambda: decode_like_before(body)))]
+        for name, loads in backends:
+            results.append(('after: decode once ({name})'.format(name=name), measure(lambda: decode_once(body, loads))))
+        for name, loads in backends:
+            def build():
+                response = http_response(body)
+                response.json_loads = loads
+                Response(response, obj)
+            results.append(('Response(...) ({name})'.format(name=name), measure(build)))
+        report('{title} ({size:.1f} MB)'.format(title=title, size=len(body) / 1e6), results)
+
+
+if __name__ == '__main__':
+    run()
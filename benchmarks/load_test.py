@@ -0,0 +1,99 @@
+"""
+Drives a Client against the local mock server (dnsimple.mock_server) with a mixed read workload, and reports the
+throughput and the latency percentiles of the calls, retries included.
+
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --workers 32 --calls 5000 --latency 0.02 --error-rate-502 0.02
+"""
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from dnsimple import Client, DNSimpleException, RetryPolicy
+from dnsimple.mock_server import MockServer, populate
+
+
+def percentile(samples, fraction):
+    """Returns the sample below which the given fraction of the sorted samples fall"""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def run(calls=2000, workers=16, zones=10, records=1000, latency=0.005, latency_jitter=0.005, error_rate_429=0.01,
+        error_rate_502=0.01, seed=1):
+    server = MockServer(latency=latency, latency_jitter=latency_jitter, rate_limit=1000000,
+                        error_rates={429: error_rate_429, 502: error_rate_502}, retry_after=0.01, seed=seed)
+    names = populate(server.fake, 1010, zones, records)
+    record_ids = {name: [record['id'] for record in server.fake.records(1010, name)] for name in names}
+    pages = -(-(records + 5) // 100)
+
+    client = Client(access_token='fake', base_url=server.url, pool_maxsize=workers,
+                    retry=RetryPolicy(max_attempts=5, backoff_factor=0.01, max_retry_after=1))
+    workload = [
+        lambda rng: client.zones.get_zone(1010, rng.choice(names)),
+        lambda rng: client.zones.list_records(1010, rng.choice(names), page=rng.randint(1, pages), per_page=100),
+        lambda rng: (lambda name: client.zones.get_record(1010, name, rng.choice(record_ids[name])))(
+            rng.choice(names)),
+    ]
+    latencies = []
+    errors = Counter()
+    lock = threading.Lock()
+
+    def call(index):
+        rng = random.Random(seed * 1000003 + index)
+        operation = workload[index % len(workload)]
+        start = time.perf_counter()
+        try:
+            operation(rng)
+            error = None
+        except DNSimpleException as exception:
+            error = exception.status
+        except Exception as exception:
+            error = type(exception).__name__
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if error is not None:
+                errors[error] += 1
+
+    with server:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(call, range(calls)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print('{calls} calls, {workers} workers, {zones} zones of {records} records, latency {latency}+{jitter}s, '
+          '429 {e429:.0%}, 502 {e502:.0%}'.format(calls=calls, workers=workers, zones=zones, records=records,
+                                                 latency=latency, jitter=latency_jitter, e429=error_rate_429,
+                                                 e502=error_rate_502))
+    print('  throughput        {rate:10.1f} calls/s'.format(rate=calls / elapsed))
+    for label, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0)):
+        print('  {label} latency       {ms:10.3f} ms'.format(label=label, ms=percentile(latencies, fraction) * 1000))
+    print('  server requests   {count:10d}'.format(count=server.stats.requests))
+    print('  retries           {count:10d} {reasons}'.format(count=client.retry.metrics.retries,
+                                                           reasons=dict(client.retry.metrics.reasons)))
+    print('  failed calls      {count:10d} {errors}'.format(count=sum(errors.values()), errors=dict(errors)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test of the client against the local mock server')
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--zones', type=int, default=10)
+    parser.add_argument('--records', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--latency-jitter', type=float, default=0.005)
+    parser.add_argument('--error-rate-429', type=float, default=0.01)
+    parser.add_argument('--error-rate-502', type=float, default=0.01)
+    parser.add_argument('--seed', type=int, default=1)
+    options = parser.parse_args(argv)
+    run(**vars(options))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Compares ZoneRecordIndex lookups with linear scans of a list of records.
+
+    python -m benchmarks.record_index
+"""
+from dnsimple.record_index import ZoneRecordIndex
+from dnsimple.struct import ZoneRecord
+from benchmarks.support import measure, report, zone_records_payload
+
+
+def run(count=100000, lookups=1000):
+    records = [ZoneRecord(data) for data in zone_records_payload(count)['data']]
+    index = ZoneRecordIndex(records)
+    targets = records[::count // lookups]
+
+    def scan_by_name():
+        for target in targets:
+            [record for record in records
+             if record.zone_id == target.zone_id and record.name == target.name and record.type == target.type]
+
+    def scan_by_content():
+        for target in targets:
+            [record for record in records if record.content == target.content]
+
+    def index_by_name():
+        for target in targets:
+            index.find(target.zone_id, target.name, target.type)
+
+    def index_by_content():
+        for target in targets:
+            index.with_content(target.content)
+
+    def upsert():
+        for target in targets:
+            index.upsert(target)
+
+    report('{lookups} lookups among {count} records'.format(lookups=lookups, count=count), [
+        ('linear scan by (zone, name, type)', measure(scan_by_name, number=1, repeat=3)),
+        ('linear scan by content', measure(scan_by_content, number=1, repeat=3)),
+        ('index by (zone, name, type)', measure(index_by_name)),
+        ('index by content', measure(index_by_content)),
+        ('index upsert', measure(upsert)),
+        ('index build', measure(lambda: ZoneRecordIndex(records), number=1, repeat=3)),
+    ])
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,43 @@
+"""
+Compares building the requests sent by Client through Request.prepare() and through the precomputed fast path.
+
+    python -m benchmarks.request_building
+"""
+from urllib.parse import urljoin
+
+from requests import Request
+
+from dnsimple import Client
+from dnsimple.struct import ZoneRecordInput
+from dnsimple.extra import prepare_params
+from benchmarks.support import measure, report
+
+
+def build_with_request_prepare(client, method, path, params=None, data=None):
+    """What Client did before: a fresh Request, versioned() through urljoin and the auth hook on every call"""
+    url = '{url}/{path}'.format(url=urljoin(client.base_url, client.api_version), path=path.replace('/', '', 1))
+    return Request(method=method, url=url, headers=client.headers, auth=client.auth, params=params,
+                   data=data).prepare()
+
+
+def run(number=10000):
+    client = Client(access_token='SomeMagicToken', sandbox=True)
+    list_params = prepare_params('name:asc', {'type': 'A'}, {'page': 3, 'per_page': 100})
+    record = ZoneRecordInput('www', 'A', '127.0.0.1', ttl=3600).to_json()
+
+    cases = [
+        ('GET list_records', 'GET', '/1010/zones/example.com/records', list_params, None),
+        ('POST create_record', 'POST', '/1010/zones/example.com/records', None, record),
+        ('DELETE delete_record', 'DELETE', '/1010/zones/example.com/records/1', None, None),
+    ]
+    results = []
+    for label, method, path, params, data in cases:
+        results.append(('{label}: Request.prepare()'.format(label=label),
+                        measure(lambda: build_with_request_prepare(client, method, path, params, data), number=number)))
+        results.append(('{label}: Client.prepare_request()'.format(label=label),
+                        measure(lambda: client.prepare_request(method, path, params, data), number=number)))
+    report('Request construction, per request', results)
+
+
+if __name__ == '__main__':
+    run()
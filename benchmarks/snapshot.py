@@ -0,0 +1,67 @@
+"""
+Compares snapshot files with pickled ZoneRecord lists: file size, write time, open time and full read time.
+
+    python -m benchmarks.snapshot
+"""
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+from dnsimple.snapshot import Snapshot, SnapshotWriter
+from dnsimple.struct import ZoneRecord
+from benchmarks.support import zone_records_payload
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def write_snapshot(path, zones):
+    with SnapshotWriter(path) as writer:
+        for zone, records in zones.items():
+            writer.add_zone(zone, records)
+
+
+def write_pickle(path, zones):
+    with open(path, 'wb') as f:
+        pickle.dump(zones, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_pickle(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def run(zone_count=20, records_per_zone=10000):
+    zones = {'zone{index}.com'.format(index=index): [ZoneRecord(data) for data in zone_records_payload(
+        records_per_zone, zone='zone{index}.com'.format(index=index))['data']] for index in range(zone_count)}
+    directory = tempfile.mkdtemp()
+    snapshot_path = os.path.join(directory, 'account.snapshot')
+    pickle_path = os.path.join(directory, 'account.pickle')
+
+    try:
+        _, pickle_write = timed(lambda: write_pickle(pickle_path, zones))
+        _, pickle_read = timed(lambda: read_pickle(pickle_path))
+        _, snapshot_write = timed(lambda: write_snapshot(snapshot_path, zones))
+        snapshot, snapshot_open = timed(lambda: Snapshot(snapshot_path))
+        _, snapshot_zone = timed(lambda: list(snapshot.records('zone7.com')))
+        _, snapshot_read = timed(lambda: list(snapshot.records()))
+        snapshot.close()
+
+        print('{count} records in {zones} zones'.format(count=zone_count * records_per_zone, zones=zone_count))
+        print('  {label:30} {size:8.1f} MB'.format(label='pickle size', size=os.path.getsize(pickle_path) / 1e6))
+        print('  {label:30} {size:8.1f} MB'.format(label='snapshot size', size=os.path.getsize(snapshot_path) / 1e6))
+        for label, seconds in [('pickle write', pickle_write), ('pickle load', pickle_read),
+                               ('snapshot write', snapshot_write), ('snapshot open', snapshot_open),
+                               ('snapshot read one zone', snapshot_zone), ('snapshot read every record', snapshot_read)]:
+            print('  {label:30} {ms:8.1f} ms'.format(label=label, ms=seconds * 1000))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    run()
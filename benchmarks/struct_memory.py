@@ -0,0 +1,39 @@
+"""
+Compares the memory held by the regular structs and their compact (__slots__ based) variants.
+
+    python -m benchmarks.struct_memory
+"""
+import tracemalloc
+
+from dnsimple.struct import CompactDnsAnalytics, CompactZoneRecord, DnsAnalytics, ZoneRecord
+from benchmarks.support import dns_analytics_payload, measure, zone_records_payload
+
+
+def allocated(build):
+    """Returns the number of bytes still allocated by what build() returns, and keeps it alive while measuring"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return size
+
+
+def run(count=200000):
+    records = zone_records_payload(count)['data']
+    analytics = dns_analytics_payload(count)['data']
+    rows = [dict(zip(analytics['headers'], row)) for row in analytics['rows']]
+
+    print('Memory held by {count} structs (the decoded JSON is not counted)'.format(count=count))
+    for label, cls, data in [('ZoneRecord', ZoneRecord, records), ('CompactZoneRecord', CompactZoneRecord, records),
+                             ('DnsAnalytics', DnsAnalytics, rows), ('CompactDnsAnalytics', CompactDnsAnalytics, rows)]:
+        size = allocated(lambda: [cls(item) for item in data])
+        seconds = measure(lambda: [cls(item) for item in data], number=1, repeat=3)
+        print('  {label:20} {mb:8.1f} MB {bytes:6.0f} bytes/struct {ms:8.1f} ms to build'.format(
+            label=label, mb=size / 1e6, bytes=size / count, ms=seconds * 1000))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,250 @@
+"""
+Times the hot paths of the client and compares them with the baselines stored in benchmarks/baselines.json.
+
+    python -m benchmarks.suite                  # compare with the baselines, exits with 1 on a regression
+    python -m benchmarks.suite --save           # store the current timings as the baselines
+    python -m benchmarks.suite --filter response --tolerance 0.5
+
+Timings are divided by the time of a fixed pure Python workload measured in the same run, so that baselines stored on
+one machine remain comparable on another one.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+
+from dnsimple import Client
+from dnsimple.extra import attach_attributes_to, prepare_params, return_list_of, return_list_with_headers_of
+from dnsimple.fake import FakeDNSimple
+from dnsimple.mock_server import MockServer, populate
+from dnsimple.response import Response
+from dnsimple.struct import (
+    BatchChangeZoneRecordsDeleteInput,
+    BatchChangeZoneRecordsInput,
+    BatchChangeZoneRecordsUpdateInput,
+    DnsAnalytics,
+    Zone,
+    ZoneRecord,
+    ZoneRecordInput,
+)
+from benchmarks.support import dns_analytics_payload, http_response, load_fixture, measure, zone_records_payload
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+BENCHMARKS = []
+"""(name, setup, number, repeat): setup returns the function timed"""
+
+
+def benchmark(name, number=10, repeat=20):
+    def register(setup):
+        BENCHMARKS.append((name, setup, number, repeat))
+        return setup
+    return register
+
+
+@benchmark('request_building.get_list_records', number=1000)
+def _get_list_records():
+    client = Client(access_token='SomeMagicToken', sandbox=True)
+    params = prepare_params('name:asc', {'type': 'A'}, {'page': 3, 'per_page': 100})
+    return lambda: client.prepare_request('GET', '/1010/zones/example.com/records', params=params)
+
+
+@benchmark('request_building.post_create_record', number=2000)
+def _post_create_record():
+    client = Client(access_token='SomeMagicToken', sandbox=True)
+    data = ZoneRecordInput('www', 'A', '192.0.2.1', ttl=3600).to_json()
+    return lambda: client.prepare_request('POST', '/1010/zones/example.com/records', data=data)
+
+
+@benchmark('response.get_zone', number=1000)
+def _response_get_zone():
+    _, headers, body = load_fixture('getZone/success')
+    return lambda: Response(http_response(body, headers=headers), Zone)
+
+
+@benchmark('response.list_records_100', number=50)
+def _response_list_records():
+    body = json.dumps(zone_records_payload(100))
+    return lambda: Response(http_response(body), ZoneRecord)
+
+
+@benchmark('response.dns_analytics_1000')
+def _response_dns_analytics():
+    body = json.dumps(dns_analytics_payload(1000))
+    return lambda: Response(http_response(body), DnsAnalytics)
+
+
+@benchmark('extra.return_list_of_1000')
+def _return_list_of():
+    data = zone_records_payload(1000)['data']
+    return lambda: return_list_of(ZoneRecord, data)
+
+
+@benchmark('extra.return_list_with_headers_of_1000')
+def _return_list_with_headers_of():
+    data = dns_analytics_payload(1000)['data']
+    return lambda: return_list_with_headers_of(DnsAnalytics, data['rows'], data['headers'])
+
+
+@benchmark('extra.attach_attributes_to_1000')
+def _attach_attributes_to():
+    data = zone_records_payload(1000)['data']
+
+    class Target(object):
+        pass
+
+    def attach():
+        for record in data:
+            attach_attributes_to(Target(), record)
+    return attach
+
+
+@benchmark('serialization.zone_record_input', number=3000)
+def _zone_record_input():
+    return lambda: ZoneRecordInput('www', 'A', '192.0.2.1', ttl=3600, priority=None, regions=['global']).to_json()
+
+
+@benchmark('serialization.batch_change_300')
+def _batch_change():
+    batch_change = BatchChangeZoneRecordsInput(
+        creates=[ZoneRecordInput('host{index}'.format(index=index), 'A', '192.0.2.1') for index in range(100)],
+        updates=[BatchChangeZoneRecordsUpdateInput(index + 1, content='192.0.2.2', ttl=60) for index in range(100)],
+        deletes=[BatchChangeZoneRecordsDeleteInput(index + 1000) for index in range(100)],
+    )
+    return batch_change.to_json
+
+
+@benchmark('listing.fake_transport_10000_records', number=1, repeat=10)
+def _listing_fake_transport():
+    server = FakeDNSimple()
+    populate(server, 1010, zones=1, records=10000)
+    client = Client(access_token='SomeMagicToken', transport=server)
+    return lambda: list(client.zones.iter_records(1010, 'zone0.example'))
+
+
+@benchmark('listing.mock_server_1000_records', number=1, repeat=3)
+def _listing_mock_server():
+    server = MockServer(rate_limit=1000000).start()
+    populate(server.fake, 1010, zones=1, records=1000)
+    client = Client(access_token='SomeMagicToken', base_url=server.url)
+
+    def listing():
+        list(client.zones.iter_records(1010, 'zone0.example'))
+    listing.close = server.stop
+    return listing
+
+
+def calibrate():
+    """Times a fixed pure Python workload, the unit the timings are expressed in"""
+    def workload():
+        entries = [{'id': index, 'name': 'host{index}'.format(index=index)} for index in range(2000)]
+        sorted(entries, key=lambda entry: entry['name'])
+    return measure(workload, number=10, repeat=30)
+
+
+def time_benchmark(setup, number, repeat):
+    """Times a benchmark, in seconds per call"""
+    function = setup()
+    try:
+        return measure(function, number=number, repeat=repeat)
+    finally:
+        close = getattr(function, 'close', None)
+        if close is not None:
+            close()
+
+
+def run(pattern=None):
+    """
+    Runs the benchmarks whose name contains pattern
+
+    :return: tuple
+        The calibration time, and the time per call of every benchmark by name
+    """
+    unit = calibrate()
+    timings = {}
+    for name, setup, number, repeat in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        timings[name] = time_benchmark(setup, number, repeat)
+    # the first calibration may run before the CPU frequency settles, keep the fastest of both
+    return min(unit, calibrate()), timings
+
+
+def compare(unit, timings, baselines, tolerance, confirm):
+    """
+    Prints the timings next to their baselines
+
+    A benchmark slower than its baseline by more than tolerance is timed again up to confirm times, together with a new
+    calibration, keeping its best result, so that a burst of noise on the machine is not reported as a regression.
+
+    :return: tuple
+        The results to store as baselines, and the names of the benchmarks slower than their baseline
+    """
+    results = {}
+    regressions = []
+    setups = {name: (setup, number, repeat) for name, setup, number, repeat in BENCHMARKS}
+    width = max(len(name) for name in timings)
+    for name, seconds in timings.items():
+        result = {'seconds': seconds, 'normalized': seconds / unit}
+        baseline = baselines.get(name)
+        if baseline is None:
+            status = 'new'
+        else:
+            for _ in range(confirm):
+                if result['normalized'] <= baseline['normalized'] * (1 + tolerance):
+                    break
+                again = time_benchmark(*setups[name])
+                result = min(result, {'seconds': again, 'normalized': again / calibrate()},
+                             key=lambda candidate: candidate['normalized'])
+            ratio = result['normalized'] / baseline['normalized']
+            status = '{ratio:6.2f}x'.format(ratio=ratio)
+            if ratio > 1 + tolerance:
+                status += ' REGRESSION'
+                regressions.append(name)
+        results[name] = result
+        print('  {name} {ms:12.4f} ms  {status}'.format(name=name.ljust(width), ms=result['seconds'] * 1000,
+                                                       status=status))
+    return results, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks of the hot paths of the client')
+    parser.add_argument('--save', action='store_true', help='store the timings as the baselines')
+    parser.add_argument('--filter', default=None, help='only run the benchmarks whose name contains this')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='slowdown relative to the baseline reported as a regression (default: 0.25)')
+    parser.add_argument('--confirm', type=int, default=2,
+                        help='times a regression is measured again before being reported (default: 2)')
+    parser.add_argument('--baselines', default=BASELINES_PATH)
+    options = parser.parse_args(argv)
+
+    unit, timings = run(options.filter)
+    print('Calibration {ms:.3f} ms, Python {version}'.format(ms=unit * 1000, version=platform.python_version()))
+
+    stored = {'benchmarks': {}}
+    if os.path.exists(options.baselines):
+        with open(options.baselines) as f:
+            stored = json.load(f)
+    if 'python' in stored and stored['python'].split('.')[:2] != list(platform.python_version_tuple()[:2]):
+        print('Warning: the baselines were stored with Python {version}, timings across versions are not comparable'
+              .format(version=stored['python']))
+    results, regressions = compare(unit, timings, stored['benchmarks'], options.tolerance, options.confirm)
+
+    if options.save:
+        stored['benchmarks'].update(results)
+        stored['python'] = platform.python_version()
+        with open(options.baselines, 'w') as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('Baselines saved to {path}'.format(path=options.baselines))
+        return 0
+
+    if regressions:
+        print('{count} regression(s): {names}'.format(count=len(regressions), names=', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import json
+import os
+import timeit
+
+from requests import Response as HttpResponse
+from requests.structures import CaseInsensitiveDict
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures', 'v2',
+                             'api')
+
+
+def load_fixture(fixture_name):
+    """
+    Reads one of the HTTP fixtures shipped with the test suite
+
+    :param fixture_name: str
+        The fixture name, relative to tests/fixtures/v2/api and without the .http extension
+    :return: tuple
+        The status code, the headers (dict) and the body (str)
+    """
+    with open(os.path.join(FIXTURES_PATH, '{name}.http'.format(name=fixture_name))) as f:
+        head, _, body = f.read().partition('\n\n')
+
+    lines = head.splitlines()
+    status_code = int(lines[0].split(' ')[1])
+    headers = dict(line.split(': ', 1) for line in lines[1:] if ': ' in line)
+    return status_code, headers, body.strip()
+
+
+def http_response(body, status_code=200, headers=None):
+    """
+    Builds a requests.Response without any network involved
+
+    :param body: str|bytes|dict
+        The body of the response, dicts are serialized as JSON
+    :param status_code: int
+        The HTTP status code
+    :param headers: dict
+        The HTTP headers (default: the rate limit headers sent by the DNSimple API)
+    :return: requests.Response
+    """
+    if isinstance(body, dict):
+        body = json.dumps(body)
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+
+    response = HttpResponse()
+    response.status_code = status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {
+        'Content-Type': 'application/json; charset=utf-8',
+        'X-RateLimit-Limit': '2400',
+        'X-RateLimit-Remaining': '2399',
+        'X-RateLimit-Reset': '1475662531',
+    })
+    response.encoding = 'utf-8'
+    return response
+
+
+def zone_records_payload(count, zone='example.com', per_page=None, page=1):
+    """
+    Builds a listZoneRecords payload with a synthetic set of records
+
+    :param count: int
+        The number of records in the page
+    :param zone: str
+        The zone name
+    :return: dict
+    """
+    _, _, body = load_fixture('listZoneRecords/success')
+    template = json.loads(body)['data'][1]
+    records = []
+    for index in range(count):
+        records.append({**template, 'id': index + 1, 'zone_id': zone, 'name': 'host{index}'.format(index=index),
+                        'type': 'A', 'content': '10.{a}.{b}.{c}'.format(a=index >> 16 & 255, b=index >> 8 & 255,
+                                                                       c=index & 255)})
+    per_page = per_page or count
+    return {'data': records, 'pagination': {'current_page': page, 'per_page': per_page, 'total_entries': count,
+                                            'total_pages': 1}}
+
+
+def dns_analytics_payload(count):
+    """
+    Builds a queryDnsAnalytics payload with a synthetic set of rows
+
+    :param count: int
+        The number of rows
+    :return: dict
+    """
+    rows = [['zone{index}.com'.format(index=index % 500), '2024-01-{day:02d}'.format(day=index % 28 + 1), index]
+            for index in range(count)]
+    return {'data': {'headers': ['zone_name', 'date', 'volume'], 'rows': rows},
+            'query': {'account_id': 1, 'page': 1, 'per_page': count, 'groupings': 'zone_name,date'},
+            'pagination': {'current_page': 1, 'per_page': count, 'total_entries': count, 'total_pages': 1}}
+
+
+def measure(function, number=10, repeat=5):
+    """
+    Times a function, returning the best time per call in seconds
+
+    :param function: callable
+        The function to time
+    :param number: int
+        The number of calls per sample
+    :param repeat: int
+        The number of samples
+    :return: float
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def report(title, results):
+    """
+    Prints the timings of a benchmark
+
+    :param title: str
+        The benchmark title
+    :param results: list
+        (label, seconds per call) tuples
+    """
+    print(title)
+    width = max(len(label) for label, _ in results)
+    for label, seconds in results:
+        print('  {label} {ms:10.3f} ms'.format(label=label.ljust(width), ms=seconds * 1000))
@@ -0,0 +1,45 @@
+"""
+Measures the throughput of the zone file parser on a synthetic zone file of a million lines.
+
+    python -m benchmarks.zone_file_parse
+"""
+import time
+
+from dnsimple.struct import CompactZoneRecord, ZoneRecord
+from dnsimple.zone_file_parser import parse_zone_file
+
+
+def zone_file(lines):
+    """Builds a zone file mixing the common record types, a few of them with comments or spanning several lines"""
+    parts = ['$ORIGIN example.com.\n$TTL 1h\n',
+             '@ IN SOA ns1.dnsimple.com. admin.dnsimple.com. (\n 1453132552 86400 7200 604800 300 )\n']
+    for index in range(lines - 3):
+        kind = index % 10
+        if kind < 6:
+            parts.append('host{i} 300 IN A 10.{a}.{b}.{c}\n'.format(i=index, a=index >> 16 & 255, b=index >> 8 & 255,
+                                                                   c=index & 255))
+        elif kind == 6:
+            parts.append('alias{i} IN CNAME host{i}\n'.format(i=index))
+        elif kind == 7:
+            parts.append('mail{i} IN MX 10 mx{i}.example.net.\n'.format(i=index))
+        elif kind == 8:
+            parts.append('txt{i} IN TXT "v=spf1 include:_spf.example.com ~all" ; spf\n'.format(i=index))
+        else:
+            parts.append('    IN AAAA 2001:db8::{i:x}\n'.format(i=index & 0xffff))
+    return ''.join(parts)
+
+
+def run(lines=1000000):
+    text = zone_file(lines)
+    print('Parsing a zone file of {lines} lines ({mb:.1f} MB)'.format(lines=lines, mb=len(text) / 1e6))
+    # dict measures the parser alone, without building structs
+    for cls in (dict, ZoneRecord, CompactZoneRecord):
+        started = time.perf_counter()
+        count = sum(1 for _ in parse_zone_file(text, struct=cls))
+        elapsed = time.perf_counter() - started
+        print('  {label:20} {seconds:6.2f} s {rate:10.0f} records/s'.format(label=cls.__name__, seconds=elapsed,
+                                                                           rate=count / elapsed))
+
+
+if __name__ == '__main__':
+    run()
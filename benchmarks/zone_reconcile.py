@@ -0,0 +1,40 @@
+"""
+Times the reconciliation of a 50k records zone: the diff against the desired record set and the batch change payload.
+
+    python -m benchmarks.zone_reconcile
+"""
+from dnsimple.reconciler import diff_records
+from dnsimple.struct import ZoneRecord, ZoneRecordInput
+from benchmarks.support import measure, report, zone_records_payload
+
+
+def desired_records(records, changed):
+    """Returns the desired record set: every `changed`-th record gets a new content, ttl or disappears"""
+    desired = []
+    for index, record in enumerate(records):
+        if index % changed == 0:
+            desired.append(ZoneRecordInput(record['name'], record['type'], '192.0.2.{n}'.format(n=index % 250)))
+        elif index % changed == 1:
+            desired.append(ZoneRecordInput(record['name'], record['type'], record['content'], ttl=60))
+        elif index % changed != 2:
+            desired.append(ZoneRecordInput(record['name'], record['type'], record['content']))
+    desired.extend(ZoneRecordInput('new{index}'.format(index=index), 'TXT', 'v={index}'.format(index=index))
+                   for index in range(len(records) // changed))
+    return desired
+
+
+def run(count=50000):
+    records = [ZoneRecord(record) for record in zone_records_payload(count)['data']]
+    results = []
+    for changed in (1000, 100, 10):
+        desired = desired_records(zone_records_payload(count)['data'], changed)
+        plan = diff_records(records, desired)
+        results.append(('diff, {n} changes'.format(n=len(plan)), measure(lambda: diff_records(records, desired),
+                                                                          number=1)))
+        results.append(('batch payload, {n} changes'.format(n=len(plan)),
+                        measure(lambda: plan.to_batch_change().to_json(), number=1)))
+    report('Reconciliation of a {count} records zone'.format(count=count), results)
+
+
+if __name__ == '__main__':
+    run()
@@ -1,2 +1,13 @@
-from dnsimple.exceptions import DNSimpleException
+from dnsimple.exceptions import DNSimpleException, RateLimitExceeded
 from dnsimple.client import Client
+from dnsimple.async_client import AsyncClient
+from dnsimple.rate_limiter import RateLimiter, RateLimitState
+from dnsimple.retry import RetryPolicy, RetryMetrics
+from dnsimple.reconciler import ZoneReconciler, ReconciliationPlan
+from dnsimple.batch import BatchExecutor, BatchResult, BatchChunkFailure
+from dnsimple.record_index import ZoneRecordIndex
+from dnsimple.sync import ZoneSync, SyncState, SyncResult
+from dnsimple.distribution import DistributionWaiter, DistributionResult, wait_for_distribution
+from dnsimple.bulk import RecordOperation, OperationOutcome, BulkReport
+from dnsimple.cache import ResponseCache, ConditionalCache, MemoryBackend, SQLiteBackend
+from dnsimple.single_flight import SingleFlight
@@ -0,0 +1,382 @@
+import asyncio
+import functools
+import time
+from collections import deque
+
+from requests.models import Response as HttpResponse
+from requests.structures import CaseInsensitiveDict
+
+from dnsimple.batch import DEFAULT_CHUNK_SIZE
+from dnsimple.bulk import async_bulk_apply
+from dnsimple.client import DEFAULT_TIMEOUT, Client
+from dnsimple.exceptions import RateLimitExceeded
+from dnsimple.export import async_export_all_records
+from dnsimple.extra import prepare_params
+from dnsimple.paginator import MAX_PER_PAGE
+from dnsimple.response import Response
+from dnsimple.transport import Transport
+
+
+class AsyncClient(object):
+    """
+    Asynchronous client for the DNSimple API
+
+    Exposes the same services as dnsimple.Client, but every call to the API returns an awaitable. Requests are sent
+    through an httpx.AsyncClient with connection pooling, and responses are parsed by the same dnsimple.Response and
+    structs as the synchronous client.
+
+    AsyncClient requires httpx (pip install dnsimple[async]).
+
+    async with AsyncClient(access_token='SuperSecretToken') as client:
+        whoami = (await client.identity.whoami()).data
+        records = [record async for record in client.zones.iter_records(1010, 'example.com')]
+    """
+
+    services = ('accounts', 'billing', 'certificates', 'contacts', 'dns_analytics', 'domains', 'identity', 'oauth',
+                'registrar', 'services', 'templates', 'tlds', 'vanity_name_servers', 'webhooks', 'zones')
+    """The services attached to the client"""
+
+    def __init__(self,
+                 email=None, password=None,
+                 access_token=None,
+                 base_url=None,
+                 sandbox=False,
+                 user_agent=None,
+                 json_backend=None,
+                 http_client=None,
+                 max_connections=100,
+                 max_keepalive_connections=20,
+                 timeout=DEFAULT_TIMEOUT,
+                 rate_limiter=None,
+                 retry=None,
+                 compact_structs=False,
+                 structs=None):
+        """
+        Initializes the client.
+
+        :param email: str
+            DNSimple email address for the account
+        :param password: str
+            DNSimple password for the account
+        :param access_token: str
+            Access token you got assigned during the oauth dance
+        :param base_url: str
+            A different base url you might want to use (i.e. for
+            testing on the sandbox environment)
+        :param sandbox: bool
+            Set to true if you want to point the client to the DNSimple sandbox environment
+        :param user_agent: str
+            A customized 'User-Agent' header for the calls made to the DNSimple API
+        :param json_backend: str
+            The library used to decode the JSON responses: 'orjson', 'ujson' or 'json'
+            (default: the fastest one installed)
+        :param http_client: httpx.AsyncClient
+            The HTTP client used to send the requests, when you want to share one between clients.
+            It is not closed by aclose().
+        :param max_connections: int
+            The maximum number of concurrent connections (ignored when http_client is given)
+        :param max_keepalive_connections: int
+            The maximum number of idle connections kept alive (ignored when http_client is given)
+        :param timeout: float|tuple
+            How long to wait for the server, in seconds: either one value, or a (connect timeout, read timeout)
+            tuple (default: DEFAULT_TIMEOUT, 5 seconds to connect and 30 to read). Set to None to wait forever.
+            Ignored when http_client is given.
+        :param rate_limiter: dnsimple.RateLimiter
+            Paces the requests to stay within the rate limit of the token, waiting without blocking the event loop
+        :param retry: dnsimple.RetryPolicy
+            Retries the requests failing with a 429, a 5xx or a connection error, waiting without blocking the event
+            loop
+        :param compact_structs: bool
+            Set to true to get the high volume structs (ZoneRecord, Zone, Domain, DnsAnalytics) as their __slots__
+            based variants (see dnsimple.struct.compact), which take a fraction of the memory
+        :param structs: dict
+            The structs to return in place of others (i.e. {ZoneRecord: MyZoneRecord})
+        """
+        try:
+            import httpx
+        except ImportError as error:
+            raise ImportError('AsyncClient requires httpx, install it with: pip install dnsimple[async]') from error
+
+        self.recorder = RequestRecorder(self, Client(email=email, password=password, access_token=access_token,
+                                                     base_url=base_url, sandbox=sandbox, user_agent=user_agent,
+                                                     json_backend=json_backend, compact_structs=compact_structs,
+                                                     structs=structs, transport=Transport()))
+        self.base_url = self.recorder.client.base_url
+        self.api_version = self.recorder.client.api_version
+        self.user_agent = self.recorder.client.user_agent
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+
+        self.__httpx = httpx
+        self.__owns_http_client = http_client is None
+        if http_client is None:
+            limits = httpx.Limits(max_connections=max_connections,
+                                  max_keepalive_connections=max_keepalive_connections)
+            if isinstance(timeout, tuple):
+                connect, read = timeout
+                timeout = httpx.Timeout(read, connect=connect)
+            http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        self.http_client = http_client
+
+        for name in self.services:
+            service = AsyncZones if name == 'zones' else AsyncService
+            setattr(self, name, service(getattr(self.recorder, name), self))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the connections of the HTTP client, unless it was given to the client"""
+        if self.__owns_http_client:
+            await self.http_client.aclose()
+
+    def versioned(self, path):
+        """
+        Returns the URL to the API including the version
+
+        :param path: str
+            The relative path to the API endpoint
+
+        :return: str
+            The URL to the API including the version
+        """
+        return self.recorder.client.versioned(path)
+
+    async def execute(self, record):
+        """
+        Sends a request recorded by a service and parses the response
+
+        :param record: dnsimple.async_client.RequestRecord
+            The request recorded
+
+        :return: dnsimple.Response
+            The response, parsed like the synchronous client does
+
+        :raises DNSimpleException
+            When the server responds with an error code
+        """
+        request = record.request
+        attempt = 1
+        while True:
+            try:
+                http_response = await self.__send_once(request)
+            except self.__httpx.TransportError as error:
+                connect_error = isinstance(error, (self.__httpx.ConnectError, self.__httpx.ConnectTimeout))
+                delay = None if self.retry is None else self.retry.retry_delay(request.method, attempt, error=error,
+                                                                               connect_error=connect_error)
+                if delay is None:
+                    raise
+            else:
+                delay = None if self.retry is None else self.retry.retry_delay(request.method, attempt,
+                                                                               response=http_response)
+                if delay is None:
+                    return Response(self.__to_http_response(http_response, request), record.obj)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __send_once(self, request):
+        key = self.recorder.client.rate_limit_key
+        while self.rate_limiter is not None:
+            try:
+                self.rate_limiter.acquire(key, block=False)
+                break
+            except RateLimitExceeded as error:
+                await asyncio.sleep(error.retry_after)
+
+        http_response = await self.http_client.request(request.method, request.url, headers=dict(request.headers),
+                                                       content=request.body)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(key, http_response.headers)
+        return http_response
+
+    async def iterate(self, list_method, *args, per_page=MAX_PER_PAGE, prefetch=0, parallel=None, **kwargs):
+        """
+        Yields every entry of a paginated list endpoint, page by page
+
+        The asynchronous counterpart of dnsimple.paginator.iterate: with prefetch or parallel set, up to that many
+        pages are requested concurrently once the first page tells how many pages there are, within the rate limit
+        reported by the last response. Entries are yielded in page order.
+
+        :param list_method: callable
+            The service method listing the entries (i.e. client.zones.list_records)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead of the one being consumed (default: 0, no prefetch)
+        :param parallel: int
+            The number of pages to fetch concurrently (default: None, one at a time)
+
+        :return: async generator
+            The entries of every page, in order
+        """
+        response = await self.execute(list_method(*args, page=1, per_page=per_page, **kwargs))
+        total_pages = 1 if response.pagination is None else response.pagination.total_pages
+        window = max(prefetch, parallel or 0)
+
+        for entry in response.data:
+            yield entry
+
+        if window <= 0:
+            for page in range(2, total_pages + 1):
+                response = await self.execute(list_method(*args, page=page, per_page=per_page, **kwargs))
+                for entry in response.data:
+                    yield entry
+            return
+
+        pending = deque()
+        next_page = 2
+        remaining = response.rate_limit_remaining
+
+        try:
+            while pending or next_page <= total_pages:
+                while next_page <= total_pages and len(pending) < window and (remaining > 0 or not pending):
+                    if remaining <= 0:
+                        await asyncio.sleep(max(0, response.rate_limit_reset - time.time()))
+                        remaining = response.rate_limit
+                    record = list_method(*args, page=next_page, per_page=per_page, **kwargs)
+                    pending.append(asyncio.ensure_future(self.execute(record)))
+                    next_page += 1
+                    remaining -= 1
+
+                response = await pending.popleft()
+                remaining = response.rate_limit_remaining - len(pending)
+                for entry in response.data:
+                    yield entry
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def __to_http_response(self, http_response, request):
+        response = HttpResponse()
+        response.status_code = http_response.status_code
+        response._content = http_response.content
+        response.headers = CaseInsensitiveDict(http_response.headers)
+        response.reason = http_response.reason_phrase
+        response.url = str(http_response.url)
+        response.encoding = http_response.encoding
+        response.request = request
+        response.json_loads = self.recorder.client.json_loads
+        response.structs = self.recorder.client.structs
+        return response
+
+
+class RequestRecord(object):
+    """A request built by a service bound to a RequestRecorder, not sent yet"""
+
+    request = None
+    """The request to send (requests.PreparedRequest)"""
+    obj = None
+    """The object encapsulating the data (json) expected in the response"""
+
+    def __init__(self, request, obj=None):
+        self.request = request
+        self.obj = obj
+
+
+class RequestRecorder(object):
+    """
+    Records the requests built by the services instead of sending them
+
+    Used by dnsimple.AsyncClient to reuse the synchronous services as they are: the services are bound to the
+    recorder, which builds their requests with a Client and hands them back as RequestRecord, sent later by the
+    AsyncClient. The Client only builds requests, so it is given a transport sending nothing and holds no session.
+    """
+
+    def __init__(self, async_client, client):
+        """
+        :param async_client: dnsimple.AsyncClient
+            The client sending the requests recorded
+        :param client: dnsimple.Client
+            The client building the requests, with the authentication, headers and base URL to use
+        """
+        self.async_client = async_client
+        self.client = client
+        for name in async_client.services:
+            setattr(self, name, type(getattr(client, name))(self))
+
+    @property
+    def base_url(self):
+        return self.client.base_url
+
+    def get(self, path, sort=None, filter=None, params=None, page=None, per_page=None):
+        params = {**(params or {}), **{'page': page, 'per_page': per_page}}
+        return self.client.prepare_request('GET', path, params=prepare_params(sort, filter, params))
+
+    def post(self, path, data=None):
+        return self.client.prepare_request('POST', path, data=data)
+
+    def put(self, path, data=None):
+        return self.client.prepare_request('PUT', path, data=data)
+
+    def patch(self, path, data=None):
+        return self.client.prepare_request('PATCH', path, data=data)
+
+    def delete(self, path):
+        return self.client.prepare_request('DELETE', path)
+
+    def response(self, request, obj=None):
+        return RequestRecord(request, obj)
+
+    def iterate(self, list_method, *args, **kwargs):
+        return self.async_client.iterate(list_method, *args, **kwargs)
+
+
+class AsyncService(object):
+    """
+    Exposes the methods of a service bound to a RequestRecorder as awaitables
+
+    Methods sending a request return a coroutine resolving to a dnsimple.Response, iter_* methods return async
+    generators and the other ones (i.e. oauth.authorize_url) return their result directly.
+    """
+
+    def __init__(self, service, async_client):
+        self.service = service
+        self.client = async_client
+
+    def __getattr__(self, name):
+        attribute = getattr(self.service, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            if isinstance(result, RequestRecord):
+                return self.client.execute(result)
+            return result
+
+        return call
+
+
+class AsyncZones(AsyncService):
+    """
+    Exposes the zones service bound to a RequestRecorder as awaitables
+
+    The methods sending several requests are implemented on the event loop, awaiting the other methods of the service.
+    """
+
+    async def bulk_apply(self, operations, concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Applies record operations across many zones concurrently
+
+        See dnsimple.service.Zones.bulk_apply
+
+        :return: dnsimple.BulkReport
+            The outcome of every operation, in the order of the operations
+        """
+        return await async_bulk_apply(self, operations, concurrency=concurrency, chunk_size=chunk_size)
+
+    def export_all_records(self, account_id, concurrency=4, per_page=MAX_PER_PAGE, filter=None):
+        """
+        Yields every record of every zone in the account
+
+        See dnsimple.service.Zones.export_all_records
+
+        :return: async generator
+            (dnsimple.struct.Zone, dnsimple.struct.ZoneRecord) tuples
+        """
+        return async_export_all_records(self, account_id, concurrency=concurrency, per_page=per_page, filter=filter)
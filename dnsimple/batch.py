@@ -0,0 +1,143 @@
+from dnsimple.struct import BatchChangeZoneRecordsInput, BatchChangeZoneRecordsResponse
+
+DEFAULT_CHUNK_SIZE = 100
+"""The default maximum number of operations sent in one batch change"""
+
+PHASES = ('deletes', 'updates', 'creates')
+"""The operations of a batch change, in the order they are applied"""
+
+
+class BatchChunkFailure(object):
+    """A chunk of a batch change the API did not apply"""
+
+    phase = None
+    """The operations of the chunk: 'deletes', 'updates' or 'creates'"""
+    index = None
+    """The position of the chunk in its phase, starting at 0"""
+    operations = None
+    """The operations of the chunk"""
+    error = None
+    """The exception raised by the request, None when the chunk was skipped"""
+
+    def __init__(self, phase, index, operations, error=None):
+        self.phase = phase
+        self.index = index
+        self.operations = operations
+        self.error = error
+
+    @property
+    def skipped(self):
+        """True when the chunk was not sent because an earlier phase failed"""
+        return self.error is None
+
+
+class BatchResult(object):
+    """The outcome of a batch change split in chunks by a BatchExecutor"""
+
+    response = None
+    """The responses of the chunks applied, merged in one dnsimple.struct.BatchChangeZoneRecordsResponse"""
+    failures = None
+    """The chunks not applied (BatchChunkFailure)"""
+    chunks = 0
+    """The number of chunks the batch change was split in"""
+
+    def __init__(self, response, failures, chunks):
+        self.response = response
+        self.failures = failures
+        self.chunks = chunks
+
+    @property
+    def ok(self):
+        """True when every chunk was applied"""
+        return not self.failures
+
+
+class BatchExecutor(object):
+    """
+    Applies batch changes of any size to the records of a zone
+
+    The operations are split in chunks of at most chunk_size operations, each sent with Zones.batch_change_records.
+    Deletes are applied first, then updates, then creates, so that a record replacing a deleted one (i.e. a CNAME
+    replacing an A record) never conflicts with it; the chunks of a phase are sent concurrently.
+
+    A failed chunk does not stop the other chunks of its phase, but the following phases are skipped unless
+    continue_on_failure is set. The responses of the chunks applied are merged into one result.
+
+    executor = BatchExecutor(client, chunk_size=200, max_workers=4)
+    result = executor.execute(1010, 'example.com', BatchChangeZoneRecordsInput(creates=records))
+    for failure in result.failures:
+        print(failure.phase, failure.index, failure.error)
+    """
+
+    def __init__(self, client, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=4, continue_on_failure=False):
+        """
+        :param client: dnsimple.Client
+            The client sending the batch changes
+        :param chunk_size: int
+            The maximum number of operations per request
+        :param max_workers: int
+            The maximum number of chunks sent at the same time
+        :param continue_on_failure: bool
+            Set to true to apply the following phases even when a chunk of a phase failed
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.continue_on_failure = continue_on_failure
+
+    def chunk(self, batch_change):
+        """
+        Splits a batch change in chunks, in the order they are applied
+
+        :param batch_change: dnsimple.struct.BatchChangeZoneRecordsInput
+            The batch change
+
+        :return: list
+            (phase, index, operations) tuples
+        """
+        chunks = []
+        for phase in PHASES:
+            operations = batch_change.get(phase) or []
+            for index, start in enumerate(range(0, len(operations), self.chunk_size)):
+                chunks.append((phase, index, operations[start:start + self.chunk_size]))
+        return chunks
+
+    def execute(self, account_id, zone, batch_change):
+        """
+        Applies a batch change in chunks
+
+        :param account_id: int
+            The account ID
+        :param zone: str
+            The zone name
+        :param batch_change: dnsimple.struct.BatchChangeZoneRecordsInput
+            The batch change, of any size
+
+        :return: BatchResult
+        """
+        chunks = self.chunk(batch_change)
+        merged = BatchChangeZoneRecordsResponse({phase: None for phase in PHASES})
+        for phase in PHASES:
+            setattr(merged, phase, [])
+        failures = []
+
+        for phase in PHASES:
+            phase_chunks = [chunk for chunk in chunks if chunk[0] == phase]
+            if failures and not self.continue_on_failure:
+                failures.extend(BatchChunkFailure(*chunk) for chunk in phase_chunks)
+                continue
+
+            calls = [(self.client.zones.batch_change_records, account_id, zone,
+                      BatchChangeZoneRecordsInput(**{phase: operations}))
+                     for _, _, operations in phase_chunks]
+            results = self.client.map(calls, max_workers=self.max_workers, return_exceptions=True)
+
+            for chunk, result in zip(phase_chunks, results):
+                if isinstance(result, Exception):
+                    failures.append(BatchChunkFailure(*chunk, error=result))
+                    continue
+                getattr(merged, phase).extend(getattr(result.data, phase) or [])
+
+        return BatchResult(merged, failures, len(chunks))
@@ -0,0 +1,247 @@
+import asyncio
+
+from dnsimple.batch import DEFAULT_CHUNK_SIZE
+from dnsimple.struct import (
+    BatchChangeZoneRecordsDeleteInput,
+    BatchChangeZoneRecordsInput,
+    BatchChangeZoneRecordsUpdateInput,
+)
+
+
+class RecordOperation(object):
+    """
+    A change to one record of a zone, applied by Zones.bulk_apply
+
+    operations = [
+        RecordOperation.create(1010, 'example.com', ZoneRecordInput('www', 'A', '192.0.2.1')),
+        RecordOperation.update(1010, 'example.org', 5, ZoneRecordUpdateInput(content='192.0.2.2')),
+        RecordOperation.delete(1010, 'example.net', 6),
+    ]
+    """
+
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+    def __init__(self, action, account_id, zone, record_id=None, record=None):
+        """
+        :param action: str
+            'create', 'update' or 'delete'
+        :param account_id: int
+            The account ID
+        :param zone: str
+            The zone name
+        :param record_id: int
+            The record ID, for updates and deletes
+        :param record: dnsimple.struct.ZoneRecordInput|dnsimple.struct.ZoneRecordUpdateInput
+            The record data, for creates and updates
+        """
+        if action not in (self.CREATE, self.UPDATE, self.DELETE):
+            raise ValueError('Unknown action {action}'.format(action=action))
+        self.action = action
+        self.account_id = account_id
+        self.zone = zone
+        self.record_id = record_id
+        self.record = record
+
+    @classmethod
+    def create(cls, account_id, zone, record):
+        """
+        :param record: dnsimple.struct.ZoneRecordInput
+        :return: RecordOperation
+        """
+        return cls(cls.CREATE, account_id, zone, record=record)
+
+    @classmethod
+    def update(cls, account_id, zone, record_id, record):
+        """
+        :param record: dnsimple.struct.ZoneRecordUpdateInput
+        :return: RecordOperation
+        """
+        return cls(cls.UPDATE, account_id, zone, record_id=record_id, record=record)
+
+    @classmethod
+    def delete(cls, account_id, zone, record_id):
+        """
+        :return: RecordOperation
+        """
+        return cls(cls.DELETE, account_id, zone, record_id=record_id)
+
+
+class OperationOutcome(object):
+    """The outcome of a RecordOperation"""
+
+    operation = None
+    """The RecordOperation"""
+    record = None
+    """The record created or updated (dnsimple.struct.ZoneRecord), None for deletes and failures"""
+    error = None
+    """The exception raised, None when the operation succeeded"""
+    batched = False
+    """True when the operation was applied in a batch change with other operations of its zone"""
+
+    def __init__(self, operation, record=None, error=None, batched=False):
+        self.operation = operation
+        self.record = record
+        self.error = error
+        self.batched = batched
+
+    @property
+    def ok(self):
+        """True when the operation succeeded"""
+        return self.error is None
+
+
+class BulkReport(object):
+    """The outcomes of the operations of a Zones.bulk_apply, in the order of the operations"""
+
+    outcomes = None
+    """The OperationOutcome of every operation"""
+    requests = 0
+    """The number of requests sent"""
+
+    def __init__(self, outcomes, requests):
+        self.outcomes = outcomes
+        self.requests = requests
+
+    def __iter__(self):
+        return iter(self.outcomes)
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    @property
+    def ok(self):
+        """True when every operation succeeded"""
+        return all(outcome.ok for outcome in self.outcomes)
+
+    @property
+    def succeeded(self):
+        """The outcomes of the operations that succeeded"""
+        return [outcome for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed(self):
+        """The outcomes of the operations that failed"""
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+
+def bulk_apply(zones, operations, concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Applies record operations across zones concurrently
+
+    See dnsimple.service.Zones.bulk_apply
+    """
+    operations = list(operations)
+    jobs = _jobs(operations, chunk_size)
+
+    def run(positions):
+        if len(positions) == 1:
+            return _apply_one(zones, operations[positions[0]])
+        return _apply_batch(zones, [operations[position] for position in positions])
+
+    results = zones.client.map([(run, positions) for positions in jobs], max_workers=concurrency,
+                               return_exceptions=True)
+    return _report(operations, jobs, results)
+
+
+async def async_bulk_apply(zones, operations, concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Applies record operations across zones concurrently, on the event loop of a dnsimple.AsyncClient
+
+    See dnsimple.service.Zones.bulk_apply
+    """
+    operations = list(operations)
+    jobs = _jobs(operations, chunk_size)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(positions):
+        async with semaphore:
+            if len(positions) == 1:
+                return await _async_apply_one(zones, operations[positions[0]])
+            return await _async_apply_batch(zones, [operations[position] for position in positions])
+
+    results = await asyncio.gather(*[run(positions) for positions in jobs], return_exceptions=True)
+    return _report(operations, jobs, results)
+
+
+def _jobs(operations, chunk_size):
+    groups = {}
+    for position, operation in enumerate(operations):
+        groups.setdefault((operation.account_id, operation.zone), []).append(position)
+
+    jobs = []
+    for positions in groups.values():
+        for start in range(0, len(positions), chunk_size):
+            jobs.append(positions[start:start + chunk_size])
+    return jobs
+
+
+def _report(operations, jobs, results):
+    outcomes = [None] * len(operations)
+    for positions, result in zip(jobs, results):
+        if isinstance(result, Exception):
+            result = [OperationOutcome(operations[position], error=result, batched=len(positions) > 1)
+                      for position in positions]
+        for position, outcome in zip(positions, result):
+            outcomes[position] = outcome
+    return BulkReport(outcomes, len(jobs))
+
+
+def _apply_one(zones, operation):
+    if operation.action == RecordOperation.CREATE:
+        record = zones.create_record(operation.account_id, operation.zone, operation.record).data
+    elif operation.action == RecordOperation.UPDATE:
+        record = zones.update_record(operation.account_id, operation.zone, operation.record_id,
+                                     operation.record).data
+    else:
+        zones.delete_record(operation.account_id, operation.zone, operation.record_id)
+        record = None
+    return [OperationOutcome(operation, record=record)]
+
+
+async def _async_apply_one(zones, operation):
+    if operation.action == RecordOperation.CREATE:
+        record = (await zones.create_record(operation.account_id, operation.zone, operation.record)).data
+    elif operation.action == RecordOperation.UPDATE:
+        record = (await zones.update_record(operation.account_id, operation.zone, operation.record_id,
+                                            operation.record)).data
+    else:
+        await zones.delete_record(operation.account_id, operation.zone, operation.record_id)
+        record = None
+    return [OperationOutcome(operation, record=record)]
+
+
+def _apply_batch(zones, operations):
+    batch_change, groups = _batch_change(operations)
+    response = zones.batch_change_records(operations[0].account_id, operations[0].zone, batch_change).data
+    return _batch_outcomes(operations, groups, response)
+
+
+async def _async_apply_batch(zones, operations):
+    batch_change, groups = _batch_change(operations)
+    response = (await zones.batch_change_records(operations[0].account_id, operations[0].zone, batch_change)).data
+    return _batch_outcomes(operations, groups, response)
+
+
+def _batch_change(operations):
+    creates = [operation for operation in operations if operation.action == RecordOperation.CREATE]
+    updates = [operation for operation in operations if operation.action == RecordOperation.UPDATE]
+    deletes = [operation for operation in operations if operation.action == RecordOperation.DELETE]
+
+    batch_change = BatchChangeZoneRecordsInput(
+        creates=[operation.record for operation in creates] or None,
+        updates=[BatchChangeZoneRecordsUpdateInput(operation.record_id, **operation.record)
+                 for operation in updates] or None,
+        deletes=[BatchChangeZoneRecordsDeleteInput(operation.record_id) for operation in deletes] or None,
+    )
+    return batch_change, (creates, updates)
+
+
+def _batch_outcomes(operations, groups, response):
+    creates, updates = groups
+    records = {}
+    for group, applied in ((creates, response.creates), (updates, response.updates)):
+        for operation, record in zip(group, applied or []):
+            records[id(operation)] = record
+    return [OperationOutcome(operation, record=records.get(id(operation)), batched=True) for operation in operations]
@@ -0,0 +1,502 @@
+import copy
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from requests.models import Response as HttpResponse
+from requests.structures import CaseInsensitiveDict
+
+from dnsimple.json_backend import decode
+
+DEFAULT_TTLS = {
+    '/whoami': 300,
+    '/tlds': 86400,
+    '/tlds/*': 86400,
+    '/tlds/*/extended_attributes': 86400,
+    '/services': 3600,
+    '/services/*': 3600,
+    '/*/zones/*': 60,
+}
+"""The number of seconds the responses of the endpoints changing rarely are cached, by path ('*' matches one segment)"""
+
+
+class CacheEntry(object):
+    """A successful response to a GET request, as stored by a cache backend"""
+
+    path = None
+    """The path of the endpoint (i.e. /1010/zones/example.com), used to invalidate the entry"""
+    status_code = None
+    """The HTTP status code"""
+    headers = None
+    """The HTTP headers (dict)"""
+    content = None
+    """The body of the response (bytes)"""
+    url = None
+    """The URL requested"""
+    expires_at = None
+    """When the entry expires (Unix time)"""
+
+    def __init__(self, path, status_code, headers, content, url, expires_at):
+        self.path = path
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, path, http_response, expires_at):
+        """
+        :param path: str
+            The path of the endpoint
+        :param http_response: requests.Response
+            The response to store
+        :param expires_at: float
+            When the entry expires (Unix time)
+        :return: CacheEntry
+        """
+        return cls(path, http_response.status_code, dict(http_response.headers), http_response.content,
+                   http_response.url, expires_at)
+
+    def expired(self, now):
+        return now >= self.expires_at
+
+    def to_http_response(self, request):
+        """
+        Builds a fresh HTTP response from the entry, as if it was sent by the server
+
+        :param request: requests.PreparedRequest
+            The request the response answers
+        :return: requests.Response
+        """
+        response = HttpResponse()
+        response.status_code = self.status_code
+        response._content = self.content
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response.encoding = 'utf-8'
+        response.reason = 'OK'
+        response.request = request
+        response.from_cache = True
+        return response
+
+
+class MemoryBackend(object):
+    """Keeps the cache entries in the memory of the process, evicting the least recently used ones"""
+
+    def __init__(self, max_entries=1024):
+        """
+        :param max_entries: int
+            The maximum number of entries kept
+        """
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, paths, prefix):
+        """
+        Removes the entries of the given paths and of the paths starting with prefix
+
+        :param paths: set
+        :param prefix: str
+        :return: int
+            The number of entries removed
+        """
+        with self.__lock:
+            keys = [key for key, entry in self.__entries.items()
+                    if entry.path in paths or entry.path.startswith(prefix)]
+            for key in keys:
+                del self.__entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+class SQLiteBackend(object):
+    """
+    Keeps the cache entries in a SQLite database, so that they survive the process and are shared between processes,
+    evicting the least recently used ones
+    """
+
+    def __init__(self, path, max_entries=10000):
+        """
+        :param path: str
+            The database file (created when missing)
+        :param max_entries: int
+            The maximum number of entries kept
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, path TEXT NOT NULL, status_code INTEGER, '
+            'headers TEXT, content BLOB, url TEXT, expires_at REAL, accessed_at REAL)')
+        self.__connection.execute('CREATE INDEX IF NOT EXISTS responses_path ON responses (path)')
+        self.__connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+    def __len__(self):
+        with self.__lock:
+            return self.__connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, key):
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT path, status_code, headers, content, url, expires_at FROM responses WHERE key = ?',
+                (key,)).fetchone()
+            if row is None:
+                return None
+            self.__connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        path, status_code, headers, content, url, expires_at = row
+        return CacheEntry(path, status_code, json.loads(headers), bytes(content), url, expires_at)
+
+    def set(self, key, entry):
+        with self.__lock:
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, entry.path, entry.status_code, json.dumps(entry.headers), entry.content, entry.url,
+                 entry.expires_at, time.time()))
+            excess = self.__connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.__connection.execute(
+                    'DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)',
+                    (excess,))
+
+    def invalidate(self, paths, prefix):
+        """
+        Removes the entries of the given paths and of the paths starting with prefix
+
+        :param paths: set
+        :param prefix: str
+        :return: int
+            The number of entries removed
+        """
+        paths = list(paths)
+        query = 'DELETE FROM responses WHERE substr(path, 1, ?) = ?'
+        if paths:
+            query += ' OR path IN ({placeholders})'.format(placeholders=', '.join('?' * len(paths)))
+        with self.__lock:
+            return self.__connection.execute(query, [len(prefix), prefix] + paths).rowcount
+
+    def clear(self):
+        with self.__lock:
+            self.__connection.execute('DELETE FROM responses')
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+
+class CacheMetrics(object):
+    """Counters of the requests served by a ResponseCache"""
+
+    hits = 0
+    """The number of GET requests answered from the cache"""
+    misses = 0
+    """The number of cacheable GET requests sent to the server"""
+    invalidations = 0
+    """The number of entries removed because a write touched their path"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+
+    def record_hit(self):
+        with self.__lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self.__lock:
+            self.misses += 1
+
+    def record_invalidations(self, count):
+        with self.__lock:
+            self.invalidations += count
+
+
+class ResponseCache(object):
+    """
+    Read-through cache of the responses to the GET requests of a Client
+
+    Responses are keyed on the method, URL (path and query params) and credentials of the request, and kept as long as
+    the TTL of their endpoint. Only the endpoints with a TTL are cached (by default the ones changing rarely, see
+    DEFAULT_TTLS). A POST, PUT, PATCH or DELETE sent through the client removes the cached responses of its path, of
+    the paths above it and of the paths below its parent, i.e. creating a record of example.com invalidates the zone
+    and its records.
+
+    cache = ResponseCache(ttls={**DEFAULT_TTLS, '/*/domains': 600}, backend=SQLiteBackend('dnsimple-cache.db'))
+    client = Client(access_token='SuperSecretToken', cache=cache)
+    client.tlds.list_tlds()
+    client.cache.metrics.hits
+    """
+
+    def __init__(self, backend=None, ttls=None, default_ttl=0, clock=time.time):
+        """
+        :param backend: MemoryBackend|SQLiteBackend
+            Where the responses are stored (default: a MemoryBackend)
+        :param ttls: dict
+            The number of seconds the responses are cached, by path pattern where '*' matches one segment
+            (default: DEFAULT_TTLS)
+        :param default_ttl: float
+            The number of seconds the responses of the other endpoints are cached (default: 0, not cached)
+        :param clock: callable
+            Returns the current Unix time
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.metrics = CacheMetrics()
+        self.__patterns = [(re.compile('^{pattern}$'.format(pattern='/'.join(
+            '[^/]+' if segment == '*' else re.escape(segment) for segment in pattern.split('/')))), ttl)
+            for pattern, ttl in self.ttls.items() if '*' in pattern]
+
+    def ttl(self, path):
+        """
+        Returns the number of seconds the responses of an endpoint are cached
+
+        :param path: str
+            The path of the endpoint (i.e. /tlds/com)
+        :return: float
+        """
+        path = _normalize(path)
+        ttl = self.ttls.get(path)
+        if ttl is not None:
+            return ttl
+        for pattern, ttl in self.__patterns:
+            if pattern.match(path):
+                return ttl
+        return self.default_ttl
+
+    def fetch(self, client, path, request):
+        """
+        Returns the cached response to a GET request, or sends it and caches the response
+
+        :param client: dnsimple.Client
+            The client sending the request
+        :param path: str
+            The path of the endpoint
+        :param request: requests.PreparedRequest
+            The GET request
+        :return: requests.Response
+        """
+        path = _normalize(path)
+        ttl = self.ttl(path)
+        if ttl is None or ttl <= 0:
+            return client._fetch(request)
+
+        key = request_key(request)
+        entry = self.backend.get(key)
+        if entry is not None and not entry.expired(self.clock()):
+            self.metrics.record_hit()
+            response = entry.to_http_response(request)
+            response.json_loads = client.json_loads
+            response.structs = client.structs
+            return response
+
+        self.metrics.record_miss()
+        response = client._fetch(request)
+        if response.status_code == 200:
+            self.backend.set(key, CacheEntry.from_response(path, response, self.clock() + ttl))
+        return response
+
+    def invalidate(self, path):
+        """
+        Removes the cached responses a write to path may have changed: the ones of the path, of the paths above it and
+        of every path below its parent
+
+        :param path: str
+            The path written to (i.e. /1010/zones/example.com/records/5)
+        :return: int
+            The number of entries removed
+        """
+        segments = _normalize(path).split('/')
+        paths = {'/'.join(segments[:end]) for end in range(2, len(segments) + 1)}
+        parent = '/'.join(segments[:-1]) if len(segments) > 2 else '/'.join(segments)
+        count = self.backend.invalidate(paths, parent + '/')
+        self.metrics.record_invalidations(count)
+        return count
+
+    def clear(self):
+        """Removes every cached response"""
+        self.backend.clear()
+
+
+class ConditionalMetrics(object):
+    """Counters of the conditional requests sent by a ConditionalCache"""
+
+    requests = 0
+    """The number of GET requests sent with a validator (If-None-Match, If-Modified-Since)"""
+    not_modified = 0
+    """The number of 304 Not Modified responses, answered with the stored payload"""
+    bytes_saved = 0
+    """The number of body bytes the 304 responses did not transfer"""
+    parse_time_saved = 0.0
+    """The number of seconds the 304 responses did not spend decoding JSON"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+
+    def record_request(self):
+        with self.__lock:
+            self.requests += 1
+
+    def record_not_modified(self, size, parse_time):
+        with self.__lock:
+            self.not_modified += 1
+            self.bytes_saved += size
+            self.parse_time_saved += parse_time
+
+
+class _Validated(object):
+    __slots__ = ('etag', 'last_modified', 'status_code', 'headers', 'content', 'url', 'payload', 'parse_time')
+
+    def __init__(self, http_response, payload, parse_time):
+        self.etag = http_response.headers.get('ETag')
+        self.last_modified = http_response.headers.get('Last-Modified')
+        self.status_code = http_response.status_code
+        self.headers = dict(http_response.headers)
+        self.content = http_response.content
+        self.url = http_response.url
+        self.payload = payload
+        self.parse_time = parse_time
+
+
+class ConditionalCache(object):
+    """
+    Revalidates the GET requests of a Client with the validators of their last response
+
+    The last response of every URL carrying an ETag or a Last-Modified header is kept with its decoded payload. The
+    next GET of the URL is sent with If-None-Match/If-Modified-Since, and when the server answers 304 Not Modified the
+    stored body and decoded payload are reused: nothing is transferred nor decoded again. The rate limit headers are
+    the ones of the 304 response.
+
+    Every response built from a kept payload gets its own deep copy of it, so that changing the structs of one response
+    never changes the structs of another.
+
+    client = Client(access_token='SuperSecretToken', conditional_cache=ConditionalCache())
+    client.zones.get_zone(1010, 'example.com')
+    client.zones.get_zone(1010, 'example.com')  # 304 Not Modified
+    client.conditional_cache.metrics.bytes_saved
+    """
+
+    def __init__(self, max_entries=1024):
+        """
+        :param max_entries: int
+            The maximum number of URLs whose last response is kept, the least recently used ones being evicted
+        """
+        self.max_entries = max_entries
+        self.metrics = ConditionalMetrics()
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def fetch(self, client, request):
+        """
+        Sends a GET request, conditional when a response to the same request was kept
+
+        :param client: dnsimple.Client
+            The client sending the request
+        :param request: requests.PreparedRequest
+            The GET request
+        :return: requests.Response
+        """
+        key = request_key(request)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+
+        if entry is not None:
+            if entry.etag is not None:
+                request.headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                request.headers['If-Modified-Since'] = entry.last_modified
+            self.metrics.record_request()
+
+        response = client._send(request)
+        if response.status_code == 304 and entry is not None:
+            self.metrics.record_not_modified(len(entry.content), entry.parse_time)
+            return self.__from_entry(entry, response, request)
+
+        if response.status_code == 200 and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            start = time.perf_counter()
+            payload = decode(response)
+            parse_time = time.perf_counter() - start
+            # the entry keeps its own copy, the caller may change the structs built from the payload of the response
+            entry = _Validated(response, copy.deepcopy(payload), parse_time)
+            with self.__lock:
+                self.__entries[key] = entry
+                self.__entries.move_to_end(key)
+                while len(self.__entries) > self.max_entries:
+                    self.__entries.popitem(last=False)
+        elif entry is not None and response.status_code < 500:
+            with self.__lock:
+                self.__entries.pop(key, None)
+        return response
+
+    def clear(self):
+        """Forgets every response kept"""
+        with self.__lock:
+            self.__entries.clear()
+
+    @staticmethod
+    def __from_entry(entry, not_modified, request):
+        response = HttpResponse()
+        response.status_code = entry.status_code
+        response._content = entry.content
+        response.headers = CaseInsensitiveDict(entry.headers)
+        for name, value in not_modified.headers.items():
+            if not name.lower().startswith('content-'):
+                response.headers[name] = value
+        response.url = entry.url
+        response.encoding = 'utf-8'
+        response.reason = 'OK'
+        response.request = request
+        response.json_loads = not_modified.json_loads
+        response.structs = not_modified.structs
+        response.dnsimple_json = copy.deepcopy(entry.payload)
+        response.not_modified = True
+        return response
+
+
+def request_key(request):
+    """
+    Returns the key of a request: its method, URL and a fingerprint of its credentials, so that clients with different
+    tokens sharing a cache never see each other's responses
+
+    :param request: requests.PreparedRequest
+    :return: str
+    """
+    authorization = request.headers.get('Authorization') or ''
+    fingerprint = hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16]
+    return '{fingerprint} {method} {url}'.format(fingerprint=fingerprint, method=request.method, url=request.url)
+
+
+def _normalize(path):
+    return '/' + path.split('?', 1)[0].strip('/')
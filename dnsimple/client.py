@@ -1,14 +1,30 @@
-from urllib.parse import urljoin
-
-from requests import Request, Session
-from requests.auth import HTTPBasicAuth
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urljoin
+
+from requests import PreparedRequest, Request, Session
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth, _basic_auth_str
+from requests.exceptions import ConnectionError, ConnectTimeout, RequestException
+from requests.structures import CaseInsensitiveDict
+from requests.utils import requote_uri
+from urllib3.exceptions import NewConnectionError
 
 from dnsimple.extra import prepare_params
+from dnsimple.json_backend import load_json_backend
+from dnsimple.paginator import iterate
+from dnsimple.rate_limiter import credential_key
+from dnsimple.response import Response
+from dnsimple.struct import COMPACT_STRUCTS
 from dnsimple.service import Accounts, Billing, Domains, DnsAnalytics, Identity, Oauth, Zones, Registrar, Certificates, Tlds, Contacts, \
     Services, Templates, VanityNameServers, Webhooks
 from dnsimple.token_authentication import TokenAuthentication
+from dnsimple.transport import SessionTransport
 from dnsimple.version import version
 
+DEFAULT_TIMEOUT = (5, 30)
+"""The (connect timeout, read timeout) of the requests, in seconds, when the client is not given one"""
+
 
 class Client(object):
     """
@@ -46,7 +62,22 @@ class Client(object):
                  access_token=None,
                  base_url=None,
                  sandbox=False,
-                 user_agent=None):
+                 user_agent=None,
+                 json_backend=None,
+                 rate_limiter=None,
+                 retry=None,
+                 session=None,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 pool_block=False,
+                 timeout=DEFAULT_TIMEOUT,
+                 keep_alive=True,
+                 compact_structs=False,
+                 structs=None,
+                 cache=None,
+                 conditional_cache=None,
+                 single_flight=None,
+                 transport=None):
         """
         Initializes the service.
 
@@ -67,13 +98,70 @@ class Client(object):
             Set to true if you want to point the client to the DNSimple sandbox environment
         :param user_agent: str
             A customized 'User-Agent' header for the calls made to the DNSimple API
+        :param json_backend: str
+            The library used to decode the JSON responses: 'orjson', 'ujson' or 'json'
+            (default: the fastest one installed)
+        :param rate_limiter: dnsimple.RateLimiter
+            Paces the requests to stay within the rate limit of the token (see dnsimple.RateLimiter)
+        :param retry: dnsimple.RetryPolicy
+            Retries the requests failing with a 429, a 5xx or a connection error (see dnsimple.RetryPolicy)
+        :param session: requests.Session
+            The HTTP session used to send the requests, when you want several clients to share one connection
+            pool. The pool options are ignored: the session is used as it is configured.
+        :param pool_connections: int
+            The number of connection pools (one per host) to cache
+        :param pool_maxsize: int
+            The maximum number of connections kept open per host. Raise it to the number of threads sharing the client
+            to avoid discarding connections.
+        :param pool_block: bool
+            Set to true to wait for a free connection when all of them are in use instead of opening an extra one
+        :param timeout: float|tuple
+            How long to wait for the server, in seconds: either one value, or a (connect timeout, read timeout)
+            tuple (default: DEFAULT_TIMEOUT, 5 seconds to connect and 30 to read). Set to None to wait forever.
+        :param keep_alive: bool
+            Set to false to close the connection after every request
+        :param compact_structs: bool
+            Set to true to get the high volume structs (ZoneRecord, Zone, Domain, DnsAnalytics) as their __slots__
+            based variants (see dnsimple.struct.compact), which take a fraction of the memory
+        :param structs: dict
+            The structs to return in place of others (i.e. {ZoneRecord: MyZoneRecord})
+        :param cache: dnsimple.ResponseCache
+            Caches the responses to the GET requests of the endpoints changing rarely, invalidated by the writes sent
+            through the client (see dnsimple.ResponseCache)
+        :param conditional_cache: dnsimple.ConditionalCache
+            Sends the GET requests with the validators (ETag, Last-Modified) of their last response, and reuses its
+            decoded payload when the server answers 304 Not Modified (see dnsimple.ConditionalCache)
+        :param single_flight: dnsimple.SingleFlight
+            Sends identical GET requests issued at the same time by several threads once, sharing the response
+            (see dnsimple.SingleFlight)
+        :param transport: dnsimple.transport.Transport
+            Sends the requests in place of the HTTP session (i.e. dnsimple.fake.FakeDNSimple to run offline). No
+            session is built when a transport is given without one.
         """
         self._default_user_agent = self.__user_agent.format(version=version)
         self.user_agent = self._default_user_agent
 
         self.base_url = self.__base_url
         self.api_version = self.__api_version
-        self.session = Session()
+        if session is None and transport is None:
+            session = self.__build_session(pool_connections, pool_maxsize, pool_block)
+        self.session = session
+        self.transport = transport if transport is not None else SessionTransport(session)
+        self.timeout = timeout
+        self.__versioned_base_url = (None, None)
+        self.__cached_headers = (None, None, None)
+        self.json_backend = json_backend
+        self.json_loads = load_json_backend(json_backend)
+        self.rate_limiter = rate_limiter
+        self.rate_limit_key = credential_key(access_token or email)
+        self.retry = retry
+        self.structs = {**(COMPACT_STRUCTS if compact_structs else {}), **(structs or {})}
+        self.cache = cache
+        self.conditional_cache = conditional_cache
+        self.single_flight = single_flight
+        # The DistributionWaiter shared by the dnsimple.wait_for_distribution calls on this client, by their options
+        self.distribution_waiters = {}
+        self.distribution_waiters_lock = threading.Lock()
         self.__attach_services()
 
         self.headers = {
@@ -81,6 +169,8 @@ class Client(object):
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
 
         if user_agent is not None:
             self.__change_user_agent(user_agent)
@@ -112,10 +202,10 @@ class Client(object):
         if params is None:
             params = {}
         params = {**params, **{'page': page, 'per_page': per_page}}
-        request = Request(method='GET', url=self.versioned(path), headers=self.headers, auth=self.auth,
-                          params=prepare_params(sort, filter, params))
-        response = self.session.send(request.prepare())
-        return response
+        request = self.prepare_request('GET', path, params=prepare_params(sort, filter, params))
+        if self.cache is None:
+            return self._fetch(request)
+        return self.cache.fetch(self, path, request)
 
     def post(self, path, data=None):
         """
@@ -128,8 +218,7 @@ class Client(object):
         :return: requests.Response
             The response object for the request sent
         """
-        request = Request(method='POST', url=self.versioned(path), headers=self.headers, auth=self.auth, data=data)
-        return self.session.send(request.prepare())
+        return self.__write(path, self.prepare_request('POST', path, data=data))
 
     def put(self, path, data=None):
         """
@@ -142,8 +231,7 @@ class Client(object):
         :return: requests.Response
             The response object for the request sent
         """
-        request = Request(method='PUT', url=self.versioned(path), headers=self.headers, auth=self.auth, data=data)
-        return self.session.send(request.prepare())
+        return self.__write(path, self.prepare_request('PUT', path, data=data))
 
     def patch(self, path, data=None):
         """
@@ -156,8 +244,7 @@ class Client(object):
         :return: requests.Response
             The response object for the request sent
         """
-        request = Request(method='PATCH', url=self.versioned(path), headers=self.headers, auth=self.auth, data=data)
-        return self.session.send(request.prepare())
+        return self.__write(path, self.prepare_request('PATCH', path, data=data))
 
     def delete(self, path):
         """
@@ -168,8 +255,119 @@ class Client(object):
         :return: request.Response
             The response object for the request sent
         """
-        request = Request(method='DELETE', url=self.versioned(path), headers=self.headers, auth=self.auth).prepare()
-        return self.session.send(request)
+        return self.__write(path, self.prepare_request('DELETE', path))
+
+    def response(self, http_response, obj=None):
+        """
+        Wraps the response to a request sent by a service
+
+        :param http_response: requests.Response
+            The raw response from the server
+        :param obj: object
+            An object encapsulating the data (json) in the response
+
+        :return: dnsimple.Response
+
+        :raises DNSimpleException
+            When the server responds with an error code
+        """
+        return Response(http_response, obj)
+
+    def prepare_request(self, method, path, params=None, data=None):
+        """
+        Builds a request to the DNSimple API, ready to be sent
+
+        :param method: str
+            The HTTP method
+        :param path: str
+            Relative path to the service endpoint
+        :param params: dict
+            Query params that will be added to the request
+        :param data: dict|str
+            The data payload to send to the endpoint
+
+        :return: requests.PreparedRequest
+            The request, with the headers and authentication of the client
+        """
+        headers = self.__request_headers()
+        if headers is None or not (data is None or isinstance(data, (str, bytes))):
+            request = Request(method=method, url=self.versioned(path), headers=self.headers, auth=self.auth,
+                              params=params, data=data)
+            return request.prepare()
+
+        # Fast path for the requests the services build: the versioned base URL and the headers, authentication
+        # included, are computed once per client instead of going through Request.prepare() on every call.
+        url = self.versioned(path)
+        if params:
+            query = urlencode([(key, value) for key, value in params.items() if value is not None], doseq=True)
+            if query:
+                url = '{url}?{query}'.format(url=url, query=query)
+
+        request = PreparedRequest()
+        request.method = method
+        request.url = requote_uri(url)
+        request.headers = CaseInsensitiveDict(headers)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        # an empty body is not sent, but is announced with a Content-Length of 0 like Request.prepare() does
+        request.body = data or None
+        if data:
+            request.headers['Content-Length'] = str(len(data))
+        elif method not in ('GET', 'HEAD'):
+            request.headers['Content-Length'] = '0'
+        return request
+
+    def iterate(self, list_method, *args, **kwargs):
+        """
+        Yields every entry of a paginated list endpoint, page by page
+
+        See dnsimple.paginator.iterate
+
+        :param list_method: callable
+            The service method listing the entries (i.e. client.zones.list_records)
+
+        :return: generator
+            The entries of every page, in order
+        """
+        return iterate(list_method, *args, **kwargs)
+
+    def map(self, calls, max_workers=None, return_exceptions=False):
+        """
+        Runs several calls against the DNSimple API concurrently
+
+        Every call is executed on a thread pool sharing this client (and its
+        HTTP session). Each call gets its own dnsimple.Response, so results
+        never leak between calls.
+
+        results = client.map([
+            lambda: client.zones.list_records(1010, 'example.com'),
+            (client.zones.list_records, 1010, 'example.org'),
+        ], max_workers=8)
+
+        :param calls: iterable
+            Callables taking no arguments, or tuples of (callable, arg1, arg2, ...)
+        :param max_workers: int
+            The maximum number of calls running at the same time (default: ThreadPoolExecutor default)
+        :param return_exceptions: bool
+            Set to true to get the exception raised by a call in its slot of the
+            result list instead of having it raised
+
+        :return: list
+            The results of the calls, in the same order as the calls
+        """
+        calls = list(calls)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(*call) if isinstance(call, tuple) else executor.submit(call) for call in calls]
+
+            results = []
+            for future in futures:
+                if return_exceptions:
+                    exception = future.exception()
+                    results.append(exception if exception is not None else future.result())
+                else:
+                    results.append(future.result())
+            return results
 
     def versioned(self, path):
         """
@@ -181,8 +379,91 @@ class Client(object):
         :return: str
             The URL to the API including the version
         """
-        versioned_base_url = urljoin(self.base_url, self.api_version)
-        return '{url}/{path}'.format(url=versioned_base_url, path=path.replace('/', '', 1))
+        if self.__versioned_base_url[0] != (self.base_url, self.api_version):
+            self.__versioned_base_url = ((self.base_url, self.api_version), urljoin(self.base_url, self.api_version))
+        return '{url}/{path}'.format(url=self.__versioned_base_url[1], path=path.replace('/', '', 1))
+
+    def __request_headers(self):
+        """
+        Returns the headers of every request, authentication included, or None when the authentication method
+        cannot be precomputed. The headers are computed again when the headers or the authentication change.
+        """
+        auth = getattr(self, 'auth', None)
+        source, cached_auth, headers = self.__cached_headers
+        if source == self.headers and cached_auth is auth and headers is not None:
+            return headers
+
+        headers = dict(self.headers)
+        if isinstance(auth, TokenAuthentication):
+            headers['Authorization'] = auth.header
+        elif isinstance(auth, HTTPBasicAuth):
+            headers['Authorization'] = _basic_auth_str(auth.username, auth.password)
+        elif auth is not None:
+            headers = None
+        self.__cached_headers = (dict(self.headers), auth, headers)
+        return headers
+
+    def __write(self, path, prepared_request):
+        try:
+            return self._send(prepared_request)
+        finally:
+            # Invalidated even when the request failed: the server may have applied it
+            if self.cache is not None:
+                self.cache.invalidate(path)
+
+    def _fetch(self, prepared_request):
+        if self.single_flight is not None:
+            return self.single_flight.fetch(prepared_request, self.__revalidate)
+        return self.__revalidate(prepared_request)
+
+    def __revalidate(self, prepared_request):
+        if self.conditional_cache is None:
+            return self._send(prepared_request)
+        return self.conditional_cache.fetch(self, prepared_request)
+
+    def _send(self, prepared_request):
+        attempt = 1
+        while True:
+            try:
+                response = self.__send_once(prepared_request)
+            except RequestException as error:
+                delay = None if self.retry is None else self.retry.retry_delay(
+                    prepared_request.method, attempt, error=error, connect_error=self.__is_connect_error(error))
+                if delay is None:
+                    raise
+            else:
+                delay = None if self.retry is None else self.retry.retry_delay(prepared_request.method, attempt,
+                                                                               response=response)
+                if delay is None:
+                    return response
+
+            self.retry.sleep(delay)
+            attempt += 1
+
+    def __send_once(self, prepared_request):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.rate_limit_key)
+        response = self.transport.send(prepared_request, timeout=self.timeout)
+        response.json_loads = self.json_loads
+        response.structs = self.structs
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(self.rate_limit_key, response.headers)
+        return response
+
+    @staticmethod
+    def __is_connect_error(error):
+        if isinstance(error, ConnectTimeout):
+            return True
+        reason = error.args[0] if isinstance(error, ConnectionError) and error.args else None
+        return isinstance(getattr(reason, 'reason', reason), NewConnectionError)
+
+    @staticmethod
+    def __build_session(pool_connections, pool_maxsize, pool_block):
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     def __change_user_agent(self, custom_user_agent_name):
         """
@@ -0,0 +1,225 @@
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+from dnsimple.exceptions import DNSimpleException
+
+RETRYABLE_STATUSES = frozenset([502, 503, 504])
+"""The statuses of a distribution check meaning the name servers could not be queried yet"""
+
+
+class DistributionResult(object):
+    """How the distribution of a zone or record went"""
+
+    target = None
+    """(account_id, zone) for a zone, (account_id, zone, record_id) for a record"""
+    distributed = False
+    """True when the zone or record was distributed to every DNSimple name server before the deadline"""
+    polls = 0
+    """The number of distribution checks sent"""
+    errors = 0
+    """The number of distribution checks that failed because the name servers could not be queried"""
+    error = None
+    """The exception that stopped the wait (i.e. the zone does not exist), None otherwise"""
+    started_at = None
+    """When the wait started (clock of the waiter)"""
+    finished_at = None
+    """When the wait ended (clock of the waiter)"""
+
+    def __init__(self, target, started_at):
+        self.target = target
+        self.started_at = started_at
+
+    @property
+    def elapsed(self):
+        """The number of seconds waited"""
+        return None if self.finished_at is None else self.finished_at - self.started_at
+
+    @property
+    def timed_out(self):
+        """True when the deadline passed before the distribution"""
+        return not self.distributed and self.error is None
+
+
+class DistributionWaiter(object):
+    """
+    Waits for zones and records to be distributed to the DNSimple name servers
+
+    Every zone or record is polled with Zones.check_zone_distribution or Zones.check_zone_record_distribution, first
+    after initial_delay, then with an exponential backoff up to max_delay, until it is distributed or the deadline
+    passes. The waits share one scheduler: the checks due at the same time are sent concurrently, and a zone or record
+    already waited on (by this call or another thread) is not polled twice.
+
+    waiter = DistributionWaiter(client, timeout=120)
+    results = waiter.wait([(1010, 'example.com'), (1010, 'example.com', 5), (1010, 'example.org')])
+    for target, result in results.items():
+        print(target, result.distributed, result.elapsed, result.polls)
+    """
+
+    def __init__(self, client, initial_delay=1.0, backoff_factor=2.0, max_delay=30.0, timeout=300.0, jitter=0.1,
+                 max_workers=8, clock=time.monotonic, sleep=time.sleep):
+        """
+        :param client: dnsimple.Client
+            The client sending the distribution checks
+        :param initial_delay: float
+            The number of seconds before the first check
+        :param backoff_factor: float
+            The factor the delay is multiplied by after each check
+        :param max_delay: float
+            The maximum number of seconds between two checks
+        :param timeout: float
+            The number of seconds after which a wait gives up
+        :param jitter: float
+            The fraction of the delay randomly added or removed, so that many waits do not poll in lockstep
+        :param max_workers: int
+            The maximum number of checks sent at the same time
+        :param clock: callable
+            Returns the current time in seconds
+        :param sleep: callable
+            Waits the given number of seconds
+        """
+        self.client = client
+        self.initial_delay = initial_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.clock = clock
+        self.sleep = sleep
+        self.__waits = {}
+        self.__lock = threading.Lock()
+
+    def wait(self, targets, timeout=None):
+        """
+        Waits for zones and records to be distributed
+
+        :param targets: iterable
+            (account_id, zone) tuples for zones, (account_id, zone, record_id) tuples for records
+        :param timeout: float
+            Overrides the timeout of the waiter
+
+        :return: dict
+            The DistributionResult of every target
+        """
+        futures = {}
+        owned = []
+        with self.__lock:
+            for target in targets:
+                target = tuple(target)
+                if target in futures:
+                    continue
+                future = self.__waits.get(target)
+                if future is None:
+                    future = self.__waits[target] = Future()
+                    owned.append(target)
+                futures[target] = future
+
+        try:
+            self.__poll(owned, self.timeout if timeout is None else timeout, futures)
+        except BaseException as error:
+            for target in owned:
+                if not futures[target].done():
+                    futures[target].set_exception(error)
+            raise
+        finally:
+            with self.__lock:
+                for target in owned:
+                    self.__waits.pop(target, None)
+
+        return {target: future.result() for target, future in futures.items()}
+
+    def __poll(self, targets, timeout, futures):
+        now = self.clock()
+        deadline = now + timeout
+        results = {target: DistributionResult(target, now) for target in targets}
+        delays = {target: self.initial_delay for target in targets}
+        schedule = [(now + self.__jittered(self.initial_delay), index, target) for index, target in enumerate(targets)]
+        heapq.heapify(schedule)
+
+        while schedule:
+            due_at = min(schedule[0][0], deadline)
+            now = self.clock()
+            if due_at > now:
+                self.sleep(due_at - now)
+
+            now = self.clock()
+            due = []
+            while schedule and (schedule[0][0] <= now or now >= deadline):
+                due.append(heapq.heappop(schedule))
+
+            calls = [(self.__check, target) for _, _, target in due]
+            checks = self.client.map(calls, max_workers=self.max_workers, return_exceptions=True)
+            now = self.clock()
+
+            for (_, index, target), check in zip(due, checks):
+                result = results[target]
+                result.polls += 1
+                if check is None or isinstance(check, DNSimpleException) and check.status in RETRYABLE_STATUSES:
+                    result.errors += 1
+                elif isinstance(check, Exception):
+                    result.error = check
+                elif check:
+                    result.distributed = True
+
+                if result.distributed or result.error is not None or now >= deadline:
+                    result.finished_at = now
+                    futures[target].set_result(result)
+                    continue
+
+                delays[target] = min(self.max_delay, delays[target] * self.backoff_factor)
+                heapq.heappush(schedule, (min(deadline, now + self.__jittered(delays[target])), index, target))
+
+    def __check(self, target):
+        if len(target) == 2:
+            response = self.client.zones.check_zone_distribution(*target)
+        else:
+            response = self.client.zones.check_zone_record_distribution(*target)
+        # A 504 (the name servers could not be queried) is not raised by dnsimple.Response
+        if response.http_response.status_code in RETRYABLE_STATUSES:
+            return None
+        return bool(response.data.distributed)
+
+    def __jittered(self, delay):
+        if not self.jitter:
+            return delay
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+def wait_for_distribution(client, account_id, zone, record_id=None, timeout=None, **options):
+    """
+    Waits for a zone, or a record of a zone, to be distributed to the DNSimple name servers
+
+    The calls on a same client with the same options share one DistributionWaiter, created on the first call and
+    stored on the client (client.distribution_waiters), so that threads waiting for the same zone or record at the
+    same time poll it once. A thread joining a wait in progress gets its result, whatever its own timeout.
+
+    result = wait_for_distribution(client, 1010, 'example.com', timeout=60)
+    if not result.distributed:
+        print('not distributed after', result.elapsed, 'seconds')
+
+    :param client: dnsimple.Client
+        The client sending the distribution checks
+    :param account_id: int
+        The account ID
+    :param zone: str
+        The zone name
+    :param record_id: int
+        The record ID, to wait for a record rather than the whole zone
+    :param timeout: float
+        The number of seconds after which the wait gives up (default: the timeout of DistributionWaiter)
+    :param options:
+        The other options of the DistributionWaiter (i.e. initial_delay, max_delay)
+
+    :return: DistributionResult
+    """
+    key = tuple(sorted(options.items()))
+    with client.distribution_waiters_lock:
+        waiter = client.distribution_waiters.get(key)
+        if waiter is None:
+            waiter = client.distribution_waiters[key] = DistributionWaiter(client, **options)
+
+    target = (account_id, zone) if record_id is None else (account_id, zone, record_id)
+    return waiter.wait([target], timeout=timeout)[target]
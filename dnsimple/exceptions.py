@@ -39,3 +39,16 @@ class DNSimpleException(Exception):
         """Return the attribute errors"""
         warnings.warn("DEPRECATION WARNING: errors is deprecated, use attribute_errors instead.")
         return self.attribute_errors
+
+
+class RateLimitExceeded(DNSimpleException):
+    """
+    Raised when a request cannot be sent without exceeding the rate limit.
+
+    :param retry_after: float
+        The number of seconds to wait before the request can be sent
+    """
+
+    def __init__(self, retry_after=None, message=None, http_response=None):
+        super().__init__(message=message or 'Rate limit exceeded', http_response=http_response)
+        self.retry_after = retry_after
@@ -0,0 +1,138 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from dnsimple.paginator import MAX_PER_PAGE
+
+
+class _ZoneExport(object):
+    def __init__(self, zone):
+        self.zone = zone
+        self.next_page = 1
+        self.total_pages = None
+        self.pages = deque()
+
+    @property
+    def exhausted(self):
+        return self.total_pages is not None and self.next_page > self.total_pages
+
+
+def export_all_records(zones, account_id, concurrency=4, per_page=MAX_PER_PAGE, filter=None):
+    """
+    Yields every record of every zone of an account
+
+    See dnsimple.service.Zones.export_all_records
+    """
+    window = max(1, concurrency) * 2
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    discovered = zones.iter_zones(account_id, filter=filter, prefetch=1)
+    exports = deque()
+    done = False
+
+    def submit(export):
+        export.pages.append(executor.submit(zones.list_records, account_id, export.zone.name, sort='id:asc',
+                                            page=export.next_page, per_page=per_page))
+        export.next_page += 1
+
+    def fill():
+        nonlocal done
+        budget = window - sum(len(export.pages) for export in exports)
+        for export in exports:
+            while budget > 0 and export.total_pages is not None and not export.exhausted:
+                submit(export)
+                budget -= 1
+        while budget > 0 and not done:
+            zone = next(discovered, None)
+            if zone is None:
+                done = True
+                break
+            export = _ZoneExport(zone)
+            submit(export)
+            exports.append(export)
+            budget -= 1
+
+    try:
+        fill()
+        while exports:
+            export = exports[0]
+            if not export.pages:
+                if export.exhausted:
+                    exports.popleft()
+                else:
+                    submit(export)
+                fill()
+                continue
+
+            response = export.pages.popleft().result()
+            if export.total_pages is None:
+                export.total_pages = 1 if response.pagination is None else response.pagination.total_pages
+            fill()
+            for record in response.data:
+                yield export.zone, record
+    finally:
+        # stops the prefetching of the zones when the caller breaks out early
+        discovered.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_export_all_records(zones, account_id, concurrency=4, per_page=MAX_PER_PAGE, filter=None):
+    """
+    Yields every record of every zone of an account, on the event loop of a dnsimple.AsyncClient
+
+    See dnsimple.service.Zones.export_all_records
+    """
+    window = max(1, concurrency) * 2
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    discovered = zones.iter_zones(account_id, filter=filter, prefetch=1)
+    exports = deque()
+    done = False
+
+    async def fetch(zone, page):
+        async with semaphore:
+            return await zones.list_records(account_id, zone, sort='id:asc', page=page, per_page=per_page)
+
+    def submit(export):
+        export.pages.append(asyncio.ensure_future(fetch(export.zone.name, export.next_page)))
+        export.next_page += 1
+
+    async def fill():
+        nonlocal done
+        budget = window - sum(len(export.pages) for export in exports)
+        for export in exports:
+            while budget > 0 and export.total_pages is not None and not export.exhausted:
+                submit(export)
+                budget -= 1
+        while budget > 0 and not done:
+            zone = await anext(discovered, None)
+            if zone is None:
+                done = True
+                break
+            export = _ZoneExport(zone)
+            submit(export)
+            exports.append(export)
+            budget -= 1
+
+    try:
+        await fill()
+        while exports:
+            export = exports[0]
+            if not export.pages:
+                if export.exhausted:
+                    exports.popleft()
+                else:
+                    submit(export)
+                await fill()
+                continue
+
+            response = await export.pages.popleft()
+            if export.total_pages is None:
+                export.total_pages = 1 if response.pagination is None else response.pagination.total_pages
+            await fill()
+            for record in response.data:
+                yield export.zone, record
+    finally:
+        pending = [task for export in exports for task in export.pages]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await discovered.aclose()
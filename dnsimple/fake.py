@@ -0,0 +1,467 @@
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from dnsimple.transport import Transport, build_response
+from dnsimple.zone_file_parser import NAME_TYPES, PRIORITY_TYPES
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures', 'v2',
+                             'api')
+"""
+The fixtures of the test suite, available in a checkout of the repository. They are not part of the package: without
+them, the endpoints answered with a fixture respond 501 Not Implemented.
+"""
+
+FIXTURE_ROUTES = [
+    ('GET', '/accounts', 'listAccounts/success-user'),
+    ('GET', '/services', 'listServices/success'),
+    ('GET', '/services/*', 'getService/success'),
+    ('GET', '/tlds', 'listTlds/success'),
+    ('GET', '/tlds/*', 'getTld/success'),
+    ('GET', '/tlds/*/extended_attributes', 'getTldExtendedAttributes/success'),
+    ('GET', '/whoami', 'whoami/success'),
+    ('POST', '/oauth/access_token', 'oauthAccessToken/success'),
+    ('GET', '/*/billing/charges', 'listCharges/success'),
+    ('GET', '/*/contacts', 'listContacts/success'),
+    ('POST', '/*/contacts', 'createContact/created'),
+    ('GET', '/*/contacts/*', 'getContact/success'),
+    ('PATCH', '/*/contacts/*', 'updateContact/success'),
+    ('DELETE', '/*/contacts/*', 'deleteContact/success'),
+    ('GET', '/*/dns_analytics', 'dnsAnalytics/success'),
+    ('GET', '/*/domains', 'listDomains/success'),
+    ('POST', '/*/domains', 'createDomain/created'),
+    ('GET', '/*/domains/research/status', 'getDomainsResearchStatus/success-available'),
+    ('GET', '/*/domains/*', 'getDomain/success'),
+    ('DELETE', '/*/domains/*', 'deleteDomain/success'),
+    ('GET', '/*/domains/*/certificates', 'listCertificates/success'),
+    ('GET', '/*/domains/*/certificates/*', 'getCertificate/success'),
+    ('GET', '/*/domains/*/certificates/*/download', 'downloadCertificate/success'),
+    ('GET', '/*/domains/*/certificates/*/private_key', 'getCertificatePrivateKey/success'),
+    ('POST', '/*/domains/*/certificates/letsencrypt', 'purchaseLetsencryptCertificate/success'),
+    ('POST', '/*/domains/*/certificates/letsencrypt/*/issue', 'issueLetsencryptCertificate/success'),
+    ('POST', '/*/domains/*/certificates/letsencrypt/*/renewals', 'purchaseRenewalLetsencryptCertificate/success'),
+    ('POST', '/*/domains/*/certificates/letsencrypt/*/renewals/*/issue', 'issueRenewalLetsencryptCertificate/success'),
+    ('GET', '/*/domains/*/dnssec', 'getDnssec/success'),
+    ('POST', '/*/domains/*/dnssec', 'enableDnssec/success'),
+    ('DELETE', '/*/domains/*/dnssec', 'disableDnssec/success'),
+    ('GET', '/*/domains/*/ds_records', 'listDelegationSignerRecords/success'),
+    ('POST', '/*/domains/*/ds_records', 'createDelegationSignerRecord/created'),
+    ('GET', '/*/domains/*/ds_records/*', 'getDelegationSignerRecord/success'),
+    ('DELETE', '/*/domains/*/ds_records/*', 'deleteDelegationSignerRecord/success'),
+    ('GET', '/*/domains/*/email_forwards', 'listEmailForwards/success'),
+    ('POST', '/*/domains/*/email_forwards', 'createEmailForward/created'),
+    ('GET', '/*/domains/*/email_forwards/*', 'getEmailForward/success'),
+    ('DELETE', '/*/domains/*/email_forwards/*', 'deleteEmailForward/success'),
+    ('POST', '/*/domains/*/pushes', 'initiatePush/success'),
+    ('GET', '/*/domains/*/services', 'appliedServices/success'),
+    ('POST', '/*/domains/*/services/*', 'applyService/success'),
+    ('DELETE', '/*/domains/*/services/*', 'unapplyService/success'),
+    ('POST', '/*/domains/*/templates/*', 'applyTemplate/success'),
+    ('GET', '/*/pushes', 'listPushes/success'),
+    ('POST', '/*/pushes/*', 'acceptPush/success'),
+    ('DELETE', '/*/pushes/*', 'rejectPush/success'),
+    ('POST', '/*/registrar/domains/*/authorize_transfer_out', 'authorizeDomainTransferOut/success'),
+    ('PUT', '/*/registrar/domains/*/auto_renewal', 'enableDomainAutoRenewal/success'),
+    ('DELETE', '/*/registrar/domains/*/auto_renewal', 'disableDomainAutoRenewal/success'),
+    ('GET', '/*/registrar/domains/*/check', 'checkDomain/success'),
+    ('GET', '/*/registrar/domains/*/delegation', 'getDomainDelegation/success'),
+    ('PUT', '/*/registrar/domains/*/delegation', 'changeDomainDelegation/success'),
+    ('PUT', '/*/registrar/domains/*/delegation/vanity', 'changeDomainDelegationToVanity/success'),
+    ('DELETE', '/*/registrar/domains/*/delegation/vanity', 'changeDomainDelegationFromVanity/success'),
+    ('GET', '/*/registrar/domains/*/prices', 'getDomainPrices/success'),
+    ('POST', '/*/registrar/domains/*/registrations', 'registerDomain/success'),
+    ('GET', '/*/registrar/domains/*/registrations/*', 'getDomainRegistration/success'),
+    ('POST', '/*/registrar/domains/*/renewals', 'renewDomain/success'),
+    ('GET', '/*/registrar/domains/*/renewals/*', 'getDomainRenewal/success'),
+    ('POST', '/*/registrar/domains/*/restores', 'restoreDomain/success'),
+    ('GET', '/*/registrar/domains/*/restores/*', 'getDomainRestore/success'),
+    ('GET', '/*/registrar/domains/*/transfer_lock', 'getDomainTransferLock/success'),
+    ('POST', '/*/registrar/domains/*/transfer_lock', 'enableDomainTransferLock/success'),
+    ('DELETE', '/*/registrar/domains/*/transfer_lock', 'disableDomainTransferLock/success'),
+    ('POST', '/*/registrar/domains/*/transfers', 'transferDomain/success'),
+    ('GET', '/*/registrar/domains/*/transfers/*', 'getDomainTransfer/success'),
+    ('DELETE', '/*/registrar/domains/*/transfers/*', 'cancelDomainTransfer/success'),
+    ('PUT', '/*/registrar/domains/*/whois_privacy', 'enableWhoisPrivacy/success'),
+    ('DELETE', '/*/registrar/domains/*/whois_privacy', 'disableWhoisPrivacy/success'),
+    ('GET', '/*/templates', 'listTemplates/success'),
+    ('POST', '/*/templates', 'createTemplate/created'),
+    ('GET', '/*/templates/*', 'getTemplate/success'),
+    ('PATCH', '/*/templates/*', 'updateTemplate/success'),
+    ('DELETE', '/*/templates/*', 'deleteTemplate/success'),
+    ('GET', '/*/templates/*/records', 'listTemplateRecords/success'),
+    ('POST', '/*/templates/*/records', 'createTemplateRecord/created'),
+    ('GET', '/*/templates/*/records/*', 'getTemplateRecord/success'),
+    ('DELETE', '/*/templates/*/records/*', 'deleteTemplateRecord/success'),
+    ('PUT', '/*/vanity/*', 'enableVanityNameServers/success'),
+    ('DELETE', '/*/vanity/*', 'disableVanityNameServers/success'),
+    ('GET', '/*/webhooks', 'listWebhooks/success'),
+    ('POST', '/*/webhooks', 'createWebhook/created'),
+    ('GET', '/*/webhooks/*', 'getWebhook/success'),
+    ('DELETE', '/*/webhooks/*', 'deleteWebhook/success'),
+]
+"""The endpoints answered with a fixture: (method, path where '*' matches one segment, fixture name)"""
+
+STATUS_REASONS = {200: 'OK', 201: 'Created', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found',
+                  405: 'Method Not Allowed', 501: 'Not Implemented'}
+
+DEFAULT_PER_PAGE = 30
+
+_RECORD_SORTS = ('id', 'name', 'content', 'type')
+_ZONE_SORTS = ('id', 'name')
+
+
+class FakeDNSimple(Transport):
+    """
+    In-process fake of the DNSimple API, to run a Client offline at memory speed
+
+    Zones and records are held in memory and changed by the requests like the API does (records listed with filters,
+    sorting and pagination, created, updated and deleted one by one or in batch changes), so that tools built on the
+    client (i.e. ZoneReconciler, BatchExecutor, ZoneSync) can be exercised against them. The other endpoints are
+    answered with the fixtures of the test suite.
+
+    server = FakeDNSimple()
+    server.add_zone(1010, 'example.com')
+    server.add_record(1010, 'example.com', 'www', 'A', '192.0.2.1')
+    client = Client(access_token='fake', transport=server)
+    client.zones.list_records(1010, 'example.com')
+    """
+
+    def __init__(self, fixtures_path=FIXTURES_PATH, rate_limit=2400, latency=0.0, clock=time.time):
+        """
+        :param fixtures_path: str
+            The directory of the fixtures (default: the ones of the test suite)
+        :param rate_limit: int
+            The X-RateLimit-Limit of the responses; X-RateLimit-Remaining counts down from it
+        :param latency: float
+            The number of seconds every request takes (default: 0, answered immediately)
+        :param clock: callable
+            Returns the current Unix time, used for the timestamps of the zones and records
+        """
+        self.fixtures_path = fixtures_path
+        self.rate_limit = rate_limit
+        self.latency = latency
+        self.clock = clock
+        self.requests = []
+        """The (method, path) of every request received"""
+        self.__zones = {}
+        self.__records = {}
+        self.__next_id = 1
+        self.__fixtures = {}
+        self.__lock = threading.RLock()
+        self.__routes = [(method, _compile(pattern), handler) for method, pattern, handler in [
+            ('GET', '/*/zones', self.__list_zones),
+            ('GET', '/*/zones/*', self.__get_zone),
+            ('GET', '/*/zones/*/file', self.__get_zone_file),
+            ('GET', '/*/zones/*/distribution', self.__check_distribution),
+            ('PUT', '/*/zones/*/activation', self.__activate_zone),
+            ('DELETE', '/*/zones/*/activation', self.__deactivate_zone),
+            ('GET', '/*/zones/*/records', self.__list_records),
+            ('POST', '/*/zones/*/records', self.__create_record),
+            ('GET', '/*/zones/*/records/*', self.__get_record),
+            ('PATCH', '/*/zones/*/records/*', self.__update_record),
+            ('DELETE', '/*/zones/*/records/*', self.__delete_record),
+            ('GET', '/*/zones/*/records/*/distribution', self.__check_distribution),
+            ('POST', '/*/zones/*/batch', self.__batch_change),
+        ]]
+        self.__routes += [(method, _compile(pattern), fixture) for method, pattern, fixture in FIXTURE_ROUTES]
+
+    def add_zone(self, account_id, name, system_records=True):
+        """
+        Adds a zone
+
+        :param account_id: int
+            The account ID
+        :param name: str
+            The zone name
+        :param system_records: bool
+            Set to false to create the zone without its SOA and NS records
+        :return: dict
+            The zone, as the API returns it
+        """
+        with self.__lock:
+            now = self.__now()
+            zone = {'id': self.__take_id(), 'account_id': int(account_id), 'name': name, 'reverse': False,
+                    'secondary': False, 'last_transferred_at': None, 'active': True, 'created_at': now,
+                    'updated_at': now}
+            self.__zones[(str(account_id), name)] = zone
+            self.__records[(str(account_id), name)] = {}
+            if system_records:
+                self.add_record(account_id, name, '', 'SOA', 'ns1.dnsimple.com admin.dnsimple.com 1 86400 7200 '
+                                                             '604800 300', system_record=True)
+                for server in range(1, 5):
+                    self.add_record(account_id, name, '', 'NS', 'ns{server}.dnsimple.com'.format(server=server),
+                                    system_record=True)
+            return dict(zone)
+
+    def add_record(self, account_id, zone, name, type, content, ttl=3600, priority=None, regions=None,
+                   system_record=False):
+        """
+        Adds a record to a zone
+
+        :return: dict
+            The record, as the API returns it
+
+        :raises KeyError
+            When the zone does not exist
+        """
+        with self.__lock:
+            records = self.__records[(str(account_id), zone)]
+            now = self.__now()
+            record = {'id': self.__take_id(), 'zone_id': zone, 'parent_id': None, 'name': name, 'content': content,
+                      'ttl': ttl, 'priority': priority, 'type': type.upper(), 'regions': regions or ['global'],
+                      'system_record': system_record, 'created_at': now, 'updated_at': now}
+            records[record['id']] = record
+            self.__zones[(str(account_id), zone)]['updated_at'] = now
+            return dict(record)
+
+    def zones(self, account_id):
+        """
+        :return: list
+            The zones of an account
+        """
+        with self.__lock:
+            return [dict(zone) for (account, _), zone in self.__zones.items() if account == str(account_id)]
+
+    def records(self, account_id, zone):
+        """
+        :return: list
+            The records of a zone, by ID
+
+        :raises KeyError
+            When the zone does not exist
+        """
+        with self.__lock:
+            return [dict(record) for record in self.__records[(str(account_id), zone)].values()]
+
+    def send(self, request, timeout=None):
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlsplit(request.url)
+        path = unquote(url.path)
+        path = path[path.index('/', 1):] if path.startswith('/v2/') else path
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        body = json.loads(request.body) if request.body else None
+
+        with self.__lock:
+            self.requests.append((request.method, path))
+            remaining = max(0, self.rate_limit - len(self.requests))
+            status, payload, fixture_headers = self.__dispatch(request.method, path, query, body)
+
+        headers = {'Content-Type': 'application/json; charset=utf-8', **fixture_headers,
+                   'X-RateLimit-Limit': str(self.rate_limit), 'X-RateLimit-Remaining': str(remaining),
+                   'X-RateLimit-Reset': str(int(self.clock()) + 3600)}
+        if payload is None:
+            content = b''
+        elif isinstance(payload, bytes):
+            content = payload
+        else:
+            content = json.dumps(payload).encode('utf-8')
+        return build_response(request, status, headers, content, STATUS_REASONS.get(status))
+
+    def __dispatch(self, method, path, query, body):
+        path_found = False
+        for route_method, pattern, handler in self.__routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            path_found = True
+            if route_method != method:
+                continue
+            try:
+                if isinstance(handler, str):
+                    return self.__fixture(handler)
+                status, payload = handler(query, body, *match.groups())
+            except _ApiError as error:
+                status, payload = error.args
+            return status, payload, {}
+        if path_found:
+            return 405, {'message': 'Method not allowed'}, {}
+        return 404, {'message': 'Not found'}, {}
+
+    def __fixture(self, name):
+        fixture = self.__fixtures.get(name)
+        if fixture is None:
+            path = os.path.join(self.fixtures_path, '{name}.http'.format(name=name))
+            try:
+                with open(path, 'rb') as f:
+                    head, _, content = f.read().replace(b'\r\n', b'\n').partition(b'\n\n')
+            except OSError:
+                raise _ApiError(501, {'message': 'No fixture at {path}: this endpoint is answered with the fixtures '
+                                                 'of the test suite, pass fixtures_path to FakeDNSimple'.format(
+                                                     path=path)})
+            lines = head.decode('utf-8').splitlines()
+            headers = {}
+            for line in lines[1:]:
+                header, _, value = line.partition(':')
+                if header.lower() in ('content-type', 'etag', 'location'):
+                    headers[header] = value.strip()
+            fixture = self.__fixtures[name] = (int(lines[0].split(' ')[1]), content.strip(), headers)
+        return fixture
+
+    def __zone(self, account_id, zone):
+        found = self.__zones.get((account_id, zone))
+        if found is None:
+            raise _ApiError(404, {'message': 'Zone `{zone}` not found'.format(zone=zone)})
+        return found
+
+    def __record(self, account_id, zone, record_id):
+        self.__zone(account_id, zone)
+        record = self.__records[(account_id, zone)].get(int(record_id)) if record_id.isdigit() else None
+        if record is None:
+            raise _ApiError(404, {'message': 'Record `{record_id}` not found'.format(record_id=record_id)})
+        return record
+
+    def __list_zones(self, query, body, account_id):
+        zones = [zone for (account, _), zone in self.__zones.items() if account == account_id]
+        name_like = query.get('name_like')
+        if name_like:
+            zones = [zone for zone in zones if name_like in zone['name']]
+        return 200, _paginate(_sort(zones, query.get('sort'), _ZONE_SORTS), query)
+
+    def __get_zone(self, query, body, account_id, zone):
+        return 200, {'data': self.__zone(account_id, zone)}
+
+    def __get_zone_file(self, query, body, account_id, zone):
+        self.__zone(account_id, zone)
+        lines = ['$ORIGIN {zone}.'.format(zone=zone), '$TTL 1h']
+        for record in self.__records[(account_id, zone)].values():
+            owner = '{name}.{zone}.'.format(name=record['name'], zone=zone) if record['name'] else zone + '.'
+            content = record['content']
+            if record['type'] in NAME_TYPES:
+                content += '.'
+            if record['type'] in PRIORITY_TYPES:
+                content = '{priority} {content}.'.format(priority=record['priority'] or 0, content=content)
+            lines.append('{owner} {ttl} IN {type} {content}'.format(owner=owner, ttl=record['ttl'],
+                                                                    type=record['type'], content=content))
+        return 200, {'data': {'zone': '\n'.join(lines) + '\n'}}
+
+    def __check_distribution(self, query, body, account_id, zone, record_id=None):
+        if record_id is None:
+            self.__zone(account_id, zone)
+        else:
+            self.__record(account_id, zone, record_id)
+        return 200, {'data': {'distributed': True}}
+
+    def __activate_zone(self, query, body, account_id, zone):
+        found = self.__zone(account_id, zone)
+        found['active'] = True
+        return 200, {'data': found}
+
+    def __deactivate_zone(self, query, body, account_id, zone):
+        found = self.__zone(account_id, zone)
+        found['active'] = False
+        return 200, {'data': found}
+
+    def __list_records(self, query, body, account_id, zone):
+        self.__zone(account_id, zone)
+        records = list(self.__records[(account_id, zone)].values())
+        if 'name' in query:
+            records = [record for record in records if record['name'] == query['name']]
+        if query.get('name_like'):
+            records = [record for record in records if query['name_like'] in record['name']]
+        if query.get('type'):
+            records = [record for record in records if record['type'] == query['type'].upper()]
+        return 200, _paginate(_sort(records, query.get('sort'), _RECORD_SORTS), query)
+
+    def __create_record(self, query, body, account_id, zone):
+        self.__zone(account_id, zone)
+        return 201, {'data': self.__create(account_id, zone, body or {})}
+
+    def __get_record(self, query, body, account_id, zone, record_id):
+        return 200, {'data': self.__record(account_id, zone, record_id)}
+
+    def __update_record(self, query, body, account_id, zone, record_id):
+        record = self.__record(account_id, zone, record_id)
+        return 200, {'data': self.__update(account_id, zone, record, body or {})}
+
+    def __delete_record(self, query, body, account_id, zone, record_id):
+        record = self.__record(account_id, zone, record_id)
+        del self.__records[(account_id, zone)][record['id']]
+        self.__zones[(account_id, zone)]['updated_at'] = self.__now()
+        return 204, None
+
+    def __batch_change(self, query, body, account_id, zone):
+        self.__zone(account_id, zone)
+        body = body or {}
+        records = self.__records[(account_id, zone)]
+        for index, update in enumerate(body.get('updates') or []):
+            if update.get('id') not in records:
+                return 400, {'message': 'Validation failed', 'errors': {'updates': {
+                    str(index): ['Record {id} not found'.format(id=update.get('id'))]}}}
+        for index, delete in enumerate(body.get('deletes') or []):
+            if delete.get('id') not in records:
+                return 400, {'message': 'Validation failed', 'errors': {'deletes': {
+                    str(index): ['Record {id} not found'.format(id=delete.get('id'))]}}}
+        for index, create in enumerate(body.get('creates') or []):
+            if not create.get('type') or create.get('content') is None:
+                return 400, {'message': 'Validation failed', 'errors': {'creates': {
+                    str(index): ['Type and content are required']}}}
+
+        deletes = []
+        for delete in body.get('deletes') or []:
+            if records.pop(delete['id'], None) is not None:
+                deletes.append({'id': delete['id']})
+        updates = [self.__update(account_id, zone, records[update['id']], update)
+                   for update in body.get('updates') or [] if update['id'] in records]
+        creates = [self.__create(account_id, zone, create) for create in body.get('creates') or []]
+        self.__zones[(account_id, zone)]['updated_at'] = self.__now()
+        return 200, {'data': {'creates': creates, 'updates': updates, 'deletes': deletes}}
+
+    def __create(self, account_id, zone, data):
+        if not data.get('type') or data.get('content') is None:
+            raise _ApiError(400, {'message': 'Validation failed',
+                                  'errors': {'type': ['is required'], 'content': ['is required']}})
+        return self.add_record(account_id, zone, data.get('name', ''), data['type'], data['content'],
+                               ttl=data.get('ttl') or 3600, priority=data.get('priority'),
+                               regions=data.get('regions'))
+
+    def __update(self, account_id, zone, record, data):
+        for field in ('name', 'content', 'ttl', 'priority', 'regions'):
+            if field in data:
+                record[field] = data[field]
+        record['updated_at'] = self.__zones[(account_id, zone)]['updated_at'] = self.__now()
+        return dict(record)
+
+    def __take_id(self):
+        next_id = self.__next_id
+        self.__next_id += 1
+        return next_id
+
+    def __now(self):
+        return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.clock()))
+
+
+class _ApiError(Exception):
+    """Raised by the handlers of FakeDNSimple with the status and payload of the error response"""
+
+
+def _compile(pattern):
+    return re.compile('^{pattern}$'.format(pattern='/'.join(
+        '([^/]+)' if segment == '*' else re.escape(segment) for segment in pattern.split('/'))))
+
+
+def _sort(entries, sort, fields):
+    if not sort:
+        # Entries are kept in the order of their IDs
+        return entries
+    for criterion in reversed(sort.split(',')):
+        field, _, direction = criterion.partition(':')
+        if field not in fields:
+            continue
+        entries = sorted(entries, key=lambda entry: '' if entry[field] is None else entry[field],
+                         reverse=direction == 'desc')
+    return entries
+
+
+def _paginate(entries, query):
+    per_page = min(100, int(query.get('per_page') or DEFAULT_PER_PAGE))
+    page = max(1, int(query.get('page') or 1))
+    total_pages = max(1, -(-len(entries) // per_page))
+    start = (page - 1) * per_page
+    return {'data': [dict(entry) for entry in entries[start:start + per_page]],
+            'pagination': {'current_page': page, 'per_page': per_page, 'total_entries': len(entries),
+                           'total_pages': total_pages}}
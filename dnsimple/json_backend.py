@@ -0,0 +1,62 @@
+import importlib
+import json
+
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+"""The JSON backends the client knows about, in order of preference"""
+
+
+def load_json_backend(name=None):
+    """
+    Returns the function used to decode the JSON payloads sent by the DNSimple API
+
+    :param name: str
+        The backend to use: 'orjson', 'ujson' or 'json' (the standard library). When None the fastest
+        installed backend is picked, falling back to the standard library.
+    :return: callable
+        A function decoding a JSON document (str or bytes) into Python objects
+
+    :raises ValueError
+        When the backend is unknown
+    :raises ImportError
+        When the backend was explicitly requested but is not installed
+    """
+    if name is None:
+        for candidate in JSON_BACKENDS:
+            try:
+                return importlib.import_module(candidate).loads
+            except ImportError:
+                continue
+
+    if name not in JSON_BACKENDS:
+        raise ValueError('Unknown JSON backend {name}, expected one of {backends}'.format(
+            name=name, backends=', '.join(JSON_BACKENDS)))
+
+    return importlib.import_module(name).loads
+
+
+def decode(http_response):
+    """
+    Decodes the JSON body of an HTTP response, once
+
+    The decoded payload is cached on the HTTP response so that every consumer (errors, data, pagination) shares a
+    single parse. The decoder set by the client as `json_loads` on the HTTP response is used when present.
+
+    :param http_response: requests.Response
+        The raw response from the server
+    :return: object
+        The decoded payload, or None when the body is empty
+    """
+    try:
+        return http_response.dnsimple_json
+    except AttributeError:
+        pass
+
+    content = http_response.content
+    if not content:
+        payload = None
+    else:
+        loads = getattr(http_response, 'json_loads', None) or json.loads
+        payload = loads(content)
+
+    http_response.dnsimple_json = payload
+    return payload
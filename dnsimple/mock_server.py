@@ -0,0 +1,284 @@
+"""
+A local stand-in for the DNSimple API, served over HTTP to load test the client with real sockets and connection pools
+
+    python -m dnsimple.mock_server --port 8080 --latency 0.02 --error-rate-429 0.01 --zones 10 --records 10000
+"""
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests import PreparedRequest
+
+from dnsimple.fake import FakeDNSimple
+
+ERROR_PAGE = '<html><head><title>{status}</title></head><body><center><h1>{status}</h1></center></body></html>'
+"""The HTML page of the injected failures, like the ones of the proxies in front of the API"""
+
+
+class MockServerStats(object):
+    """Counters of the requests served by a MockServer"""
+
+    requests = 0
+    """The number of requests received"""
+    rate_limited = 0
+    """The number of requests answered 429 because the rate limit was exhausted"""
+    injected = None
+    """The number of failures injected, by status code"""
+
+    def __init__(self):
+        self.injected = Counter()
+        self.__lock = threading.Lock()
+
+    def record_request(self):
+        with self.__lock:
+            self.requests += 1
+
+    def record_rate_limited(self):
+        with self.__lock:
+            self.rate_limited += 1
+
+    def record_injected(self, status):
+        with self.__lock:
+            self.injected[status] += 1
+
+
+class MockServer(object):
+    """
+    Serves a FakeDNSimple over HTTP on a local port
+
+    Every response carries X-RateLimit-* headers counted over a fixed window, and the requests beyond the limit are
+    answered 429 like the API does. On top of that, latency and random 429/502 failures can be injected to see how the
+    client, its connection pool, RateLimiter and RetryPolicy behave under load.
+
+    with MockServer(latency=0.01, error_rates={429: 0.01, 502: 0.01}) as server:
+        populate(server.fake, 1010, zones=10, records=10000)
+        client = Client(access_token='fake', base_url=server.url)
+        records = list(client.zones.iter_records(1010, 'zone0.example'))
+    """
+
+    def __init__(self, fake=None, host='127.0.0.1', port=0, latency=0.0, latency_jitter=0.0, rate_limit=2400,
+                 rate_limit_window=3600, error_rates=None, retry_after=1, seed=None, clock=time.time):
+        """
+        :param fake: dnsimple.fake.FakeDNSimple
+            The fake answering the requests (default: a new one, without zones)
+        :param host: str
+            The address to listen on
+        :param port: int
+            The port to listen on (default: 0, any free port)
+        :param latency: float
+            The number of seconds every request takes
+        :param latency_jitter: float
+            The maximum number of seconds randomly added to the latency
+        :param rate_limit: int
+            The number of requests allowed per window
+        :param rate_limit_window: float
+            The length of the rate limit window, in seconds
+        :param error_rates: dict
+            The fraction of the requests failing with each status, i.e. {429: 0.01, 502: 0.02}
+        :param retry_after: float
+            The Retry-After header of the injected 429 responses
+        :param seed: int
+            Seeds the random failures and jitter, to replay the same run
+        :param clock: callable
+            Returns the current Unix time
+        """
+        self.fake = fake if fake is not None else FakeDNSimple(clock=clock)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.error_rates = dict(error_rates or {})
+        self.retry_after = retry_after
+        self.clock = clock
+        self.stats = MockServerStats()
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__window_start = clock()
+        self.__window_requests = 0
+        self.__thread = None
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock_server = self
+
+    @property
+    def url(self):
+        """The base URL of the server, to pass as base_url to a Client"""
+        host, port = self.httpd.server_address[:2]
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """
+        Serves the requests on a background thread
+
+        :return: MockServer
+        """
+        self.__thread = threading.Thread(target=self.httpd.serve_forever, kwargs={'poll_interval': 0.05},
+                                         name='dnsimple-mock-server', daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket"""
+        if self.__thread is not None:
+            self.httpd.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.httpd.server_close()
+
+    def serve_forever(self):
+        """Serves the requests on the current thread until interrupted"""
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.httpd.server_close()
+
+    def respond(self, method, path, body):
+        """
+        Answers a request
+
+        :param method: str
+            The HTTP method
+        :param path: str
+            The path and query of the request (i.e. /v2/1010/zones?page=2)
+        :param body: bytes
+            The body of the request
+        :return: tuple
+            The status code, headers (dict) and body (bytes) of the response
+        """
+        self.stats.record_request()
+        with self.__lock:
+            delay = self.latency + (self.__random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+            draw = self.__random.random()
+            now = self.clock()
+            if now >= self.__window_start + self.rate_limit_window:
+                self.__window_start = now
+                self.__window_requests = 0
+            self.__window_requests += 1
+            remaining = self.rate_limit - self.__window_requests
+            reset = int(self.__window_start + self.rate_limit_window)
+        if delay:
+            time.sleep(delay)
+
+        headers = {'X-RateLimit-Limit': str(self.rate_limit), 'X-RateLimit-Remaining': str(max(0, remaining)),
+                   'X-RateLimit-Reset': str(reset)}
+        if remaining < 0:
+            self.stats.record_rate_limited()
+            return 429, {**headers, 'Content-Type': 'application/json'}, b'{"message":"API rate limit exceeded"}'
+
+        threshold = 0.0
+        for status, rate in sorted(self.error_rates.items()):
+            threshold += rate
+            if draw < threshold:
+                self.stats.record_injected(status)
+                if status == 429:
+                    return 429, {**headers, 'Content-Type': 'application/json', 'Retry-After': str(self.retry_after)}, \
+                        b'{"message":"API rate limit exceeded"}'
+                return status, {'Content-Type': 'text/html'}, _error_page(status)
+
+        request = PreparedRequest()
+        request.method = method
+        request.url = self.url + path
+        request.body = body or None
+        response = self.fake.send(request)
+        return response.status_code, {**response.headers, **headers}, response.content
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.__respond()
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+    def __respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        status, headers, content = self.server.mock_server.respond(self.command, self.path, body)
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() not in ('content-length', 'connection', 'transfer-encoding'):
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def _error_page(status):
+    """Returns the HTML page of an injected failure (i.e. 503 Service Unavailable)"""
+    try:
+        status = '{code} {phrase}'.format(code=status, phrase=HTTPStatus(status).phrase)
+    except ValueError:
+        pass
+    return ERROR_PAGE.format(status=status).encode('utf-8')
+
+
+def populate(fake, account_id, zones, records, zone_name='zone{index}.example'):
+    """
+    Fills a FakeDNSimple with synthetic zones and records, to paginate over large datasets
+
+    :param fake: dnsimple.fake.FakeDNSimple
+    :param account_id: int
+        The account ID
+    :param zones: int
+        The number of zones to add
+    :param records: int
+        The number of records to add to each zone (besides its SOA and NS records)
+    :param zone_name: str
+        The name of the zones, formatted with their index
+    :return: list
+        The names of the zones added
+    """
+    names = []
+    for index in range(zones):
+        name = zone_name.format(index=index)
+        fake.add_zone(account_id, name)
+        for record in range(records):
+            fake.add_record(account_id, name, 'host{record}'.format(record=record), 'A',
+                            '10.{a}.{b}.{c}'.format(a=record >> 16 & 255, b=record >> 8 & 255, c=record & 255))
+        names.append(name)
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local stand-in for the DNSimple API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds every request takes')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='maximum seconds randomly added')
+    parser.add_argument('--rate-limit', type=int, default=2400, help='requests allowed per window')
+    parser.add_argument('--rate-limit-window', type=float, default=3600, help='seconds')
+    parser.add_argument('--error-rate-429', type=float, default=0.0, help='fraction of requests failing with a 429')
+    parser.add_argument('--error-rate-502', type=float, default=0.0, help='fraction of requests failing with a 502')
+    parser.add_argument('--account', type=int, default=1010, help='account of the synthetic zones')
+    parser.add_argument('--zones', type=int, default=0, help='number of synthetic zones')
+    parser.add_argument('--records', type=int, default=0, help='number of records per synthetic zone')
+    parser.add_argument('--seed', type=int, default=None)
+    options = parser.parse_args(argv)
+
+    server = MockServer(host=options.host, port=options.port, latency=options.latency,
+                        latency_jitter=options.latency_jitter, rate_limit=options.rate_limit,
+                        rate_limit_window=options.rate_limit_window,
+                        error_rates={429: options.error_rate_429, 502: options.error_rate_502}, seed=options.seed)
+    populate(server.fake, options.account, options.zones, options.records)
+    print('Serving the DNSimple API on {url}'.format(url=server.url))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
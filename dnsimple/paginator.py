@@ -0,0 +1,81 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_PER_PAGE = 100
+"""The maximum number of entries the DNSimple API returns per page on most list endpoints"""
+
+
+def iterate(list_method, *args, per_page=MAX_PER_PAGE, prefetch=0, parallel=None, **kwargs):
+    """
+    Yields every entry of a paginated list endpoint, page by page
+
+    Pages are requested lazily: the next page is only fetched once the entries of the current one are consumed, unless
+    prefetch is set, in which case up to that many pages are fetched in the background while the caller consumes the
+    current one.
+
+    Once the first page tells how many pages there are, the following ones are independent: with parallel set, they
+    are fetched concurrently by that many workers. Entries are still yielded in page order, and no more requests are
+    sent than the rate limit reported by the last response allows; when it runs out, the iteration waits for the rate
+    limit window to reset.
+
+    records = iterate(client.zones.list_records, 1010, 'example.com', sort='id:asc', prefetch=1)
+    domains = iterate(client.domains.list_domains, 1010, parallel=8)
+
+    :param list_method: callable
+        The service method listing the entries (i.e. client.zones.list_records). It must accept the page and
+        per_page keyword arguments and return a dnsimple.Response.
+    :param args:
+        The positional arguments passed to the list method
+    :param per_page: int
+        The number of entries to request per page (default: 100, the maximum allowed)
+    :param prefetch: int
+        The number of pages to fetch ahead of the one being consumed (default: 0, no prefetch)
+    :param parallel: int
+        The number of pages to fetch concurrently (default: None, one at a time)
+    :param kwargs:
+        The keyword arguments passed to the list method (i.e. sort, filter)
+
+    :return: generator
+        The entries of every page, in order
+    """
+    response = list_method(*args, page=1, per_page=per_page, **kwargs)
+    total_pages = 1 if response.pagination is None else response.pagination.total_pages
+
+    window = max(prefetch, parallel or 0)
+
+    if window <= 0 or total_pages <= 1:
+        yield from response.data
+        for page in range(2, total_pages + 1):
+            yield from list_method(*args, page=page, per_page=per_page, **kwargs).data
+        return
+
+    executor = ThreadPoolExecutor(max_workers=parallel or 1)
+    pending = deque()
+    next_page = 2
+    remaining = response.rate_limit_remaining
+    rate_limit_reset = response.rate_limit_reset
+
+    def fetch_ahead():
+        nonlocal next_page, remaining
+        while next_page <= total_pages and len(pending) < window:
+            if remaining <= 0:
+                if pending:
+                    return
+                time.sleep(max(0, rate_limit_reset - time.time()))
+                remaining = response.rate_limit
+            pending.append(executor.submit(list_method, *args, page=next_page, per_page=per_page, **kwargs))
+            next_page += 1
+            remaining -= 1
+
+    try:
+        fetch_ahead()
+        yield from response.data
+        while pending:
+            response = pending.popleft().result()
+            remaining = response.rate_limit_remaining - len(pending)
+            rate_limit_reset = response.rate_limit_reset
+            fetch_ahead()
+            yield from response.data
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
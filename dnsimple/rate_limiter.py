@@ -0,0 +1,230 @@
+import hashlib
+import threading
+import time
+from collections import deque
+
+from dnsimple.exceptions import RateLimitExceeded
+
+
+class RateLimitState(object):
+    """
+    The rate limit budget of one token, as seen by a RateLimiter
+
+    See https://developer.dnsimple.com/v2/#rate-limiting
+    """
+
+    key = None
+    """The key of the budget: for a Client, a fingerprint of its token or email (see credential_key)"""
+    limit = None
+    """The maximum number of requests you can perform per hour, None until a response was received"""
+    remaining = None
+    """The number of requests remaining in the current rate limit window, including those about to be sent"""
+    reset = None
+    """The time at which the current rate limit window resets in Unix time format"""
+    tokens = None
+    """The number of requests that can be sent right away without waiting"""
+    pace = None
+    """The number of requests per second the remaining budget allows until the window resets"""
+    request_rate = None
+    """The number of requests per second sent recently"""
+    projected_drain_time = None
+    """The time, in Unix time format, at which the remaining budget runs out at the current request rate"""
+
+    def __init__(self, **attributes):
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+    @property
+    def will_drain_before_reset(self):
+        """True when the budget runs out before the window resets at the current request rate"""
+        return self.projected_drain_time is not None and self.reset is not None and \
+            self.projected_drain_time < self.reset
+
+
+def credential_key(credential):
+    """
+    Returns the key of the rate limit budget of a token or email, a fingerprint that can be logged without leaking the
+    credential
+
+    :param credential: str
+        The access token, or the email for basic authentication
+    :return: str
+        None when there is no credential
+    """
+    if credential is None:
+        return None
+    return hashlib.sha256(credential.encode('utf-8')).hexdigest()[:16]
+
+
+class RateLimiter(object):
+    """
+    Paces the requests sent to the DNSimple API to stay within the rate limit
+
+    Each token gets a token bucket fed by the X-RateLimit-* headers of the responses: the remaining requests are spread
+    evenly until the window resets, with bursts of up to `burst` requests. When the remaining budget falls to
+    `reserve`, requests wait for the window to reset instead of being rejected with a 429.
+
+    limiter = RateLimiter()
+    client = Client(access_token='SuperSecretToken', rate_limiter=limiter)
+    limiter.state(client.rate_limit_key).projected_drain_time
+
+    The same limiter can be shared between clients (and threads): budgets are tracked per token.
+    """
+
+    def __init__(self, burst=10, reserve=0, block=True, rate_window=60, clock=time.time, sleep=time.sleep):
+        """
+        :param burst: int
+            The number of requests that can be sent back to back before being paced
+        :param reserve: int
+            The number of requests of the budget kept aside: once reached, requests wait for the window to reset
+        :param block: bool
+            Set to false to raise a RateLimitExceeded instead of waiting
+        :param rate_window: int
+            The number of seconds over which the recent request rate is measured
+        :param clock: callable
+            Returns the current Unix time
+        :param sleep: callable
+            Waits the given number of seconds
+        """
+        self.burst = burst
+        self.reserve = reserve
+        self.block = block
+        self.rate_window = rate_window
+        self.clock = clock
+        self.sleep = sleep
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    def acquire(self, key, block=None):
+        """
+        Waits until a request can be sent with the budget of the given token, and takes it from the budget
+
+        :param key: str
+            The key of the budget of the token sending the request (i.e. client.rate_limit_key)
+        :param block: bool
+            Overrides the limiter block setting for this request
+
+        :return: float
+            The number of seconds waited
+
+        :raises RateLimitExceeded
+            When not blocking and the request would have to wait
+        """
+        block = self.block if block is None else block
+        waited = 0.0
+
+        while True:
+            with self.__lock:
+                bucket = self.__bucket(key)
+                delay = bucket.delay(self.clock(), self.reserve)
+                if delay <= 0:
+                    bucket.take(self.clock())
+                    return waited
+
+            if not block:
+                raise RateLimitExceeded(retry_after=delay)
+
+            self.sleep(delay)
+            waited += delay
+
+    def update(self, key, headers):
+        """
+        Updates the budget of a token from the headers of a response
+
+        :param key: str
+            The key of the budget of the token that sent the request (i.e. client.rate_limit_key)
+        :param headers: dict
+            The HTTP headers of the response
+        """
+        try:
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = int(headers['X-RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self.__lock:
+            self.__bucket(key).update(self.clock(), limit, remaining, reset)
+
+    def state(self, key):
+        """
+        Returns the rate limit budget of a token
+
+        :param key: str
+            The key of the budget (i.e. client.rate_limit_key, a fingerprint of the token)
+
+        :return: RateLimitState
+        """
+        with self.__lock:
+            return self.__bucket(key).state(key, self.clock(), self.reserve)
+
+    def __bucket(self, key):
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            bucket = self.__buckets[key] = _TokenBucket(self.burst, self.rate_window)
+        return bucket
+
+
+class _TokenBucket(object):
+    def __init__(self, burst, rate_window):
+        self.burst = burst
+        self.rate_window = rate_window
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self.tokens = float(burst)
+        self.refilled_at = None
+        self.sent = deque()
+
+    def pace(self, now, reserve):
+        if self.remaining is None:
+            return None
+        return max(self.remaining - reserve, 0) / max(self.reset - now, 1)
+
+    def refill(self, now, reserve):
+        pace = self.pace(now, reserve)
+        if pace is not None and self.refilled_at is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * pace)
+        self.refilled_at = now
+
+    def delay(self, now, reserve):
+        if self.remaining is None:
+            return 0
+        if self.reset <= now:
+            self.remaining = self.limit
+            self.reset = now + 3600
+            self.tokens = float(self.burst)
+
+        self.refill(now, reserve)
+        if self.remaining <= reserve:
+            return self.reset - now
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.pace(now, reserve)
+
+    def take(self, now):
+        self.sent.append(now)
+        if self.remaining is not None:
+            self.tokens -= 1
+            self.remaining -= 1
+
+    def update(self, now, limit, remaining, reset):
+        self.refill(now, 0)
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+
+    def request_rate(self, now):
+        while self.sent and self.sent[0] < now - self.rate_window:
+            self.sent.popleft()
+        return len(self.sent) / self.rate_window
+
+    def state(self, key, now, reserve):
+        request_rate = self.request_rate(now)
+        projected_drain_time = None
+        if self.remaining is not None and request_rate > 0:
+            projected_drain_time = now + max(self.remaining - reserve, 0) / request_rate
+
+        return RateLimitState(key=key, limit=self.limit, remaining=self.remaining, reset=self.reset,
+                              tokens=self.tokens, pace=self.pace(now, reserve), request_rate=request_rate,
+                              projected_drain_time=projected_drain_time)
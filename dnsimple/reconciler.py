@@ -0,0 +1,248 @@
+from dnsimple.struct import (
+    BatchChangeZoneRecordsCreateInput,
+    BatchChangeZoneRecordsDeleteInput,
+    BatchChangeZoneRecordsInput,
+    BatchChangeZoneRecordsUpdateInput,
+)
+
+
+def record_key(record):
+    """
+    Returns the identity of a record in a reconciliation: its name, type and content
+
+    :param record: dnsimple.struct.ZoneRecord|dnsimple.struct.ZoneRecordInput|dict
+        The record, either fetched from the API or desired
+    :return: tuple
+        (name, type, content)
+    """
+    if isinstance(record, dict):
+        return record['name'], record['type'].upper(), record['content']
+    return record.name, record.type.upper(), record.content
+
+
+def _attribute(record, name):
+    return record.get(name) if isinstance(record, dict) else getattr(record, name, None)
+
+
+def _changes(current, desired):
+    """Returns the ttl, priority and regions of the desired record that differ from the current one"""
+    changes = {}
+    for name in ('ttl', 'priority', 'regions'):
+        value = _attribute(desired, name)
+        if value is None:
+            continue
+        current_value = _attribute(current, name)
+        if name == 'regions':
+            if current_value is None or sorted(value) != sorted(current_value):
+                changes[name] = value
+        elif value != current_value:
+            changes[name] = value
+    return changes
+
+
+class RecordUpdate(object):
+    """A record of the zone changed in place by a reconciliation"""
+
+    record = None
+    """The record as it currently is (dnsimple.struct.ZoneRecord)"""
+    desired = None
+    """The record as it should be"""
+    changes = None
+    """The attributes sent in the update, by name"""
+
+    def __init__(self, record, desired, changes):
+        self.record = record
+        self.desired = desired
+        self.changes = changes
+
+    def to_input(self):
+        """
+        :return: dnsimple.struct.BatchChangeZoneRecordsUpdateInput
+        """
+        return BatchChangeZoneRecordsUpdateInput(self.record.id, **self.changes)
+
+
+class ReconciliationPlan(object):
+    """
+    The changes turning the records of a zone into a desired record set
+
+    Built by ZoneReconciler.plan (or diff_records) and applied with a single batch change. str(plan) describes the
+    changes one per line, which is what a dry run prints.
+    """
+
+    creates = None
+    """The desired records missing from the zone"""
+    updates = None
+    """The records whose content, ttl, priority or regions change (RecordUpdate)"""
+    deletes = None
+    """The records of the zone not in the desired record set (dnsimple.struct.ZoneRecord)"""
+    unchanged = 0
+    """The number of records already as desired"""
+
+    def __init__(self, creates=None, updates=None, deletes=None, unchanged=0):
+        self.creates = creates or []
+        self.updates = updates or []
+        self.deletes = deletes or []
+        self.unchanged = unchanged
+
+    def __len__(self):
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __str__(self):
+        return '\n'.join(self.describe())
+
+    def describe(self):
+        """
+        Describes the changes of the plan, deletes first as the API applies them
+
+        :return: list
+            One line per change: '- ' for a delete, '~ ' for an update and '+ ' for a create
+        """
+        def label(record):
+            name, type, content = record_key(record)
+            return '{name} {type} {content}'.format(name=name or '@', type=type, content=content)
+
+        lines = ['- {record}'.format(record=label(record)) for record in self.deletes]
+        for update in self.updates:
+            lines.append('~ {record} ({changes})'.format(record=label(update.record), changes=', '.join(
+                '{name}: {old!r} -> {new!r}'.format(name=name, old=_attribute(update.record, name), new=value)
+                for name, value in update.changes.items())))
+        lines.extend('+ {record}'.format(record=label(record)) for record in self.creates)
+        lines.append('{creates} to create, {updates} to update, {deletes} to delete, {unchanged} unchanged'.format(
+            creates=len(self.creates), updates=len(self.updates), deletes=len(self.deletes), unchanged=self.unchanged))
+        return lines
+
+    def to_batch_change(self):
+        """
+        :return: dnsimple.struct.BatchChangeZoneRecordsInput
+            The batch change applying the plan, with only the operations it contains
+        """
+        creates = [BatchChangeZoneRecordsCreateInput(_attribute(record, 'name'), record_key(record)[1],
+                                                     _attribute(record, 'content'), ttl=_attribute(record, 'ttl'),
+                                                     priority=_attribute(record, 'priority'),
+                                                     regions=_attribute(record, 'regions'))
+                   for record in self.creates]
+        updates = [update.to_input() for update in self.updates]
+        deletes = [BatchChangeZoneRecordsDeleteInput(record.id) for record in self.deletes]
+        return BatchChangeZoneRecordsInput(creates=creates or None, updates=updates or None, deletes=deletes or None)
+
+
+def diff_records(current, desired, prune=True):
+    """
+    Computes the minimal plan turning the current records of a zone into the desired ones
+
+    Records are matched on (name, type, content): a matching record is updated when its ttl, priority or regions
+    differ (attributes left to None in the desired record are not compared). The remaining records of a name and
+    type are then paired, so that a changed content is one update rather than a delete and a create. System records
+    (SOA, apex NS) are read-only and never changed.
+
+    :param current: iterable
+        The records of the zone (dnsimple.struct.ZoneRecord)
+    :param desired: iterable
+        The desired records (dnsimple.struct.ZoneRecordInput, dicts or ZoneRecord)
+    :param prune: bool
+        Set to false to keep the records of the zone missing from the desired set
+
+    :return: ReconciliationPlan
+    """
+    wanted = {}
+    for record in desired:
+        wanted[record_key(record)] = record
+
+    plan = ReconciliationPlan()
+    leftovers = {}
+    for record in current:
+        if record.system_record:
+            wanted.pop(record_key(record), None)
+            continue
+        key = record_key(record)
+        target = wanted.pop(key, None)
+        if target is None:
+            if prune:
+                leftovers.setdefault(key[:2], []).append(record)
+            continue
+        changes = _changes(record, target)
+        if changes:
+            plan.updates.append(RecordUpdate(record, target, changes))
+        else:
+            plan.unchanged += 1
+
+    for key, target in wanted.items():
+        candidates = leftovers.get(key[:2])
+        if not candidates:
+            plan.creates.append(target)
+            continue
+        record = candidates.pop()
+        changes = {'content': key[2], **_changes(record, target)}
+        plan.updates.append(RecordUpdate(record, target, changes))
+
+    for records in leftovers.values():
+        plan.deletes.extend(records)
+    return plan
+
+
+class ZoneReconciler(object):
+    """
+    Reconciles the records of zones with desired record sets
+
+    Fetches the records of a zone, computes the minimal create/update/delete plan (see diff_records) and applies it
+    with a single batch change (Zones.batch_change_records).
+
+    reconciler = ZoneReconciler(client)
+    print(reconciler.plan(1010, 'example.com', records))
+    reconciler.apply(1010, 'example.com', records)
+    """
+
+    def __init__(self, client, prune=True, parallel=None):
+        """
+        :param client: dnsimple.Client
+            The client used to fetch and change the records
+        :param prune: bool
+            Set to false to keep the records of the zone missing from the desired set
+        :param parallel: int
+            The number of pages of records fetched concurrently (default: None, one at a time)
+        """
+        self.client = client
+        self.prune = prune
+        self.parallel = parallel
+
+    def plan(self, account_id, zone, desired):
+        """
+        Computes the changes to make, without making them
+
+        :param account_id: int
+            The account ID
+        :param zone: str
+            The zone name
+        :param desired: iterable
+            The desired records (dnsimple.struct.ZoneRecordInput, dicts or ZoneRecord)
+
+        :return: ReconciliationPlan
+        """
+        current = self.client.zones.iter_records(account_id, zone, parallel=self.parallel)
+        return diff_records(current, desired, prune=self.prune)
+
+    def apply(self, account_id, zone, desired, dry_run=False):
+        """
+        Makes the records of a zone match the desired ones
+
+        :param account_id: int
+            The account ID
+        :param zone: str
+            The zone name
+        :param desired: iterable
+            The desired records (dnsimple.struct.ZoneRecordInput, dicts or ZoneRecord)
+        :param dry_run: bool
+            Set to true to only compute the plan
+
+        :return: tuple
+            The ReconciliationPlan, and the dnsimple.Response of the batch change (None on a dry run or when there
+            is nothing to change)
+        """
+        plan = self.plan(account_id, zone, desired)
+        if dry_run or not plan:
+            return plan, None
+        return plan, self.client.zones.batch_change_records(account_id, zone, plan.to_batch_change())
@@ -0,0 +1,185 @@
+from dnsimple.response import Response
+from dnsimple.struct import ZoneRecord
+
+RECORD_EVENTS = frozenset(['zone_record.create', 'zone_record.update', 'zone_record.delete'])
+"""The webhook events changing a zone record"""
+
+
+class ZoneRecordIndex(object):
+    """
+    Holds zone records in memory with hash indexes on their id, (zone, name, type), content and zone
+
+    Lookups take constant time whatever the number of records, and the index is kept up to date record by record from
+    webhook events or batch change responses instead of being rebuilt.
+
+    index = ZoneRecordIndex(client.zones.iter_records(1010, 'example.com'))
+    index.find('example.com', 'www', 'CNAME')
+    index.with_content('192.0.2.1')
+    index.apply_event(json.loads(webhook_body))
+    """
+
+    def __init__(self, records=None, struct=ZoneRecord):
+        """
+        :param records: iterable
+            The records to index (dnsimple.struct.ZoneRecord or a compatible struct)
+        :param struct: class
+            The struct built for the records of webhook events
+        """
+        self.struct = struct
+        self.__records = {}
+        self.__by_name = {}
+        self.__by_content = {}
+        self.__by_zone = {}
+        if records is not None:
+            self.update(records)
+
+    def __len__(self):
+        return len(self.__records)
+
+    def __contains__(self, record_id):
+        return record_id in self.__records
+
+    def __iter__(self):
+        return iter(self.__records.values())
+
+    def get(self, record_id):
+        """
+        :param record_id: int
+            The record ID
+        :return: dnsimple.struct.ZoneRecord
+            The record, or None when it is not indexed
+        """
+        return self.__records.get(record_id)
+
+    def find(self, zone, name, type):
+        """
+        Returns the records of a name and type
+
+        :param zone: str
+            The zone name (the zone_id of the records)
+        :param name: str
+            The record name, relative to the zone ('' for the apex)
+        :param type: str
+            The record type (i.e. CNAME)
+        :return: list
+        """
+        return list(self.__by_name.get((zone, name, type.upper()), {}).values())
+
+    def with_content(self, content):
+        """
+        Returns the records with the given content
+
+        :param content: str
+            The record content (i.e. 192.0.2.1)
+        :return: list
+        """
+        return list(self.__by_content.get(content, {}).values())
+
+    def in_zone(self, zone):
+        """
+        Returns the records of a zone
+
+        :param zone: str
+            The zone name (the zone_id of the records)
+        :return: list
+        """
+        return list(self.__by_zone.get(zone, {}).values())
+
+    def upsert(self, record):
+        """
+        Adds a record, or replaces the indexed record with the same ID
+
+        :param record: dnsimple.struct.ZoneRecord
+            The record, with its ID
+
+        :raises ValueError
+            When the record has no ID
+        """
+        if record.id is None:
+            raise ValueError('Only records with an ID can be indexed')
+        self.remove(record.id)
+        self.__records[record.id] = record
+        self.__by_name.setdefault((record.zone_id, record.name, record.type.upper()), {})[record.id] = record
+        self.__by_content.setdefault(record.content, {})[record.id] = record
+        self.__by_zone.setdefault(record.zone_id, {})[record.id] = record
+
+    def update(self, records):
+        """
+        Upserts several records
+
+        :param records: iterable
+        """
+        for record in records:
+            self.upsert(record)
+
+    def remove(self, record_id):
+        """
+        Removes a record
+
+        :param record_id: int
+            The record ID
+        :return: dnsimple.struct.ZoneRecord
+            The record removed, or None when it was not indexed
+        """
+        record = self.__records.pop(record_id, None)
+        if record is not None:
+            _discard(self.__by_name, (record.zone_id, record.name, record.type.upper()), record_id)
+            _discard(self.__by_content, record.content, record_id)
+            _discard(self.__by_zone, record.zone_id, record_id)
+        return record
+
+    def remove_zone(self, zone):
+        """
+        Removes the records of a zone
+
+        :param zone: str
+            The zone name
+        :return: int
+            The number of records removed
+        """
+        record_ids = list(self.__by_zone.get(zone, {}))
+        for record_id in record_ids:
+            self.remove(record_id)
+        return len(record_ids)
+
+    def apply_event(self, event):
+        """
+        Applies a zone_record.create, zone_record.update or zone_record.delete webhook event
+
+        See https://developer.dnsimple.com/v2/webhooks/events/
+
+        :param event: dict
+            The decoded webhook payload
+        :return: bool
+            True when the event changed a zone record, False for the other events
+        """
+        if event.get('name') not in RECORD_EVENTS:
+            return False
+        data = event['data']['zone_record']
+        if event['name'] == 'zone_record.delete':
+            self.remove(data['id'])
+        else:
+            self.upsert(self.struct(data))
+        return True
+
+    def apply_batch(self, batch_change):
+        """
+        Applies the result of a batch change
+
+        :param batch_change: dnsimple.Response|dnsimple.struct.BatchChangeZoneRecordsResponse
+            The response of Zones.batch_change_records, or its data (i.e. BatchExecutor merged response)
+        """
+        if isinstance(batch_change, Response):
+            batch_change = batch_change.data
+        for deleted in batch_change.deletes or []:
+            self.remove(deleted.id)
+        self.update(batch_change.updates or [])
+        self.update(batch_change.creates or [])
+
+
+def _discard(index, key, record_id):
+    records = index.get(key)
+    if records is not None:
+        records.pop(record_id, None)
+        if not records:
+            del index[key]
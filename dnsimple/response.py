@@ -1,5 +1,6 @@
 from dnsimple import DNSimpleException
 from dnsimple.extra import attach_attributes_to, return_list_of, return_list_with_headers_of
+from dnsimple.json_backend import decode
 
 
 class Response(object):
@@ -36,42 +37,51 @@ class Response(object):
             When the server responds with an error code
         """
         if int(http_response.status_code) in range(400, 504):
-            if http_response.text != '':
-                message = http_response.json().get('message')
-                attribute_errors = http_response.json().get('errors')
+            if http_response.content:
+                try:
+                    payload = decode(http_response)
+                except ValueError:
+                    # Errors raised by proxies in front of the API (i.e. 502 Bad Gateway) come as HTML
+                    raise DNSimpleException(http_response=http_response)
+                message = payload.get('message')
+                attribute_errors = payload.get('errors')
                 raise DNSimpleException(message=message, attribute_errors=attribute_errors, http_response=http_response)
 
             raise DNSimpleException(http_response=http_response)
 
-        self.__class__.http_response = http_response
-        self.__class__.headers = self.__class__.http_response.headers
-        self.__class__.rate_limit = int(self.__class__.headers['X-RateLimit-Limit'])
-        self.__class__.rate_limit_remaining = int(self.__class__.headers['X-RateLimit-Remaining'])
-        self.__class__.rate_limit_reset = int(self.__class__.headers['X-RateLimit-Reset'])
+        self.http_response = http_response
+        self.headers = http_response.headers
+        self.rate_limit = int(self.headers['X-RateLimit-Limit'])
+        self.rate_limit_remaining = int(self.headers['X-RateLimit-Remaining'])
+        self.rate_limit_reset = int(self.headers['X-RateLimit-Reset'])
 
         self.add_data(obj, http_response)
 
         # TODO Check response body is not empty as workaround for bug where server sends empty response despite having Content-Type: application/json, causing parser to crash.
-        if http_response.status_code != 204 and http_response.text != '':
-            self.__class__.pagination = None if http_response.json().get('pagination') is None else Pagination(
-                http_response.json().get('pagination'))
+        if http_response.status_code != 204 and http_response.content:
+            payload = decode(http_response)
+            self.pagination = None if payload.get('pagination') is None else Pagination(payload.get('pagination'))
 
     def add_data(self, obj, http_response):
         raw_json = None
 
+        structs = getattr(http_response, 'structs', None)
+        if structs:
+            obj = structs.get(obj, obj)
+
         if obj is not None:
-            raw_json = http_response.json()
+            raw_json = decode(http_response)
         if obj is None:
-            self.__class__.data = None
+            self.data = None
         elif 'data' not in raw_json:
-            self.__class__.data = obj(raw_json)
+            self.data = obj(raw_json)
         elif type(raw_json.get('data')) is list:
-            self.__class__.data = return_list_of(obj, raw_json.get('data'))
+            self.data = return_list_of(obj, raw_json.get('data'))
         elif type(raw_json.get('data')) is dict and type(raw_json.get('data').get('rows')) is list and type(raw_json.get('data').get('headers')) is list:
-            self.__class__.data = return_list_with_headers_of(obj, raw_json.get('data').get('rows'),
-                                                              raw_json.get('data').get('headers'))
+            self.data = return_list_with_headers_of(obj, raw_json.get('data').get('rows'),
+                                                    raw_json.get('data').get('headers'))
         else:
-            self.__class__.data = obj(raw_json.get('data'))
+            self.data = obj(raw_json.get('data'))
 
 
 class Pagination(object):
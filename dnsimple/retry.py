@@ -0,0 +1,152 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+"""The HTTP methods that can be sent again without side effects"""
+
+
+class RetryMetrics(object):
+    """Counters of the retries performed by a RetryPolicy"""
+
+    retries = 0
+    """The number of requests sent again"""
+    exhausted = 0
+    """The number of requests that failed on every attempt"""
+    waited = 0.0
+    """The total number of seconds waited before retrying"""
+    reasons = None
+    """The number of retries per reason: the HTTP status code or the exception class name"""
+
+    def __init__(self):
+        self.reasons = Counter()
+        self.__lock = threading.Lock()
+
+    def record_retry(self, reason, delay):
+        with self.__lock:
+            self.retries += 1
+            self.waited += delay
+            self.reasons[reason] += 1
+
+    def record_exhausted(self):
+        with self.__lock:
+            self.exhausted += 1
+
+
+class RetryPolicy(object):
+    """
+    Decides whether and when a failed request to the DNSimple API is sent again
+
+    Rate limited (429) and unavailable (502, 503, 504) responses, as well as connection errors, are retried with an
+    exponential backoff and full jitter. A Retry-After header, or X-RateLimit-Reset for a 429, sets the delay instead.
+
+    Only idempotent methods are retried blindly: a POST or PATCH is only sent again when the server certainly did not
+    process it, that is on a 429 or when the connection could not be established.
+
+    client = Client(access_token='SuperSecretToken', retry=RetryPolicy(max_attempts=5))
+    client.retry.metrics.retries
+    """
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30, max_retry_after=300,
+                 retry_statuses=(429, 502, 503, 504), idempotent_methods=IDEMPOTENT_METHODS, jitter=True,
+                 clock=time.time, sleep=time.sleep):
+        """
+        :param max_attempts: int
+            The maximum number of times a request is sent, including the first one
+        :param backoff_factor: float
+            The delay before the first retry, doubled on every following one
+        :param max_backoff: float
+            The maximum delay computed by the exponential backoff, in seconds
+        :param max_retry_after: float
+            The maximum delay requested by the server (Retry-After, X-RateLimit-Reset) the policy waits for; beyond it
+            the failure is returned as is
+        :param retry_statuses: tuple
+            The HTTP status codes that are retried
+        :param idempotent_methods: set
+            The HTTP methods retried on any retryable failure
+        :param jitter: bool
+            Set to false to wait the exact backoff instead of a random delay up to it
+        :param clock: callable
+            Returns the current Unix time
+        :param sleep: callable
+            Waits the given number of seconds, used by the synchronous client
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(idempotent_methods)
+        self.jitter = jitter
+        self.clock = clock
+        self.sleep = sleep
+        self.metrics = RetryMetrics()
+
+    def retry_delay(self, method, attempt, response=None, error=None, connect_error=False):
+        """
+        Returns how long to wait before sending a failed request again
+
+        :param method: str
+            The HTTP method of the request
+        :param attempt: int
+            The number of times the request was sent
+        :param response: requests.Response|httpx.Response
+            The response received, when there is one
+        :param error: Exception
+            The exception raised while sending the request, when there is one
+        :param connect_error: bool
+            True when the error happened before the request reached the server
+
+        :return: float
+            The number of seconds to wait, or None when the request must not be retried
+        """
+        if response is not None:
+            if response.status_code not in self.retry_statuses:
+                return None
+            if response.status_code != 429 and method not in self.idempotent_methods:
+                return None
+            reason = response.status_code
+        elif error is not None:
+            if not connect_error and method not in self.idempotent_methods:
+                return None
+            reason = type(error).__name__
+        else:
+            return None
+
+        if attempt >= self.max_attempts:
+            self.metrics.record_exhausted()
+            return None
+
+        delay = None if response is None else self.__requested_delay(response)
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+        elif delay > self.max_retry_after:
+            self.metrics.record_exhausted()
+            return None
+
+        self.metrics.record_retry(reason, delay)
+        return delay
+
+    def __requested_delay(self, response):
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - self.clock())
+                except (TypeError, ValueError):
+                    pass
+
+        rate_limit_reset = response.headers.get('X-RateLimit-Reset')
+        if response.status_code == 429 and rate_limit_reset is not None:
+            try:
+                return max(0.0, float(rate_limit_reset) - self.clock())
+            except ValueError:
+                pass
+
+        return None
@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import Account
 
 
@@ -19,4 +18,4 @@ class Accounts(object):
             The response containing the list of accounts.
         """
         response = self.client.get('/accounts')
-        return Response(response, Account)
+        return self.client.response(response, Account)
@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import Charge
 
 class Billing(object):
@@ -15,4 +14,4 @@ class Billing(object):
             The account id
         """
         response = self.client.get(f'/{account}/billing/charges', params={"start_date": start_date, "end_date": end_date, "sort": sort})
-        return Response(response, Charge)
+        return self.client.response(response, Charge)
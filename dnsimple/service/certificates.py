@@ -1,4 +1,4 @@
-from dnsimple.response import Response
+from dnsimple.paginator import MAX_PER_PAGE
 from dnsimple.struct import Certificate, CertificateBundle, CertificatePurchase, CertificateRenewal, LetsencryptCertificateInput, LetsencryptCertificateRenewalInput
 
 
@@ -27,7 +27,28 @@ class Certificates(object):
             The list of certificates for the domain
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/certificates', page=page, per_page=per_page)
-        return Response(response, Certificate)
+        return self.client.response(response, Certificate)
+
+    def iter_certificates(self, account_id, domain, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the certificates for the domain in the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param domain: int/str
+            The domain name or id
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The certificates for the domain in the account (dnsimple.struct.Certificate)
+        """
+        return self.client.iterate(self.list_certificates, account_id, domain, per_page=per_page, prefetch=prefetch,
+                                   parallel=parallel)
 
     def get_certificate(self, account_id, domain, certificate_id):
         """
@@ -46,7 +67,7 @@ class Certificates(object):
             The certificate requested
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/certificates/{certificate_id}')
-        return Response(response, Certificate)
+        return self.client.response(response, Certificate)
 
     def download_certificate(self, account_id, domain, certificate_id):
         """
@@ -65,7 +86,7 @@ class Certificates(object):
             The certificate in the domain
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/certificates/{certificate_id}/download')
-        return Response(response, CertificateBundle)
+        return self.client.response(response, CertificateBundle)
 
     def get_certificate_private_key(self, account_id, domain, certificate_id):
         """
@@ -84,7 +105,7 @@ class Certificates(object):
             The PEM-encoded certificate private key
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/certificates/{certificate_id}/private_key')
-        return Response(response, CertificateBundle)
+        return self.client.response(response, CertificateBundle)
 
     def purchase_letsencrypt_certificate(self, account_id, domain, certificate_input = LetsencryptCertificateInput()):
         """
@@ -107,7 +128,7 @@ class Certificates(object):
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/certificates/letsencrypt',
                                     data=certificate_input.to_json())
-        return Response(response, CertificatePurchase)
+        return self.client.response(response, CertificatePurchase)
 
     def issue_letsencrypt_certificate(self, account_id, domain, certificate_id):
         """
@@ -129,7 +150,7 @@ class Certificates(object):
             The certificate issued
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/certificates/letsencrypt/{certificate_id}/issue')
-        return Response(response, Certificate)
+        return self.client.response(response, Certificate)
 
     def purchase_letsencrypt_certificate_renewal(self, account_id, domain, certificate_id, certificate_renewal_input = LetsencryptCertificateRenewalInput()):
         """
@@ -148,7 +169,7 @@ class Certificates(object):
             The certificate renewal
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/certificates/letsencrypt/{certificate_id}/renewals', data=certificate_renewal_input.to_json())
-        return Response(response, CertificateRenewal)
+        return self.client.response(response, CertificateRenewal)
 
     def issue_letsencrypt_certificate_renewal(self, account_id, domain, certificate_id, certificate_renewal_id):
         """
@@ -172,4 +193,4 @@ class Certificates(object):
             The certificate to be renewed
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/certificates/letsencrypt/{certificate_id}/renewals/{certificate_renewal_id}/issue')
-        return Response(response, Certificate)
+        return self.client.response(response, Certificate)
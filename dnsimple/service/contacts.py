@@ -1,4 +1,4 @@
-from dnsimple.response import Response
+from dnsimple.paginator import MAX_PER_PAGE
 from dnsimple.struct import Contact
 
 
@@ -29,7 +29,26 @@ class Contacts(object):
             The list of contacts
         """
         response = self.client.get(f'/{account_id}/contacts', page=page, per_page=per_page)
-        return Response(response, Contact)
+        return self.client.response(response, Contact)
+
+    def iter_contacts(self, account_id, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the contacts in the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The contacts in the account (dnsimple.struct.Contact)
+        """
+        return self.client.iterate(self.list_contacts, account_id, per_page=per_page, prefetch=prefetch,
+                                   parallel=parallel)
 
     def create_contact(self, account_id, contact):
         """
@@ -46,7 +65,7 @@ class Contacts(object):
             The newly created contact
         """
         response = self.client.post(f'/{account_id}/contacts', data=contact.to_json())
-        return Response(response, Contact)
+        return self.client.response(response, Contact)
 
     def get_contact(self, account_id, contact_id):
         """
@@ -63,7 +82,7 @@ class Contacts(object):
             The contact
         """
         response = self.client.get(f'/{account_id}/contacts/{contact_id}')
-        return Response(response, Contact)
+        return self.client.response(response, Contact)
 
     def update_contact(self, account_id, contact_id, contact):
         """
@@ -82,7 +101,7 @@ class Contacts(object):
             The updated contact
         """
         response = self.client.patch(f'/{account_id}/contacts/{contact_id}', data=contact.to_json())
-        return Response(response, Contact)
+        return self.client.response(response, Contact)
 
     def delete_contact(self, account_id, contact_id):
         """
@@ -99,4 +118,4 @@ class Contacts(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/contacts/{contact_id}')
-        return Response(response)
+        return self.client.response(response)
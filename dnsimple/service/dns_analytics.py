@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import DnsAnalytics as DnsAnalyticsStruct
 
 
@@ -52,4 +51,29 @@ class DnsAnalytics(object):
         """
         response = self.client.get(f'/{account_id}/dns_analytics', sort=sort, filter=filter, params=params, page=page,
                                    per_page=per_page)
-        return Response(response, DnsAnalyticsStruct)
+        return self.client.response(response, DnsAnalyticsStruct)
+
+    def iter_query(self, account_id, filter=None, sort=None, params=None, per_page=10000, prefetch=0, parallel=None):
+        """
+        Iterates over all the DNS analytics rows of the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param filter: dict
+            Filters to apply to the entries (see query for the possible filters)
+        :param sort: str
+            How to sort the entries (see query for the possible sort criteria)
+        :param params: dict
+            Query params changing the shape of the results (see query)
+        :param per_page: int
+            The number of entries to request per page (default: 10000, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The DNS analytics rows of the account (dnsimple.struct.DnsAnalytics)
+        """
+        return self.client.iterate(self.query, account_id, filter=filter, sort=sort, params=params, per_page=per_page,
+                                   prefetch=prefetch, parallel=parallel)
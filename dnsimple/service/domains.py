@@ -1,7 +1,7 @@
 import json
 import warnings
 
-from dnsimple.response import Response
+from dnsimple.paginator import MAX_PER_PAGE
 from dnsimple.struct import Domain, Dnssec, Collaborator, DelegationSignerRecord, EmailForward, DomainPush
 from dnsimple.service.domains_research import DomainsResearch
 
@@ -47,7 +47,30 @@ class Domains(DomainsResearch):
             A list of domains
         """
         response = self.client.get(f'/{account_id}/domains', sort=sort, filter=filter, page=page, per_page=per_page)
-        return Response(response, Domain)
+        return self.client.response(response, Domain)
+
+    def iter_domains(self, account_id, sort=None, filter=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the domains in the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param sort: str
+            How to sort the entries (see list_domains for the possible sort criteria)
+        :param filter: dict
+            Filters to apply to the entries (see list_domains for the possible filters)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The domains in the account (dnsimple.struct.Domain)
+        """
+        return self.client.iterate(self.list_domains, account_id, sort=sort, filter=filter, per_page=per_page,
+                                   prefetch=prefetch, parallel=parallel)
 
     def create_domain(self, account_id, domain_name):
         """
@@ -63,7 +86,7 @@ class Domains(DomainsResearch):
             The newly created domain
         """
         response = self.client.post(f'/{account_id}/domains', data=json.dumps({'name': domain_name}))
-        return Response(response, Domain)
+        return self.client.response(response, Domain)
 
     def get_domain(self, account_id, domain):
         """
@@ -79,7 +102,7 @@ class Domains(DomainsResearch):
             The domain requested
         """
         response = self.client.get(f'/{account_id}/domains/{domain}')
-        return Response(response, Domain)
+        return self.client.response(response, Domain)
 
     def delete_domain(self, account_id, domain):
         """
@@ -98,7 +121,7 @@ class Domains(DomainsResearch):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/domains/{domain}')
-        return Response(response)
+        return self.client.response(response)
 
     def enable_dnssec(self, account_id, domain):
         """
@@ -116,7 +139,7 @@ class Domains(DomainsResearch):
             The DNSSEC status
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/dnssec')
-        return Response(response, Dnssec)
+        return self.client.response(response, Dnssec)
 
     def disable_dnssec(self, account_id, domain):
         """
@@ -133,7 +156,7 @@ class Domains(DomainsResearch):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/domains/{domain}/dnssec')
-        return Response(response)
+        return self.client.response(response)
 
     def get_dnssec(self, account_id, domain):
         """
@@ -150,7 +173,7 @@ class Domains(DomainsResearch):
             The DNSSEC status requested
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/dnssec')
-        return Response(response, Dnssec)
+        return self.client.response(response, Dnssec)
 
     def list_domain_delegation_signer_records(self, account_id, domain, sort=None, page=None, per_page=None):
         """
@@ -180,7 +203,31 @@ class Domains(DomainsResearch):
             A list of delegation signer records for the domain in the account
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/ds_records', sort=sort, page=page, per_page=per_page)
-        return Response(response, DelegationSignerRecord)
+        return self.client.response(response, DelegationSignerRecord)
+
+    def iter_domain_delegation_signer_records(self, account_id, domain, sort=None, per_page=MAX_PER_PAGE, prefetch=0,
+                                              parallel=None):
+        """
+        Iterates over all the delegation signer records for the domain, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param domain: int/str
+            The domain name or id
+        :param sort: str
+            How to sort the entries (see list_domain_delegation_signer_records for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The delegation signer records for the domain (dnsimple.struct.DelegationSignerRecord)
+        """
+        return self.client.iterate(self.list_domain_delegation_signer_records, account_id, domain, sort=sort,
+                                   per_page=per_page, prefetch=prefetch, parallel=parallel)
 
     def create_domain_delegation_signer_record(self, account_id, domain, ds_input):
         """
@@ -203,7 +250,7 @@ class Domains(DomainsResearch):
             The newly created domain delegation signer record
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/ds_records', data=ds_input.to_json())
-        return Response(response, DelegationSignerRecord)
+        return self.client.response(response, DelegationSignerRecord)
 
     def get_delegation_signer_record(self, account_id, domain, ds_record_id):
         """
@@ -222,7 +269,7 @@ class Domains(DomainsResearch):
             The domain delegation signer record requested
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/ds_records/{ds_record_id}')
-        return Response(response, DelegationSignerRecord)
+        return self.client.response(response, DelegationSignerRecord)
 
     def delete_domain_delegation_signer_record(self, account_id, domain, ds_record_id):
         """
@@ -241,7 +288,7 @@ class Domains(DomainsResearch):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/domains/{domain}/ds_records/{ds_record_id}')
-        return Response(response)
+        return self.client.response(response)
 
     def list_email_forwards(self, account_id, domain, sort=None, page=None, per_page=None):
         """
@@ -271,7 +318,30 @@ class Domains(DomainsResearch):
             The list of email forwards for the domain in the account
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/email_forwards', sort=sort, page=page, per_page=per_page)
-        return Response(response, EmailForward)
+        return self.client.response(response, EmailForward)
+
+    def iter_email_forwards(self, account_id, domain, sort=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the email forwards for the domain, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param domain: int/str
+            The domain name or id
+        :param sort: str
+            How to sort the entries (see list_email_forwards for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The email forwards for the domain (dnsimple.struct.EmailForward)
+        """
+        return self.client.iterate(self.list_email_forwards, account_id, domain, sort=sort, per_page=per_page,
+                                   prefetch=prefetch, parallel=parallel)
 
     def create_email_forward(self, account_id, domain, email_forwards_input):
         """
@@ -290,7 +360,7 @@ class Domains(DomainsResearch):
             The newly created email forward under the domain in the account
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/email_forwards', data=json.dumps({'alias_name': email_forwards_input.alias_name, 'destination_email': email_forwards_input.destination_email}))
-        return Response(response, EmailForward)
+        return self.client.response(response, EmailForward)
 
     def get_email_forward(self, account_id, domain, email_forward_id):
         """
@@ -309,7 +379,7 @@ class Domains(DomainsResearch):
             The email forward requested
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/email_forwards/{email_forward_id}')
-        return Response(response, EmailForward)
+        return self.client.response(response, EmailForward)
 
     def delete_email_forward(self, account_id, domain, email_forward_id):
         """
@@ -328,7 +398,7 @@ class Domains(DomainsResearch):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/domains/{domain}/email_forwards/{email_forward_id}')
-        return Response(response)
+        return self.client.response(response)
 
     def initiate_push(self, account_id, domain, push_input):
         """
@@ -347,7 +417,7 @@ class Domains(DomainsResearch):
             The newly created domain push
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/pushes', data=push_input.to_json())
-        return Response(response, DomainPush)
+        return self.client.response(response, DomainPush)
 
     def list_pushes(self, account_id, page=None, per_page=None):
         """
@@ -366,7 +436,26 @@ class Domains(DomainsResearch):
             The list of pushes for the domain
         """
         response = self.client.get(f'/{account_id}/pushes', page=page, per_page=per_page)
-        return Response(response, DomainPush)
+        return self.client.response(response, DomainPush)
+
+    def iter_pushes(self, account_id, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the pending pushes in the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The pending pushes in the account (dnsimple.struct.DomainPush)
+        """
+        return self.client.iterate(self.list_pushes, account_id, per_page=per_page, prefetch=prefetch,
+                                   parallel=parallel)
 
     def accept_push(self, account_id, push_id, push_input):
         """
@@ -385,7 +474,7 @@ class Domains(DomainsResearch):
             An empty response
         """
         response = self.client.post(f'/{account_id}/pushes/{push_id}', data=push_input.to_json())
-        return Response(response)
+        return self.client.response(response)
 
     def reject_push(self, account_id, push_id):
         """
@@ -402,4 +491,4 @@ class Domains(DomainsResearch):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/pushes/{push_id}')
-        return Response(response)
+        return self.client.response(response)
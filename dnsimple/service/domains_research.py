@@ -1,7 +1,6 @@
 import json
 import warnings
 
-from dnsimple.response import Response
 from dnsimple.struct import DomainResearchStatus
 
 
@@ -29,4 +28,4 @@ class DomainsResearch(object):
             The domain research result
         """
         response = self.client.get(f'/{account_id}/domains/research/status', params={'domain': domain})
-        return Response(response, DomainResearchStatus)
+        return self.client.response(response, DomainResearchStatus)
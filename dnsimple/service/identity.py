@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import Whoami
 
 
@@ -28,4 +27,4 @@ class Identity(object):
             A response containing the details of the authenticated entity
         """
         response = self.client.get('/whoami')
-        return Response(response, Whoami)
+        return self.client.response(response, Whoami)
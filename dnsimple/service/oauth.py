@@ -2,7 +2,6 @@ from urllib.parse import urljoin
 
 import urllib.parse
 
-from dnsimple.response import Response
 from dnsimple.struct import AccessToken
 
 
@@ -36,7 +35,7 @@ class Oauth(object):
                                                                  'client_secret': client_secret, 'state': state,
                                                                  'redirect_uri': redirect_uri,
                                                                  'grant_type': 'authorization_code'})
-        return Response(response, AccessToken)
+        return self.client.response(response, AccessToken)
 
     def authorize_url(self, client_id, redirect_uri=None, state=None, scope=None):
         """
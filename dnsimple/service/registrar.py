@@ -1,6 +1,5 @@
 import json
 
-from dnsimple.response import Response
 from dnsimple.struct import DomainCheck, DomainRegistration, DomainTransfer, DomainRenewal, DomainRestore, RegistrantChange, VanityNameServer, WhoisPrivacy, DomainPrice, CheckRegistrantChangeInput, CreateRegistrantChangeInput, RegistrantChangeCheck, DomainTransferLock
 
 
@@ -29,7 +28,7 @@ class Registrar(object):
             The domain check result
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/check')
-        return Response(response, DomainCheck)
+        return self.client.response(response, DomainCheck)
 
     def get_domain_prices(self, account_id, domain):
         """
@@ -46,7 +45,7 @@ class Registrar(object):
             The domain prices
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/prices')
-        return Response(response, DomainPrice)
+        return self.client.response(response, DomainPrice)
 
     def get_domain_registration(self, account_id, domain, domain_registration):
         """
@@ -65,7 +64,7 @@ class Registrar(object):
             The domain registration
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/registrations/{domain_registration}')
-        return Response(response, DomainRegistration)
+        return self.client.response(response, DomainRegistration)
 
     def get_domain_renewal(self, account_id, domain, domain_renewal):
         """
@@ -84,7 +83,7 @@ class Registrar(object):
             The domain renewal
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/renewals/{domain_renewal}')
-        return Response(response, DomainRenewal)
+        return self.client.response(response, DomainRenewal)
 
     def register_domain(self, account_id, domain, request):
         """
@@ -103,7 +102,7 @@ class Registrar(object):
             The newly registered domain
         """
         response = self.client.post(f'/{account_id}/registrar/domains/{domain}/registrations', request.to_json())
-        return Response(response, DomainRegistration)
+        return self.client.response(response, DomainRegistration)
 
     def transfer_domain(self, account_id, domain, request):
         """
@@ -122,7 +121,7 @@ class Registrar(object):
             The domain transfer
         """
         response = self.client.post(f'/{account_id}/registrar/domains/{domain}/transfers', request.to_json())
-        return Response(response, DomainTransfer)
+        return self.client.response(response, DomainTransfer)
 
     def get_domain_transfer(self, account_id, domain, domain_transfer):
         """
@@ -141,7 +140,7 @@ class Registrar(object):
             The details of an existing domain transfer
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/transfers/{domain_transfer}')
-        return Response(response, DomainTransfer)
+        return self.client.response(response, DomainTransfer)
 
     def cancel_domain_transfer(self, account_id, domain, domain_transfer):
         """
@@ -160,7 +159,7 @@ class Registrar(object):
             The details of the domain transfer
         """
         response = self.client.delete(f'/{account_id}/registrar/domains/{domain}/transfers/{domain_transfer}')
-        return Response(response, DomainTransfer)
+        return self.client.response(response, DomainTransfer)
 
     def renew_domain(self, account_id, domain, request):
         """
@@ -182,7 +181,7 @@ class Registrar(object):
             The domain renewal
         """
         response = self.client.post(f'/{account_id}/registrar/domains/{domain}/renewals', request.to_json())
-        return Response(response, DomainRenewal)
+        return self.client.response(response, DomainRenewal)
 
     def transfer_domain_out(self, account_id, domain):
         """
@@ -200,7 +199,7 @@ class Registrar(object):
             An empty response
         """
         response = self.client.post(f'/{account_id}/registrar/domains/{domain}/authorize_transfer_out')
-        return Response(response)
+        return self.client.response(response)
 
     def get_domain_delegation(self, account_id, domain):
         """
@@ -217,7 +216,7 @@ class Registrar(object):
             The list of name servers
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/delegation')
-        return Response(response, str)
+        return self.client.response(response, str)
 
     def change_domain_delegation(self, account_id, domain, new_delegation):
         """
@@ -236,7 +235,7 @@ class Registrar(object):
             The list of name servers
         """
         response = self.client.put(f'/{account_id}/registrar/domains/{domain}/delegation', data=json.dumps(new_delegation))
-        return Response(response, str)
+        return self.client.response(response, str)
 
     def change_domain_delegation_to_vanity(self, account_id, domain, new_delegation):
         """
@@ -258,7 +257,7 @@ class Registrar(object):
             The list of name servers
         """
         response = self.client.put(f'/{account_id}/registrar/domains/{domain}/delegation/vanity', data=json.dumps(new_delegation))
-        return Response(response, VanityNameServer)
+        return self.client.response(response, VanityNameServer)
 
     def change_domain_delegation_from_vanity(self, account_id, domain):
         """
@@ -278,7 +277,7 @@ class Registrar(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/registrar/domains/{domain}/delegation/vanity')
-        return Response(response)
+        return self.client.response(response)
 
     def enable_domain_auto_renewal(self, account_id, domain):
         """
@@ -295,7 +294,7 @@ class Registrar(object):
             An empty response
         """
         response = self.client.put(f'/{account_id}/registrar/domains/{domain}/auto_renewal')
-        return Response(response)
+        return self.client.response(response)
 
     def disable_domain_auto_renewal(self, account_id, domain):
         """
@@ -312,7 +311,7 @@ class Registrar(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/registrar/domains/{domain}/auto_renewal')
-        return Response(response)
+        return self.client.response(response)
 
     def enable_whois_privacy(self, account_id, domain):
         """
@@ -334,7 +333,7 @@ class Registrar(object):
             The whois privacy
         """
         response = self.client.put(f'/{account_id}/registrar/domains/{domain}/whois_privacy')
-        return Response(response, WhoisPrivacy)
+        return self.client.response(response, WhoisPrivacy)
 
     def disable_whois_privacy(self, account_id, domain):
         """
@@ -355,7 +354,7 @@ class Registrar(object):
             The whois privacy
         """
         response = self.client.delete(f'/{account_id}/registrar/domains/{domain}/whois_privacy')
-        return Response(response, WhoisPrivacy)
+        return self.client.response(response, WhoisPrivacy)
 
     def list_registrant_changes(self, account: int, options=None):
         """
@@ -369,7 +368,7 @@ class Registrar(object):
             Optional query parameters to filter and sort the results.
         """
         response = self.client.get(f"/{account}/registrar/registrant_changes", params=options)
-        return Response(response, RegistrantChange)
+        return self.client.response(response, RegistrantChange)
 
     def create_registrant_change(
         self, account: int, input: CreateRegistrantChangeInput
@@ -383,7 +382,7 @@ class Registrar(object):
             The account id
         """
         response = self.client.post(f"/{account}/registrar/registrant_changes", data=input.to_json())
-        return Response(response, RegistrantChange)
+        return self.client.response(response, RegistrantChange)
 
     def check_registrant_change(
         self, account: int, input: CheckRegistrantChangeInput
@@ -397,7 +396,7 @@ class Registrar(object):
             The account id
         """
         response = self.client.post(f"/{account}/registrar/registrant_changes/check", data=input.to_json())
-        return Response(response, RegistrantChangeCheck)
+        return self.client.response(response, RegistrantChangeCheck)
 
     def get_registrant_change(self, account: int, registrantchange: int):
         """
@@ -413,7 +412,7 @@ class Registrar(object):
         response = self.client.get(
             f"/{account}/registrar/registrant_changes/{registrantchange}"
         )
-        return Response(response, RegistrantChange)
+        return self.client.response(response, RegistrantChange)
 
     def delete_registrant_change(self, account: int, registrantchange: int):
         """
@@ -429,7 +428,7 @@ class Registrar(object):
         response = self.client.delete(
             f"/{account}/registrar/registrant_changes/{registrantchange}"
         )
-        return Response(
+        return self.client.response(
             response,
         )
 
@@ -445,7 +444,7 @@ class Registrar(object):
             The domain name or id
         """
         response = self.client.get(f'/{account}/registrar/domains/{domain}/transfer_lock')
-        return Response(response, DomainTransferLock)
+        return self.client.response(response, DomainTransferLock)
 
     def enable_domain_transfer_lock(self, account, domain):
         """
@@ -459,7 +458,7 @@ class Registrar(object):
             The domain name or id
         """
         response = self.client.post(f'/{account}/registrar/domains/{domain}/transfer_lock')
-        return Response(response, DomainTransferLock)
+        return self.client.response(response, DomainTransferLock)
 
     def disable_domain_transfer_lock(self, account, domain):
         """
@@ -473,7 +472,7 @@ class Registrar(object):
             The domain name or id
         """
         response = self.client.delete(f'/{account}/registrar/domains/{domain}/transfer_lock')
-        return Response(response, DomainTransferLock)
+        return self.client.response(response, DomainTransferLock)
 
     def restore_domain(self, account_id, domain, request):
         """
@@ -495,7 +494,7 @@ class Registrar(object):
             The domain restore
         """
         response = self.client.post(f'/{account_id}/registrar/domains/{domain}/restores', request.to_json())
-        return Response(response, DomainRestore)
+        return self.client.response(response, DomainRestore)
 
     def get_domain_restore(self, account_id, domain, domain_restore):
         """
@@ -514,4 +513,4 @@ class Registrar(object):
             The domain restore
         """
         response = self.client.get(f'/{account_id}/registrar/domains/{domain}/restores/{domain_restore}')
-        return Response(response, DomainRestore)
+        return self.client.response(response, DomainRestore)
@@ -1,4 +1,4 @@
-from dnsimple.response import Response
+from dnsimple.paginator import MAX_PER_PAGE
 from dnsimple.struct import Service
 
 
@@ -28,7 +28,26 @@ class Services(object):
             The list of services in DNSimple
         """
         response = self.client.get('/services', sort=sort, page=page, per_page=per_page)
-        return Response(response, Service)
+        return self.client.response(response, Service)
+
+    def iter_services(self, sort=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the available one-click services, requesting the pages lazily.
+
+        :param sort: str
+            How to sort the entries (see list_services for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The available one-click services (dnsimple.struct.Service)
+        """
+        return self.client.iterate(self.list_services, sort=sort, per_page=per_page, prefetch=prefetch,
+                                   parallel=parallel)
 
     def get_service(self, service_id):
         """
@@ -43,7 +62,7 @@ class Services(object):
             The service requested
         """
         response = self.client.get(f'/services/{service_id}')
-        return Response(response, Service)
+        return self.client.response(response, Service)
 
     def applied_services(self, account_id, domain, page=None, per_page=None):
         """
@@ -63,7 +82,28 @@ class Services(object):
             The list of services applied to the domain
         """
         response = self.client.get(f'/{account_id}/domains/{domain}/services', page=page, per_page=per_page)
-        return Response(response, Service)
+        return self.client.response(response, Service)
+
+    def iter_applied_services(self, account_id, domain, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the services applied to a domain, requesting the pages lazily.
+
+        :param account_id: int
+            The account id
+        :param domain: int/str
+            The domain name or id
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The services applied to the domain (dnsimple.struct.Service)
+        """
+        return self.client.iterate(self.applied_services, account_id, domain, per_page=per_page, prefetch=prefetch,
+                                   parallel=parallel)
 
     def apply_service(self, account_id, domain, service):
         """
@@ -81,7 +121,7 @@ class Services(object):
             An empty response
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/services/{service}')
-        return Response(response)
+        return self.client.response(response)
 
     def unapply_service(self, account_id, domain, service):
         """
@@ -99,4 +139,4 @@ class Services(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/domains/{domain}/services/{service}')
-        return Response(response)
+        return self.client.response(response)
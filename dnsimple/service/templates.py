@@ -1,4 +1,4 @@
-from dnsimple.response import Response
+from dnsimple.paginator import MAX_PER_PAGE
 from dnsimple.struct import Template, TemplateRecord
 
 
@@ -31,7 +31,28 @@ class Templates(object):
             The templates in the account
         """
         response = self.client.get(f'/{account_id}/templates', sort=sort, page=page, per_page=per_page)
-        return Response(response, Template)
+        return self.client.response(response, Template)
+
+    def iter_templates(self, account_id, sort=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the templates in the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param sort: str
+            How to sort the entries (see list_templates for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The templates in the account (dnsimple.struct.Template)
+        """
+        return self.client.iterate(self.list_templates, account_id, sort=sort, per_page=per_page, prefetch=prefetch,
+                                   parallel=parallel)
 
     def create_template(self, account_id, template_attributes):
         """
@@ -47,7 +68,7 @@ class Templates(object):
             The newly created template
         """
         response = self.client.post(f'/{account_id}/templates', data=template_attributes.to_json())
-        return Response(response, Template)
+        return self.client.response(response, Template)
 
     def get_template(self, account_id, template):
         """
@@ -64,7 +85,7 @@ class Templates(object):
             The template requested
         """
         response = self.client.get(f'/{account_id}/templates/{template}')
-        return Response(response, Template)
+        return self.client.response(response, Template)
 
     def update_template(self, account_id, template, template_attributes):
         """
@@ -83,7 +104,7 @@ class Templates(object):
             The updated template
         """
         response = self.client.patch(f'/{account_id}/templates/{template}', data=template_attributes.to_json())
-        return Response(response, Template)
+        return self.client.response(response, Template)
 
     def delete_template(self, account_id, template):
         """
@@ -102,7 +123,7 @@ class Templates(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/templates/{template}')
-        return Response(response)
+        return self.client.response(response)
 
     def list_template_records(self, account_id, template, sort=None, page=None, per_page=None):
         """
@@ -132,7 +153,30 @@ class Templates(object):
             The list of template records
         """
         response = self.client.get(f'/{account_id}/templates/{template}/records', sort=sort, page=page, per_page=per_page)
-        return Response(response, TemplateRecord)
+        return self.client.response(response, TemplateRecord)
+
+    def iter_template_records(self, account_id, template, sort=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the records of the template, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param template: int/str
+            The template id or short name
+        :param sort: str
+            How to sort the entries (see list_template_records for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The records of the template (dnsimple.struct.TemplateRecord)
+        """
+        return self.client.iterate(self.list_template_records, account_id, template, sort=sort, per_page=per_page,
+                                   prefetch=prefetch, parallel=parallel)
 
     def create_template_record(self, account_id, template, template_record_attributes):
         """
@@ -151,7 +195,7 @@ class Templates(object):
             The newly created template record
         """
         response = self.client.post(f'/{account_id}/templates/{template}/records', data=template_record_attributes.to_json())
-        return Response(response, TemplateRecord)
+        return self.client.response(response, TemplateRecord)
 
     def get_template_record(self, account_id, template, record_id):
         """
@@ -170,7 +214,7 @@ class Templates(object):
             The template record
         """
         response = self.client.get(f'/{account_id}/templates/{template}/records/{record_id}')
-        return Response(response, TemplateRecord)
+        return self.client.response(response, TemplateRecord)
 
     def delete_template_record(self, account_id, template, record_id):
         """
@@ -191,7 +235,7 @@ class Templates(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/templates/{template}/records/{record_id}')
-        return Response(response)
+        return self.client.response(response)
 
     def apply_template(self, account_id, domain, template):
         """
@@ -210,4 +254,4 @@ class Templates(object):
             An empty response
         """
         response = self.client.post(f'/{account_id}/domains/{domain}/templates/{template}')
-        return Response(response)
+        return self.client.response(response)
@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import Tld, TldExtendedAttribute
 
 
@@ -25,7 +24,7 @@ class Tlds(object):
             The tld list
         """
         response = self.client.get('/tlds', sort=sort)
-        return Response(response, Tld)
+        return self.client.response(response, Tld)
 
     def get_tld(self, tld):
         """
@@ -40,7 +39,7 @@ class Tlds(object):
             The TLD details
         """
         response = self.client.get(f'/tlds/{tld}')
-        return Response(response, Tld)
+        return self.client.response(response, Tld)
 
     def get_tld_extended_attributes(self, tld):
         """
@@ -55,4 +54,4 @@ class Tlds(object):
             The TLDs extended attributes
         """
         response = self.client.get(f'/tlds/{tld}/extended_attributes')
-        return Response(response, TldExtendedAttribute)
+        return self.client.response(response, TldExtendedAttribute)
@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import VanityNameServer
 
 
@@ -20,7 +19,7 @@ class VanityNameServers(object):
             The vanity name server list
         """
         response = self.client.put(f'/{account_id}/vanity/{domain}')
-        return Response(response, VanityNameServer)
+        return self.client.response(response, VanityNameServer)
 
     def disable_vanity_name_servers(self, account_id, domain):
         """
@@ -37,4 +36,4 @@ class VanityNameServers(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/vanity/{domain}')
-        return Response(response)
+        return self.client.response(response)
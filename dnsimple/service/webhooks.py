@@ -1,4 +1,3 @@
-from dnsimple.response import Response
 from dnsimple.struct import Webhook
 
 
@@ -25,7 +24,7 @@ class Webhooks(object):
             The list of webhooks
         """
         response = self.client.get(f'/{account_id}/webhooks', sort=sort)
-        return Response(response, Webhook)
+        return self.client.response(response, Webhook)
 
     def create_webhook(self, account_id, webhook):
         """
@@ -42,7 +41,7 @@ class Webhooks(object):
             The newly created webhook
         """
         response = self.client.post(f'/{account_id}/webhooks', data=webhook.to_json())
-        return Response(response, Webhook)
+        return self.client.response(response, Webhook)
 
     def get_webhook(self, account_id, webhook):
         """
@@ -59,7 +58,7 @@ class Webhooks(object):
             The webhook
         """
         response = self.client.get(f'/{account_id}/webhooks/{webhook}')
-        return Response(response, Webhook)
+        return self.client.response(response, Webhook)
 
     def delete_webhook(self, account_id, webhook):
         """
@@ -76,4 +75,4 @@ class Webhooks(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/webhooks/{webhook}')
-        return Response(response)
+        return self.client.response(response)
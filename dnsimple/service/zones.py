@@ -1,4 +1,7 @@
-from dnsimple.response import Response
+from dnsimple.batch import DEFAULT_CHUNK_SIZE
+from dnsimple.bulk import bulk_apply
+from dnsimple.export import export_all_records
+from dnsimple.paginator import MAX_PER_PAGE
 from dnsimple.struct import Zone, ZoneDistribution, ZoneFile, ZoneRecord, BatchChangeZoneRecordsResponse
 
 
@@ -26,7 +29,7 @@ class Zones(object):
         :return: dnsimple.Response
         """
         response = self.client.put(f'/{account_id}/zones/{zone_name}/activation')
-        return Response(response, Zone)
+        return self.client.response(response, Zone)
 
     def deactivate_dns(self, account_id, zone_name):
         """
@@ -42,7 +45,7 @@ class Zones(object):
         :return: dnsimple.Response
         """
         response = self.client.delete(f'/{account_id}/zones/{zone_name}/activation')
-        return Response(response, Zone)
+        return self.client.response(response, Zone)
 
     def list_zones(self, account_id, filter=None, sort=None, page=None, per_page=None):
         """
@@ -73,7 +76,55 @@ class Zones(object):
             The list of zones requested
         """
         response = self.client.get(f'/{account_id}/zones', filter=filter, sort=sort, page=page, per_page=per_page)
-        return Response(response, Zone)
+        return self.client.response(response, Zone)
+
+    def iter_zones(self, account_id, filter=None, sort=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the zones in the account, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param filter: dict
+            Filters to apply to the entries (see list_zones for the possible filters)
+        :param sort: str
+            How to sort the entries (see list_zones for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The zones in the account (dnsimple.struct.Zone)
+        """
+        return self.client.iterate(self.list_zones, account_id, filter=filter, sort=sort, per_page=per_page,
+                                   prefetch=prefetch, parallel=parallel)
+
+    def export_all_records(self, account_id, concurrency=4, per_page=MAX_PER_PAGE, filter=None):
+        """
+        Yields every record of every zone in the account
+
+        Zones are discovered page by page while the records of the zones already known are fetched concurrently, one
+        request per page of records. Records are yielded zone by zone, in the order of the zones, and no more than
+        twice `concurrency` pages are held at any time, whatever the number of zones and records.
+
+        for zone, record in client.zones.export_all_records(1010, concurrency=8):
+            print(zone.name, record.name, record.type, record.content)
+
+        :param account_id: int
+            The account ID
+        :param concurrency: int
+            The number of pages fetched concurrently
+        :param per_page: int
+            The number of records to request per page (default: 100, the maximum allowed)
+        :param filter: dict
+            The filter of the zones to export (i.e. {'name_like': 'example'})
+
+        :return: generator
+            (dnsimple.struct.Zone, dnsimple.struct.ZoneRecord) tuples
+        """
+        return export_all_records(self, account_id, concurrency=concurrency, per_page=per_page, filter=filter)
 
     def get_zone(self, account_id, zone):
         """
@@ -90,7 +141,7 @@ class Zones(object):
             The zone requested
         """
         response = self.client.get(f'/{account_id}/zones/{zone}')
-        return Response(response, Zone)
+        return self.client.response(response, Zone)
 
     def get_zone_file(self, account_id, zone):
         """
@@ -107,7 +158,7 @@ class Zones(object):
             The zone file requested
         """
         response = self.client.get(f'/{account_id}/zones/{zone}/file')
-        return Response(response, ZoneFile)
+        return self.client.response(response, ZoneFile)
 
     def check_zone_distribution(self, account_id, zone):
         """
@@ -126,7 +177,7 @@ class Zones(object):
             The zone distribution
         """
         response = self.client.get(f'/{account_id}/zones/{zone}/distribution')
-        return Response(response, ZoneDistribution)
+        return self.client.response(response, ZoneDistribution)
 
     def list_records(self, account_id, zone, filter=None, sort=None, page=None, per_page=None):
         """
@@ -164,7 +215,32 @@ class Zones(object):
         """
         response = self.client.get(f'/{account_id}/zones/{zone}/records', filter=filter, sort=sort, page=page,
                                    per_page=per_page)
-        return Response(response, ZoneRecord)
+        return self.client.response(response, ZoneRecord)
+
+    def iter_records(self, account_id, zone, filter=None, sort=None, per_page=MAX_PER_PAGE, prefetch=0, parallel=None):
+        """
+        Iterates over all the records of the zone, requesting the pages lazily.
+
+        :param account_id: int
+            The account ID
+        :param zone: str
+            The zone name
+        :param filter: dict
+            Filters to apply to the entries (see list_records for the possible filters)
+        :param sort: str
+            How to sort the entries (see list_records for the possible sort criteria)
+        :param per_page: int
+            The number of entries to request per page (default: 100, the maximum allowed)
+        :param prefetch: int
+            The number of pages to fetch ahead while the current one is consumed (default: 0)
+        :param parallel: int
+            The number of pages to fetch concurrently once the number of pages is known (default: None)
+
+        :return: generator
+            The records of the zone (dnsimple.struct.ZoneRecord)
+        """
+        return self.client.iterate(self.list_records, account_id, zone, filter=filter, sort=sort, per_page=per_page,
+                                   prefetch=prefetch, parallel=parallel)
 
     def create_record(self, account_id, zone, record):
         """
@@ -183,7 +259,7 @@ class Zones(object):
             The newly created zone record
         """
         response = self.client.post(f'/{account_id}/zones/{zone}/records', data=record.to_json())
-        return Response(response, ZoneRecord)
+        return self.client.response(response, ZoneRecord)
 
     def get_record(self, account_id, zone, record_id):
         """
@@ -202,7 +278,7 @@ class Zones(object):
             The zone record requested
         """
         response = self.client.get(f'/{account_id}/zones/{zone}/records/{record_id}')
-        return Response(response, ZoneRecord)
+        return self.client.response(response, ZoneRecord)
 
     def update_record(self, account_id, zone, record_id, record):
         """
@@ -222,7 +298,7 @@ class Zones(object):
             The updated zone record
         """
         response = self.client.patch(f'/{account_id}/zones/{zone}/records/{record_id}', data=record.to_json())
-        return Response(response, ZoneRecord)
+        return self.client.response(response, ZoneRecord)
 
     def delete_record(self, account_id, zone, record_id):
         """
@@ -242,7 +318,7 @@ class Zones(object):
             An empty response
         """
         response = self.client.delete(f'/{account_id}/zones/{zone}/records/{record_id}')
-        return Response(response)
+        return self.client.response(response)
 
     def check_zone_record_distribution(self, account_id, zone, record_id):
         """
@@ -263,7 +339,7 @@ class Zones(object):
             The zone record distribution
         """
         response = self.client.get(f'/{account_id}/zones/{zone}/records/{record_id}/distribution')
-        return Response(response, ZoneDistribution)
+        return self.client.response(response, ZoneDistribution)
 
     def batch_change_records(self, account_id, zone, batch_change):
         """
@@ -282,4 +358,30 @@ class Zones(object):
             The batch change zone records response
         """
         response = self.client.post(f'/{account_id}/zones/{zone}/batch', data=batch_change.to_json())
-        return Response(response, BatchChangeZoneRecordsResponse)
+        return self.client.response(response, BatchChangeZoneRecordsResponse)
+
+    def bulk_apply(self, operations, concurrency=4, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Applies record operations across many zones concurrently
+
+        The operations of a same zone are grouped in batch changes of up to chunk_size operations; an operation alone
+        in its zone is sent with create_record, update_record or delete_record. Failures do not stop the other
+        operations: each operation gets its outcome in the report. A batch change is applied as a whole, so when one
+        fails every operation of the batch is reported with its error.
+
+        report = client.zones.bulk_apply([
+            RecordOperation.create(1010, 'example.com', ZoneRecordInput('www', 'A', '192.0.2.1')),
+            RecordOperation.delete(1010, 'example.org', 6),
+        ], concurrency=8)
+
+        :param operations: iterable
+            The operations (dnsimple.RecordOperation)
+        :param concurrency: int
+            The maximum number of requests sent at the same time
+        :param chunk_size: int
+            The maximum number of operations per batch change
+
+        :return: dnsimple.BulkReport
+            The outcome of every operation, in the order of the operations
+        """
+        return bulk_apply(self, operations, concurrency=concurrency, chunk_size=chunk_size)
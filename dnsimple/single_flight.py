@@ -0,0 +1,105 @@
+import copy
+import threading
+from concurrent.futures import Future
+
+from dnsimple.cache import request_key
+from dnsimple.json_backend import decode
+
+
+class SingleFlightMetrics(object):
+    """Counters of the GET requests coalesced by a SingleFlight"""
+
+    requests = 0
+    """The number of GET requests sent"""
+    coalesced = 0
+    """The number of calls that waited for an identical request in flight instead of sending their own"""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+
+    def record_request(self):
+        with self.__lock:
+            self.requests += 1
+
+    def record_coalesced(self):
+        with self.__lock:
+            self.coalesced += 1
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical GET requests sent at the same time by the threads sharing a Client
+
+    A GET request (same method, URL and credentials) sent while an identical one is in flight is not sent: the call
+    waits for the request in flight and gets a copy of its HTTP response, or the same exception. The body is decoded
+    once, and every waiting call gets its own deep copy of the decoded payload, so that the structs of one caller never
+    share a list or dict with the structs of another. Requests are only coalesced while they are in flight, use a
+    ResponseCache to reuse responses afterwards.
+
+    client = Client(access_token='SuperSecretToken', single_flight=SingleFlight())
+    client.map([client.identity.whoami] * 8)  # one request
+    client.single_flight.metrics.coalesced
+    """
+
+    def __init__(self, enabled=True):
+        """
+        :param enabled: bool
+            Set to false to send every request (can be toggled at any time with the enabled attribute)
+        """
+        self.enabled = enabled
+        self.metrics = SingleFlightMetrics()
+        self.__in_flight = {}
+        self.__lock = threading.Lock()
+
+    def fetch(self, request, send):
+        """
+        Sends a GET request, or waits for the identical request in flight
+
+        :param request: requests.PreparedRequest
+            The GET request
+        :param send: callable
+            Sends the request and returns the requests.Response
+        :return: requests.Response
+        """
+        if not self.enabled:
+            return send(request)
+
+        key = request_key(request)
+        with self.__lock:
+            future = self.__in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self.__in_flight[key] = Future()
+
+        if not leader:
+            self.metrics.record_coalesced()
+            return _copy(future.result())
+
+        self.metrics.record_request()
+        try:
+            response = send(request)
+            if response.content:
+                try:
+                    decode(response)
+                except ValueError:
+                    pass
+        except BaseException as error:
+            self.__done(key)
+            future.set_exception(error)
+            raise
+        self.__done(key)
+        future.set_result(response)
+        return response
+
+    def __done(self, key):
+        with self.__lock:
+            self.__in_flight.pop(key, None)
+
+
+def _copy(http_response):
+    """Returns a copy of an HTTP response with its own copy of the decoded payload and headers"""
+    response = copy.copy(http_response)
+    response.headers = copy.copy(http_response.headers)
+    if hasattr(http_response, 'dnsimple_json'):
+        response.dnsimple_json = copy.deepcopy(http_response.dnsimple_json)
+    return response
@@ -0,0 +1,349 @@
+import json
+import mmap
+import os
+import struct as binary
+import sys
+from array import array
+
+from dnsimple.reconciler import ZoneReconciler
+from dnsimple.struct import ZoneRecord
+
+MAGIC = b'DNSSNAP1'
+"""The first bytes of a snapshot file"""
+
+COLUMNS = (
+    ('id', 'q'),
+    ('zone', 'I'),
+    ('parent_id', 'q'),
+    ('name', 'I'),
+    ('type', 'I'),
+    ('content', 'I'),
+    ('ttl', 'i'),
+    ('priority', 'i'),
+    ('regions', 'I'),
+    ('system_record', 'b'),
+    ('created_at', 'I'),
+    ('updated_at', 'I'),
+)
+"""The columns of a snapshot and their array typecodes; I columns are indexes in the string table"""
+
+NULL = -1
+"""Stored in the integer columns for None"""
+
+_HEADER = binary.Struct('<8sI')
+
+
+class SnapshotWriter(object):
+    """
+    Writes the records of zones to a snapshot file
+
+    Records are stored in columns: one fixed size array per attribute, the strings (names, types, contents, regions
+    and timestamps) being interned in a single string table. While writing, each record only takes a few bytes per
+    column, whatever the number of records.
+
+    with SnapshotWriter('account.snapshot') as writer:
+        for zone in client.zones.iter_zones(1010):
+            writer.add_zone(zone.name, client.zones.iter_records(1010, zone.name))
+    """
+
+    def __init__(self, path, metadata=None):
+        """
+        :param path: str
+            The path of the snapshot file, replaced when the writer is closed
+        :param metadata: dict
+            JSON serializable data stored with the snapshot (i.e. the account ID)
+        """
+        self.path = path
+        self.metadata = metadata or {}
+        self.zones = []
+        self.__zone_rows = []
+        self.__strings = {}
+        self.__columns = {name: array(typecode) for name, typecode in COLUMNS}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+
+    def __len__(self):
+        return len(self.__columns['id'])
+
+    def intern(self, value):
+        """
+        Returns the index of a string in the string table, adding it when missing
+
+        :param value: str
+        :return: int
+        """
+        index = self.__strings.get(value)
+        if index is None:
+            index = self.__strings[value] = len(self.__strings)
+        return index
+
+    def add_zone(self, zone, records):
+        """
+        Adds the records of a zone
+
+        :param zone: str
+            The zone name
+        :param records: iterable
+            The records of the zone (dnsimple.struct.ZoneRecord or a compatible struct)
+        """
+        zone_index = len(self.zones)
+        self.zones.append(zone)
+        intern = self.intern
+        columns = self.__columns
+        start = len(self)
+
+        for record in records:
+            columns['id'].append(NULL if record.id is None else record.id)
+            columns['zone'].append(zone_index)
+            columns['parent_id'].append(NULL if record.parent_id is None else record.parent_id)
+            columns['name'].append(intern(record.name))
+            columns['type'].append(intern(record.type))
+            columns['content'].append(intern(record.content))
+            columns['ttl'].append(NULL if record.ttl is None else record.ttl)
+            columns['priority'].append(NULL if record.priority is None else record.priority)
+            columns['regions'].append(intern(None if record.regions is None else ','.join(record.regions)))
+            columns['system_record'].append(bool(record.system_record))
+            columns['created_at'].append(intern(record.created_at))
+            columns['updated_at'].append(intern(record.updated_at))
+
+        self.__zone_rows.append([start, len(self)])
+
+    def close(self):
+        """Writes the snapshot file"""
+        strings = list(self.__strings)
+        blob = bytearray()
+        offsets = array('Q', [0])
+        for value in strings:
+            if value is not None:
+                blob += value.encode('utf-8')
+            offsets.append(len(blob))
+        nulls = [index for index, value in enumerate(strings) if value is None]
+
+        sections = [('string_offsets', offsets.tobytes()), ('strings', bytes(blob))]
+        sections.extend((name, self.__columns[name].tobytes()) for name, _ in COLUMNS)
+
+        layout = {}
+        position = 0
+        for name, data in sections:
+            layout[name] = [position, len(data)]
+            position += _padded(len(data))
+
+        header = json.dumps({
+            'version': 1,
+            'byteorder': sys.byteorder,
+            'records': len(self),
+            'strings': len(strings),
+            'nulls': nulls,
+            'zones': self.zones,
+            'zone_rows': self.__zone_rows,
+            'metadata': self.metadata,
+            'layout': layout,
+        }).encode('utf-8')
+        header += b' ' * (_padded(_HEADER.size + len(header)) - _HEADER.size - len(header))
+
+        temporary = '{path}.tmp'.format(path=self.path)
+        with open(temporary, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, len(header)))
+            f.write(header)
+            for _, data in sections:
+                f.write(data)
+                f.write(b'\0' * (_padded(len(data)) - len(data)))
+        os.replace(temporary, self.path)
+
+
+class Snapshot(object):
+    """
+    Reads a snapshot file written by SnapshotWriter
+
+    The file is memory mapped: opening it only reads its header, columns are read in place and strings are decoded
+    when a record using them is built.
+
+    with Snapshot('account.snapshot') as snapshot:
+        for record in snapshot.records('example.com'):
+            print(record.name, record.type, record.content)
+    """
+
+    def __init__(self, path):
+        """
+        :param path: str
+            The path of the snapshot file
+
+        :raises ValueError
+            When the file is not a snapshot
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_size = _HEADER.unpack_from(self.__mmap)
+        if magic != MAGIC:
+            self.__mmap.close()
+            raise ValueError('{path} is not a snapshot file'.format(path=path))
+
+        header = json.loads(self.__mmap[_HEADER.size:_HEADER.size + header_size])
+        self.zones = header['zones']
+        self.metadata = header['metadata']
+        self.__zone_rows = header['zone_rows']
+        self.__count = header['records']
+        self.__nulls = frozenset(header['nulls'])
+        self.__decoded = {}
+
+        data = memoryview(self.__mmap)[_HEADER.size + header_size:]
+        swap = header['byteorder'] != sys.byteorder
+
+        def section(name, typecode):
+            start, size = header['layout'][name]
+            view = data[start:start + size]
+            if not swap:
+                return view.cast(typecode)
+            values = array(typecode)
+            values.frombytes(view)
+            values.byteswap()
+            return values
+
+        self.__offsets = section('string_offsets', 'Q')
+        start, size = header['layout']['strings']
+        self.__strings = data[start:start + size]
+        self.__columns = {name: section(name, typecode) for name, typecode in COLUMNS}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.__count
+
+    def close(self):
+        """Unmaps the snapshot file"""
+        self.__offsets = self.__strings = self.__columns = None
+        self.__mmap.close()
+
+    def string(self, index):
+        """
+        Returns a string of the string table
+
+        :param index: int
+        :return: str
+        """
+        value = self.__decoded.get(index)
+        if value is None and index not in self.__nulls:
+            value = self.__decoded[index] = str(self.__strings[self.__offsets[index]:self.__offsets[index + 1]],
+                                                'utf-8')
+        return value
+
+    def record(self, row, struct=ZoneRecord):
+        """
+        Returns one record of the snapshot
+
+        :param row: int
+            The position of the record in the snapshot
+        :param struct: class
+            The struct to build (i.e. dnsimple.struct.CompactZoneRecord)
+
+        :return: dnsimple.struct.ZoneRecord
+        """
+        columns = self.__columns
+        string = self.string
+        regions = string(columns['regions'][row])
+        return struct({
+            'id': _nullable(columns['id'][row]),
+            'zone_id': self.zones[columns['zone'][row]],
+            'parent_id': _nullable(columns['parent_id'][row]),
+            'name': string(columns['name'][row]),
+            'type': string(columns['type'][row]),
+            'content': string(columns['content'][row]),
+            'ttl': _nullable(columns['ttl'][row]),
+            'priority': _nullable(columns['priority'][row]),
+            'regions': None if regions is None else regions.split(','),
+            'system_record': bool(columns['system_record'][row]),
+            'created_at': string(columns['created_at'][row]),
+            'updated_at': string(columns['updated_at'][row]),
+        })
+
+    def records(self, zone=None, struct=ZoneRecord):
+        """
+        Yields the records of the snapshot
+
+        :param zone: str
+            Only yield the records of this zone (default: every record)
+        :param struct: class
+            The struct to build (i.e. dnsimple.struct.CompactZoneRecord)
+
+        :return: generator
+        """
+        for name, (start, end) in zip(self.zones, self.__zone_rows):
+            if zone is None or name == zone:
+                for row in range(start, end):
+                    yield self.record(row, struct)
+
+
+def take_snapshot(client, account_id, path, zones=None, parallel=None):
+    """
+    Writes every record of the zones of an account to a snapshot file
+
+    :param client: dnsimple.Client
+        The client fetching the records
+    :param account_id: int
+        The account ID
+    :param path: str
+        The path of the snapshot file
+    :param zones: iterable
+        The names of the zones to snapshot (default: every zone of the account)
+    :param parallel: int
+        The number of pages of records fetched concurrently (default: None, one at a time)
+
+    :return: int
+        The number of records written
+    """
+    if zones is None:
+        zones = (zone.name for zone in client.zones.iter_zones(account_id))
+    with SnapshotWriter(path, metadata={'account_id': account_id}) as writer:
+        for zone in zones:
+            writer.add_zone(zone, client.zones.iter_records(account_id, zone, parallel=parallel))
+    return len(writer)
+
+
+def restore_zone(client, account_id, snapshot, zone, dry_run=False):
+    """
+    Restores the records of a zone from a snapshot
+
+    The records of the zone are reconciled with the snapshot (see dnsimple.ZoneReconciler): the records created since
+    the snapshot are deleted, the ones deleted are created again and the changed ones are updated, in a single batch
+    change.
+
+    :param client: dnsimple.Client
+        The client changing the records
+    :param account_id: int
+        The account ID
+    :param snapshot: Snapshot|str
+        The snapshot, or the path of the snapshot file
+    :param zone: str
+        The zone name
+    :param dry_run: bool
+        Set to true to only compute the changes
+
+    :return: tuple
+        The dnsimple.ReconciliationPlan, and the dnsimple.Response of the batch change (None on a dry run or when
+        there is nothing to change)
+    """
+    if isinstance(snapshot, str):
+        with Snapshot(snapshot) as opened:
+            return restore_zone(client, account_id, opened, zone, dry_run=dry_run)
+
+    desired = [record for record in snapshot.records(zone) if not record.system_record]
+    return ZoneReconciler(client).apply(account_id, zone, desired, dry_run=dry_run)
+
+
+def _nullable(value):
+    return None if value == NULL else value
+
+
+def _padded(size):
+    return (size + 7) & ~7
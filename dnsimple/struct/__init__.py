@@ -41,3 +41,10 @@ from dnsimple.struct.batch_change_zone_records import (
     BatchChangeZoneRecordsResponse,
     BatchChangeZoneRecordsDeleteResponse
 )
+from dnsimple.struct.compact import (
+    CompactDnsAnalytics,
+    CompactDomain,
+    CompactZone,
+    CompactZoneRecord,
+    COMPACT_STRUCTS
+)
@@ -20,7 +20,8 @@ class BatchChangeZoneRecordsUpdateInput(dict):
         omitted = omitempty(self)
 
         if self['name'] == '':
-            omitted['name'] = ''
+            # The apex name is kept, in its place among the fields
+            omitted = {key: '' if key == 'name' else omitted[key] for key in self if key in omitted or key == 'name'}
 
         return json.dumps(omitted)
 
@@ -0,0 +1,83 @@
+from dnsimple.struct.dns_analytics import DnsAnalytics
+from dnsimple.struct.domain import Domain
+from dnsimple.struct.zone import Zone
+from dnsimple.struct.zone_record import ZoneRecord
+
+
+def compact(cls):
+    """
+    Returns a __slots__ based variant of a struct
+
+    The variant has the same attributes (and defaults) as the struct, but stores them in slots instead of a
+    per-instance dict, which takes a fraction of the memory when holding millions of them. Attributes sent by the API
+    but not declared by the struct are still readable, from a dict allocated only when there are some.
+
+    :param cls: class
+        The struct class (i.e. dnsimple.struct.ZoneRecord)
+    :return: class
+        The compact variant of the struct
+    """
+    defaults = {name: value for name, value in vars(cls).items()
+                if not name.startswith('_') and not callable(value) and not isinstance(value, (property, staticmethod,
+                                                                                              classmethod))}
+    fields = tuple(defaults)
+    known = frozenset(fields)
+
+    # Generated like dataclasses do: one assignment per field is much faster than a setattr loop
+    source = 'def __init__(self, data):\n'
+    source += ''.join('    self.{name} = data.get({name!r}, defaults[{name!r}])\n'.format(name=name) for name in fields)
+    source += '    self._extra = None if data.keys() <= known else {key: data[key] for key in data.keys() - known}\n'
+    scope = {}
+    exec(source, {'defaults': defaults, 'known': known}, scope)
+
+    def __getattr__(self, name):
+        extra = object.__getattribute__(self, '_extra')
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError("'{cls}' object has no attribute '{name}'".format(cls=type(self).__name__, name=name))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in fields) and self._extra == other._extra
+
+    def __repr__(self):
+        return '{name}({attributes})'.format(name=type(self).__name__, attributes=', '.join(
+            '{name}={value!r}'.format(name=name, value=getattr(self, name)) for name in fields))
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in fields + ('_extra',))
+
+    def __setstate__(self, state):
+        for name, value in zip(fields + ('_extra',), state):
+            object.__setattr__(self, name, value)
+
+    namespace = {
+        '__slots__': fields + ('_extra',),
+        '__doc__': 'Compact (__slots__ based) variant of dnsimple.struct.{name}'.format(name=cls.__name__),
+        '__module__': __name__,
+        '__init__': scope['__init__'],
+        '__getattr__': __getattr__,
+        '__eq__': __eq__,
+        '__hash__': None,
+        '__repr__': __repr__,
+        '__getstate__': __getstate__,
+        '__setstate__': __setstate__,
+        'fields': fields,
+        'struct': cls,
+    }
+    return type('Compact{name}'.format(name=cls.__name__), (object,), namespace)
+
+
+CompactDnsAnalytics = compact(DnsAnalytics)
+CompactDomain = compact(Domain)
+CompactZone = compact(Zone)
+CompactZoneRecord = compact(ZoneRecord)
+
+COMPACT_STRUCTS = {
+    DnsAnalytics: CompactDnsAnalytics,
+    Domain: CompactDomain,
+    Zone: CompactZone,
+    ZoneRecord: CompactZoneRecord,
+}
+"""The structs returned in high volumes and their compact variants"""
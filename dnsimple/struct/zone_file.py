@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
 from dnsimple.struct import Struct
+from dnsimple.struct.zone_record import ZoneRecord
+from dnsimple.zone_file_parser import parse_zone_file
 
 
 @dataclass
@@ -12,3 +14,19 @@ class ZoneFile(Struct):
 
     def __init__(self, data):
         super().__init__(data)
+
+    def records(self, zone=None, struct=ZoneRecord):
+        """
+        Parses the records of the zone file
+
+        See dnsimple.zone_file_parser.parse_zone_file
+
+        :param zone: str
+            The zone name (default: the $ORIGIN of the zone file)
+        :param struct: class
+            The struct built for each record (default: ZoneRecord)
+
+        :return: generator
+            The records of the zone file
+        """
+        return parse_zone_file(self.zone, zone=zone, struct=struct)
@@ -0,0 +1,161 @@
+import json
+import os
+import threading
+
+
+class SyncState(object):
+    """
+    The watermarks of a ZoneSync: the updated_at of every zone and of its most recently updated record
+
+    The state is saved to a JSON file after each sync when a path is given, so that the next process starts from
+    where the last one stopped.
+    """
+
+    def __init__(self, path=None):
+        """
+        :param path: str
+            The JSON file the state is loaded from and saved to (default: None, kept in memory)
+        """
+        self.path = path
+        self.zones = {}
+        """The watermarks by zone name: {'updated_at': ..., 'records_updated_at': ...}"""
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                self.zones = json.load(f)['zones']
+
+    def save(self):
+        """Writes the state to its file, if it has one"""
+        if self.path is None:
+            return
+        temporary = '{path}.tmp'.format(path=self.path)
+        with open(temporary, 'w') as f:
+            json.dump({'version': 1, 'zones': self.zones}, f)
+        os.replace(temporary, self.path)
+
+
+class SyncResult(object):
+    """What a ZoneSync run found"""
+
+    zones_checked = 0
+    """The number of zones of the account"""
+    changed_zones = None
+    """The names of the zones whose records were fetched again"""
+    removed_zones = None
+    """The names of the zones gone since the last sync"""
+    records = None
+    """The records of the changed zones, by zone name"""
+    changed_records = None
+    """The records created or updated since the last sync, by zone name"""
+    deleted_records = None
+    """The IDs of the records deleted since the last sync, by zone name (only known when syncing an index)"""
+    requests = 0
+    """The number of pages of zones and records fetched, one request each (not counting retries)"""
+
+    def __init__(self):
+        self.changed_zones = []
+        self.removed_zones = []
+        self.records = {}
+        self.changed_records = {}
+        self.deleted_records = {}
+
+
+class ZoneSync(object):
+    """
+    Keeps a copy of the records of an account up to date, fetching again only the zones that changed
+
+    Every run lists the zones of the account (one request per page of 100 zones) and compares their updated_at with the
+    watermark saved by the previous run: the records of the zones that did not move are not fetched. The records of the
+    zones that moved are fetched again, and the ones updated after the record watermark are reported as changed.
+
+    index = ZoneRecordIndex()
+    sync = ZoneSync(client, 1010, state=SyncState('sync.json'), index=index)
+    result = sync.run()
+    print(result.changed_zones, result.requests)
+
+    The DNSimple API cannot sort records by updated_at, so a zone that moved is always fetched whole; this is also what
+    reveals its deleted records.
+    """
+
+    def __init__(self, client, account_id, state=None, index=None, parallel=None):
+        """
+        :param client: dnsimple.Client
+            The client fetching the zones and records
+        :param account_id: int
+            The account ID
+        :param state: SyncState
+            The watermarks (default: a new in-memory state, the first run fetches every zone)
+        :param index: dnsimple.ZoneRecordIndex
+            An index updated with the records of the changed zones. When the state is loaded from a file, the index
+            must hold the records of the previous run (i.e. restored from a snapshot).
+        :param parallel: int
+            The number of pages of records fetched concurrently (default: None, one at a time)
+        """
+        self.client = client
+        self.account_id = account_id
+        self.state = state if state is not None else SyncState()
+        self.index = index
+        self.parallel = parallel
+        self.__lock = threading.Lock()
+
+    def run(self):
+        """
+        Fetches the records of the zones changed since the last run
+
+        :return: SyncResult
+        """
+        result = SyncResult()
+        watermarks = self.state.zones
+        seen = set()
+
+        moved = []
+        for zone in self.client.iterate(self.__counting(self.client.zones.list_zones, result), self.account_id):
+            seen.add(zone.name)
+            updated_at = watermarks.get(zone.name, {}).get('updated_at')
+            if updated_at is None or zone.updated_at is None or zone.updated_at > updated_at:
+                moved.append(zone)
+        result.zones_checked = len(seen)
+
+        for zone in moved:
+            self.__sync_zone(zone, watermarks.get(zone.name), result)
+
+        for name in set(watermarks) - seen:
+            del watermarks[name]
+            result.removed_zones.append(name)
+            if self.index is not None:
+                self.index.remove_zone(name)
+
+        self.state.save()
+        return result
+
+    def __sync_zone(self, zone, watermark, result):
+        list_records = self.__counting(self.client.zones.list_records, result)
+        records = list(self.client.iterate(list_records, self.account_id, zone.name, sort='id:asc',
+                                           parallel=self.parallel))
+
+        records_updated_at = None if watermark is None else watermark['records_updated_at']
+        result.changed_zones.append(zone.name)
+        result.records[zone.name] = records
+        result.changed_records[zone.name] = [record for record in records if records_updated_at is None or
+                                             (record.updated_at or '') > records_updated_at]
+
+        if self.index is not None:
+            current = {record.id for record in records}
+            result.deleted_records[zone.name] = [record.id for record in self.index.in_zone(zone.name)
+                                                 if record.id not in current]
+            self.index.remove_zone(zone.name)
+            self.index.update(records)
+
+        self.state.zones[zone.name] = {
+            'updated_at': zone.updated_at,
+            'records_updated_at': max((record.updated_at for record in records if record.updated_at),
+                                      default=records_updated_at),
+        }
+
+    def __counting(self, list_method, result):
+        """Wraps a list method so that every page it fetches is counted in result.requests"""
+        def fetch(*args, **kwargs):
+            response = list_method(*args, **kwargs)
+            with self.__lock:
+                result.requests += 1
+            return response
+        return fetch
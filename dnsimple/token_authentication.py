@@ -5,6 +5,11 @@ class TokenAuthentication(AuthBase):
     def __init__(self, token):
         self.token = token
 
+    @property
+    def header(self):
+        """The value of the Authorization header"""
+        return 'Bearer {token}'.format(token=self.token)
+
     def __call__(self, r):
-        r.headers['Authorization'] = 'Bearer {token}'.format(token=self.token)
+        r.headers['Authorization'] = self.header
         return r
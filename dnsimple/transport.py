@@ -0,0 +1,71 @@
+from requests.models import Response as HttpResponse
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport(object):
+    """
+    Sends the requests of a Client
+
+    The client builds every request (URL, headers, authentication, body) and hands it to its transport, which returns
+    the response of the server. Implement send to run the client against something else than the DNSimple API over
+    HTTP, i.e. dnsimple.fake.FakeDNSimple.
+
+    client = Client(access_token='SuperSecretToken', transport=MyTransport())
+    """
+
+    def send(self, request, timeout=None):
+        """
+        Sends a request
+
+        :param request: requests.PreparedRequest
+            The request to send
+        :param timeout: float|tuple
+            How long to wait for the server, in seconds
+        :return: requests.Response
+            The response of the server
+
+        :raises requests.exceptions.RequestException
+            When the request could not be sent
+        """
+        raise NotImplementedError
+
+
+class SessionTransport(Transport):
+    """Sends the requests through a requests.Session, the default transport of a Client"""
+
+    def __init__(self, session):
+        """
+        :param session: requests.Session
+            The HTTP session sending the requests
+        """
+        self.session = session
+
+    def send(self, request, timeout=None):
+        return self.session.send(request, timeout=timeout)
+
+
+def build_response(request, status_code, headers=None, content=b'', reason=None):
+    """
+    Builds the response of a transport, as requests does for the responses of the server
+
+    :param request: requests.PreparedRequest
+        The request the response answers
+    :param status_code: int
+        The HTTP status code
+    :param headers: dict
+        The HTTP headers
+    :param content: bytes|str
+        The body of the response
+    :param reason: str
+        The reason phrase (i.e. Not Found)
+    :return: requests.Response
+    """
+    response = HttpResponse()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = content.encode('utf-8') if isinstance(content, str) else content
+    response.encoding = 'utf-8'
+    response.reason = reason
+    response.url = request.url
+    response.request = request
+    return response
@@ -0,0 +1,231 @@
+import io
+import re
+
+from dnsimple.struct.zone_record import ZoneRecord
+
+CLASSES = frozenset(['IN', 'CH', 'HS', 'CS'])
+"""The DNS classes a record can be declared with"""
+
+TTL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+"""The multipliers of the BIND TTL units"""
+
+NAME_TYPES = frozenset(['NS', 'CNAME', 'PTR', 'ALIAS', 'DNAME'])
+"""The record types whose content is a domain name"""
+
+PRIORITY_TYPES = frozenset(['MX', 'SRV'])
+"""The record types whose first field is the priority, which DNSimple stores apart from the content"""
+
+
+def parse_ttl(value):
+    """
+    Converts a TTL in seconds or in BIND units (i.e. 1h30m, 2d) to seconds
+
+    :param value: str
+        The TTL
+    :return: int
+        The TTL in seconds
+
+    :raises ValueError
+        When the value is not a TTL
+    """
+    if value.isdigit():
+        return int(value)
+
+    seconds = 0
+    number = ''
+    for char in value.lower():
+        if char.isdigit():
+            number += char
+        elif char in TTL_UNITS and number:
+            seconds += int(number) * TTL_UNITS[char]
+            number = ''
+        else:
+            raise ValueError('Invalid TTL: {value}'.format(value=value))
+    if number:
+        raise ValueError('Invalid TTL: {value}'.format(value=value))
+    return seconds
+
+
+_TOKENS = re.compile(r'"(?:\\.|[^"\\])*"?|[^\s"();]+|[();]')
+
+
+def _is_ttl(token):
+    return token[0].isdigit() and (token.isdigit() or token[-1].lower() in TTL_UNITS)
+
+
+def _tokenize(line, depth):
+    """Splits a line with quotes, comments or parentheses, returning the tokens and the parentheses left open"""
+    tokens = []
+    for token in _TOKENS.findall(line):
+        if token == ';':
+            break
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        else:
+            tokens.append(token)
+    return tokens, depth
+
+
+def parse_zone_file(zone_file, zone=None, default_ttl=3600, struct=ZoneRecord):
+    """
+    Yields the records of a zone file, as returned by Zones.get_zone_file
+
+    The zone file is parsed line by line, without loading it all: $ORIGIN and $TTL directives, relative and @ names,
+    omitted owners, TTLs and classes, TTL units (1h, 2d), quoted strings, comments and records spanning several lines
+    with parentheses are supported.
+
+    Records are built like the API returns them: names are relative to the zone ('' for the apex), domain names in the
+    content have no trailing dot, and the priority of MX and SRV records is apart from their content. The SOA and the
+    apex NS records are flagged as system records.
+
+    records = parse_zone_file(client.zones.get_zone_file(1010, 'example.com').data.zone)
+
+    :param zone_file: str|iterable
+        The zone file, as a string or an iterable of lines (i.e. an open file)
+    :param zone: str
+        The zone name (default: the first $ORIGIN of the file)
+    :param default_ttl: int
+        The TTL of the records declared before any $TTL or explicit TTL
+    :param struct: class
+        The struct built for each record, ZoneRecord or a compatible class (i.e. dnsimple.struct.CompactZoneRecord)
+
+    :return: generator
+        The records, in the order of the file
+
+    :raises ValueError
+        When a line cannot be parsed, with its line number
+    """
+    if isinstance(zone_file, str):
+        zone_file = io.StringIO(zone_file)
+
+    zone = None if zone is None else zone.rstrip('.').lower()
+    origin = None if zone is None else zone + '.'
+    suffix = ''
+    ttl = default_ttl
+    name = None
+    pending = None
+    depth = 0
+
+    for number, line in enumerate(zone_file, 1):
+        if pending is None:
+            if '"' in line or '(' in line or ')' in line:
+                tokens, depth = _tokenize(line, 0)
+            else:
+                tokens = line.split(';', 1)[0].split() if ';' in line else line.split()
+            inherit = line[:1] in (' ', '\t')
+        else:
+            tokens, depth = _tokenize(line, depth)
+            tokens = pending + tokens
+        if depth > 0:
+            pending = tokens
+            continue
+        pending = None
+        if not tokens:
+            continue
+
+        try:
+            first = tokens[0]
+            if first[0] == '$':
+                directive = first.upper()
+                if directive == '$ORIGIN':
+                    origin = _absolute(tokens[1], origin)
+                    if zone is None:
+                        zone = origin[:-1].lower()
+                    suffix = _relative(origin, zone)
+                elif directive == '$TTL':
+                    ttl = parse_ttl(tokens[1])
+                else:
+                    raise ValueError('Unsupported directive {directive}'.format(directive=first))
+                continue
+
+            if origin is None:
+                raise ValueError('The zone is unknown: no $ORIGIN before the first record')
+
+            index = 0
+            if not inherit:
+                if first == '@':
+                    name = suffix
+                elif first[-1] == '.':
+                    name = _relative(first, zone)
+                else:
+                    name = first + '.' + suffix if suffix else first
+                index = 1
+            elif name is None:
+                raise ValueError('Missing owner name')
+
+            record_ttl = None
+            for _ in range(2):
+                token = tokens[index]
+                if record_ttl is None and _is_ttl(token):
+                    record_ttl = parse_ttl(token)
+                elif token.upper() in CLASSES:
+                    pass
+                else:
+                    break
+                index += 1
+            if record_ttl is None:
+                record_ttl = ttl
+
+            type = tokens[index].upper()
+            rdata = tokens[index + 1:]
+            if not rdata:
+                raise ValueError('Missing record data')
+
+            priority = None
+            if type in PRIORITY_TYPES:
+                priority = int(rdata[0])
+                rdata = rdata[1:]
+                rdata[-1] = _name(rdata[-1], origin)
+            elif type in NAME_TYPES:
+                rdata = [_name(rdata[0], origin)]
+            elif type == 'SOA':
+                rdata = [_name(rdata[0], origin), _name(rdata[1], origin)] + rdata[2:]
+        except IndexError:
+            raise ValueError('Line {number}: incomplete record'.format(number=number))
+        except ValueError as error:
+            raise ValueError('Line {number}: {error}'.format(number=number, error=error))
+
+        yield struct({
+            'zone_id': zone,
+            'name': name,
+            'type': type,
+            'content': ' '.join(rdata),
+            'ttl': record_ttl,
+            'priority': priority,
+            'system_record': type == 'SOA' or (type == 'NS' and name == ''),
+        })
+
+    if pending is not None:
+        raise ValueError('Unbalanced parentheses at the end of the zone file')
+
+
+def _absolute(name, origin):
+    """Returns the fully qualified form of a name, with its trailing dot"""
+    if name == '@':
+        if origin is None:
+            raise ValueError('@ used before $ORIGIN')
+        return origin
+    if name.endswith('.'):
+        return name
+    if origin is None:
+        raise ValueError('Relative name {name} used before $ORIGIN'.format(name=name))
+    return name + '.' + origin
+
+
+def _name(name, origin):
+    """Returns a domain name of a record content as the API does: fully qualified, without the trailing dot"""
+    if name == '.':
+        return name
+    return _absolute(name, origin)[:-1]
+
+
+def _relative(owner, zone):
+    """Returns the name of a record relative to the zone, '' for the apex, from its fully qualified form"""
+    name = owner[:-1]
+    if len(name) == len(zone) and name.lower() == zone:
+        return ''
+    if len(name) > len(zone) and name[-len(zone) - 1] == '.' and name[-len(zone):].lower() == zone:
+        return name[:-len(zone) - 1]
+    return name
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from dnsimple import AsyncClient, DNSimpleException, RateLimiter, RecordOperation
+from dnsimple.async_client import RequestRecord
+from dnsimple.struct import Domain, Whoami, Zone, ZoneRecord, ZoneRecordInput, ZoneRecordUpdateInput
+from tests.helpers import read_fixture
+
+
+class FixtureTransport(httpx.AsyncBaseTransport):
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+
+    async def handle_async_request(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        fixture_name = self.routes[(request.method, request.url.path + ('?' + request.url.query.decode()
+                                                                         if request.url.query else ''))]
+        status_code, headers, content = read_fixture(fixture_name)
+        return httpx.Response(status_code, headers={k: v.strip() for k, v in headers.items()},
+                              content=content.encode() if status_code != 204 else b'')
+
+
+class AsyncClientTest(unittest.IsolatedAsyncioTestCase):
+    def client(self, routes):
+        self.transport = FixtureTransport(routes)
+        http_client = httpx.AsyncClient(transport=self.transport)
+        return AsyncClient(access_token='SomeMagicToken', sandbox=True, http_client=http_client)
+
+    async def test_attaches_every_service(self):
+        client = self.client({})
+
+        for name in AsyncClient.services:
+            self.assertTrue(hasattr(client, name))
+        await client.aclose()
+
+    async def test_returns_the_parsed_response(self):
+        async with self.client({('GET', '/v2/whoami'): 'whoami/success-user'}) as client:
+            response = await client.identity.whoami()
+
+        self.assertIsInstance(response.data, Whoami)
+        self.assertEqual(1, response.data.user.id)
+        self.assertEqual(4000, response.rate_limit)
+        self.assertEqual('Bearer SomeMagicToken', self.transport.requests[0].headers['Authorization'])
+
+    async def test_sends_the_payload(self):
+        async with self.client({('POST', '/v2/1010/zones/example.com/records'): 'createZoneRecord/created'}) as client:
+            response = await client.zones.create_record(1010, 'example.com', ZoneRecordInput('www', 'A', '127.0.0.1'))
+
+        self.assertIsInstance(response.data, ZoneRecord)
+        self.assertEqual({'name': 'www', 'type': 'A', 'content': '127.0.0.1'},
+                         json.loads(self.transport.requests[0].content))
+
+    async def test_raises_errors(self):
+        async with self.client({('GET', '/v2/1010/domains/example.com'): 'notfound-domain'}) as client:
+            with self.assertRaises(DNSimpleException) as context:
+                await client.domains.get_domain(1010, 'example.com')
+
+        self.assertEqual(404, context.exception.status)
+        self.assertEqual('Domain `0` not found', context.exception.message)
+
+    async def test_concurrent_calls_return_isolated_data(self):
+        routes = {('GET', '/v2/whoami'): 'whoami/success-user',
+                  ('GET', '/v2/1010/domains'): 'listDomains/success',
+                  ('GET', '/v2/1010/zones/example.com'): 'getZone/success',
+                  ('GET', '/v2/1010/zones/example.com/records'): 'listZoneRecords/success'}
+        async with self.client(routes) as client:
+            results = await asyncio.gather(*[call for _ in range(20) for call in (
+                client.identity.whoami(), client.domains.list_domains(1010), client.zones.get_zone(1010, 'example.com'),
+                client.zones.list_records(1010, 'example.com'))])
+
+        for index in range(0, len(results), 4):
+            whoami, domains, zone, records = results[index:index + 4]
+            self.assertIsInstance(whoami.data, Whoami)
+            self.assertIsInstance(domains.data[0], Domain)
+            self.assertIsInstance(zone.data, Zone)
+            self.assertEqual(5, len(records.data))
+
+    async def test_iterates_over_every_page(self):
+        routes = {('GET', '/v2/1010/domains?page={page}&per_page=2'.format(page=page)): 'pages-{page}of3'.format(page=page)
+                  for page in range(1, 4)}
+        async with self.client(routes) as client:
+            ids = [domain.id async for domain in client.domains.iter_domains(1010, per_page=2)]
+            parallel_ids = [domain.id async for domain in client.domains.iter_domains(1010, per_page=2, parallel=2)]
+
+        self.assertEqual([1, 2, 3, 4, 5], ids)
+        self.assertEqual([1, 2, 3, 4, 5], parallel_ids)
+
+    async def test_feeds_the_rate_limiter(self):
+        client = self.client({('GET', '/v2/whoami'): 'whoami/success-user'})
+        client.rate_limiter = RateLimiter()
+
+        await client.identity.whoami()
+        await client.aclose()
+
+        self.assertEqual(3991, client.rate_limiter.state(client.recorder.client.rate_limit_key).remaining)
+
+    async def test_applies_bulk_operations(self):
+        routes = {('POST', '/v2/1010/zones/example.com/batch'): 'batchChangeZoneRecords/success',
+                  ('POST', '/v2/1010/zones/example.org/records'): 'createZoneRecord/created',
+                  ('DELETE', '/v2/1010/zones/example.net/records/6'): 'deleteZoneRecord/success'}
+        operations = [
+            RecordOperation.create(1010, 'example.com', ZoneRecordInput('ab', 'A', '3.2.3.4')),
+            RecordOperation.create(1010, 'example.org', ZoneRecordInput('www', 'A', '192.0.2.1')),
+            RecordOperation.update(1010, 'example.com', 67622534, ZoneRecordUpdateInput(content='3.2.3.40')),
+            RecordOperation.delete(1010, 'example.net', 6),
+        ]
+        async with self.client(routes) as client:
+            report = await client.zones.bulk_apply(operations, concurrency=2)
+
+        self.assertTrue(report.ok, [outcome.error for outcome in report.failed])
+        self.assertEqual(3, report.requests)
+        self.assertEqual(3, len(self.transport.requests))
+        self.assertEqual([67623409, 1, 67622534, None],
+                         [None if outcome.record is None else outcome.record.id for outcome in report])
+        self.assertEqual([True, False, True, False], [outcome.batched for outcome in report])
+
+    async def test_reports_the_failures_of_bulk_operations(self):
+        routes = {('DELETE', '/v2/1010/zones/example.com/records/6'): 'notfound-record'}
+        async with self.client(routes) as client:
+            report = await client.zones.bulk_apply([RecordOperation.delete(1010, 'example.com', 6)])
+
+        self.assertIsInstance(report.outcomes[0].error, DNSimpleException)
+        self.assertEqual(404, report.outcomes[0].error.status)
+
+    async def test_exports_every_record_of_the_account(self):
+        routes = {('GET', '/v2/1010/zones?page=1&per_page=100'): 'listZones/success'}
+        for zone in ('example-alpha.com', 'example-beta.com'):
+            path = '/v2/1010/zones/{zone}/records?page=1&per_page=100&sort=id%3Aasc'.format(zone=zone)
+            routes[('GET', path)] = 'listZoneRecords/success'
+        async with self.client(routes) as client:
+            records = [(zone.name, record.id) async for zone, record in
+                       client.zones.export_all_records(1010, concurrency=2)]
+
+        self.assertEqual(10, len(records))
+        self.assertEqual(['example-alpha.com'] * 5 + ['example-beta.com'] * 5, [zone for zone, _ in records])
+        self.assertEqual(3, len(self.transport.requests))
+
+    async def test_records_the_requests_of_the_services_without_a_session(self):
+        client = self.client({})
+
+        record = client.recorder.zones.get_zone(1010, 'example.com')
+        await client.aclose()
+
+        self.assertIsInstance(record, RequestRecord)
+        self.assertIs(Zone, record.obj)
+        self.assertEqual('https://api.sandbox.dnsimple.com/v2/1010/zones/example.com', record.request.url)
+        self.assertIsNone(client.recorder.client.session)
+        self.assertEqual([], self.transport.requests)
+
+    async def test_keeps_methods_not_sending_requests_synchronous(self):
+        client = self.client({})
+
+        self.assertEqual('https://api.sandbox.dnsimple.com/oauth/authorize?client_id=a1b2c3&response_type=code',
+                         client.oauth.authorize_url('a1b2c3'))
+        await client.aclose()
+
+    async def test_sends_requests_with_a_finite_timeout_by_default(self):
+        async with AsyncClient(access_token='SomeMagicToken') as client:
+            self.assertEqual(httpx.Timeout(30, connect=5), client.http_client.timeout)
+        async with AsyncClient(access_token='SomeMagicToken', timeout=None) as client:
+            self.assertEqual(httpx.Timeout(None), client.http_client.timeout)
+
+
+if __name__ == '__main__':
+    unittest.main()
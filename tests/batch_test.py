@@ -0,0 +1,110 @@
+import json
+import unittest
+
+import responses
+
+from dnsimple import BatchExecutor
+from dnsimple.struct import (
+    BatchChangeZoneRecordsCreateInput,
+    BatchChangeZoneRecordsDeleteInput,
+    BatchChangeZoneRecordsInput,
+    BatchChangeZoneRecordsUpdateInput,
+)
+from tests.helpers import API_URL, RATE_LIMIT_HEADERS, DNSimpleTest, zone_record_data
+
+BATCH_URL = API_URL + '/1010/zones/example.com/batch'
+
+
+def batch_callback(fail_names=()):
+    """Answers a batch change like the API does, failing the chunks creating one of fail_names"""
+    def callback(request):
+        body = json.loads(request.body)
+        creates = body.get('creates', [])
+        if any(create['name'] in fail_names for create in creates):
+            return 400, RATE_LIMIT_HEADERS, json.dumps({'message': 'Validation failed'})
+        data = {
+            'creates': [zone_record_data(1000 + index, name=create['name']) for index, create in enumerate(creates)],
+            'updates': [zone_record_data(update['id'], name='updated') for update in body.get('updates', [])],
+            'deletes': [{'id': delete['id']} for delete in body.get('deletes', [])],
+        }
+        return 200, RATE_LIMIT_HEADERS, json.dumps({'data': data})
+    return callback
+
+
+def batch_change(creates=0, updates=0, deletes=0):
+    return BatchChangeZoneRecordsInput(
+        creates=[BatchChangeZoneRecordsCreateInput('host{index}'.format(index=index), 'A', '192.0.2.1')
+                 for index in range(creates)] or None,
+        updates=[BatchChangeZoneRecordsUpdateInput(index, content='192.0.2.2')
+                 for index in range(1, updates + 1)] or None,
+        deletes=[BatchChangeZoneRecordsDeleteInput(index) for index in range(1, deletes + 1)] or None,
+    )
+
+
+class BatchExecutorTest(DNSimpleTest):
+    def test_splits_the_operations_in_bounded_chunks_deletes_first(self):
+        chunks = BatchExecutor(self.client, chunk_size=2).chunk(batch_change(creates=3, updates=1, deletes=4))
+
+        self.assertEqual([('deletes', 0, 2), ('deletes', 1, 2), ('updates', 0, 1), ('creates', 0, 2),
+                          ('creates', 1, 1)], [(phase, index, len(operations)) for phase, index, operations in chunks])
+
+    def test_rejects_an_empty_chunk_size(self):
+        with self.assertRaises(ValueError):
+            BatchExecutor(self.client, chunk_size=0)
+
+    @responses.activate
+    def test_applies_the_chunks_in_phase_order_and_merges_the_responses(self):
+        responses.add_callback(responses.POST, BATCH_URL, callback=batch_callback())
+
+        result = BatchExecutor(self.client, chunk_size=2).execute(1010, 'example.com',
+                                                                 batch_change(creates=5, updates=3, deletes=3))
+
+        self.assertTrue(result.ok)
+        self.assertEqual(7, result.chunks)
+        self.assertEqual(7, len(responses.calls))
+        phases = [next(iter(json.loads(call.request.body))) for call in responses.calls]
+        self.assertEqual(['deletes'] * 2 + ['updates'] * 2 + ['creates'] * 3, phases)
+        self.assertEqual(['host{index}'.format(index=index) for index in range(5)],
+                         [created.name for created in result.response.creates])
+        self.assertEqual([1, 2, 3], [updated.id for updated in result.response.updates])
+        self.assertEqual([1, 2, 3], [deleted.id for deleted in result.response.deletes])
+
+    @responses.activate
+    def test_reports_the_failed_chunks(self):
+        responses.add_callback(responses.POST, BATCH_URL, callback=batch_callback(fail_names=('host2',)))
+
+        result = BatchExecutor(self.client, chunk_size=2).execute(1010, 'example.com', batch_change(creates=5))
+
+        self.assertFalse(result.ok)
+        self.assertEqual([('creates', 1, False)], [(failure.phase, failure.index, failure.skipped)
+                                                   for failure in result.failures])
+        self.assertEqual(400, result.failures[0].error.status)
+        self.assertEqual(['host2', 'host3'], [operation['name'] for operation in result.failures[0].operations])
+        self.assertEqual(['host0', 'host1', 'host4'], [created.name for created in result.response.creates])
+
+    @responses.activate
+    def test_skips_the_creates_when_the_deletes_failed(self):
+        responses.add(responses.POST, BATCH_URL, status=400, json={'message': 'Record not found'},
+                      headers=RATE_LIMIT_HEADERS)
+
+        result = BatchExecutor(self.client, chunk_size=2).execute(1010, 'example.com',
+                                                                 batch_change(creates=3, deletes=1))
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual([('deletes', 0, False), ('creates', 0, True), ('creates', 1, True)],
+                         [(failure.phase, failure.index, failure.skipped) for failure in result.failures])
+
+    @responses.activate
+    def test_continues_on_failure_when_asked(self):
+        responses.add(responses.POST, BATCH_URL, status=400, json={'message': 'Record not found'},
+                      headers=RATE_LIMIT_HEADERS)
+
+        result = BatchExecutor(self.client, chunk_size=2, continue_on_failure=True).execute(
+            1010, 'example.com', batch_change(creates=3, deletes=1))
+
+        self.assertEqual(3, len(responses.calls))
+        self.assertFalse(any(failure.skipped for failure in result.failures))
+
+
+if __name__ == '__main__':
+    unittest.main()
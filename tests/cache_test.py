@@ -0,0 +1,271 @@
+import os
+import tempfile
+import unittest
+
+import responses
+
+from dnsimple import Client, ConditionalCache, MemoryBackend, ResponseCache, SQLiteBackend
+from dnsimple.cache import CacheEntry
+from dnsimple.struct import ZoneRecordInput
+from tests.helpers import DNSimpleMockResponse
+
+
+class FakeClock(object):
+    def __init__(self, now=1000):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.cache = ResponseCache(clock=self.clock)
+        self.client = Client(access_token='SomeMagicToken', sandbox=True, cache=self.cache)
+
+    def test_ttl_matches_exact_paths_and_patterns_by_segment(self):
+        self.assertEqual(300, self.cache.ttl('/whoami'))
+        self.assertEqual(86400, self.cache.ttl('/tlds/com/extended_attributes'))
+        self.assertEqual(60, self.cache.ttl('/1010/zones/example.com'))
+        self.assertEqual(0, self.cache.ttl('/1010/zones/example.com/records'))
+        self.assertEqual(0, self.cache.ttl('/1010/zones/example.com/distribution'))
+
+    @responses.activate
+    def test_serves_repeated_gets_from_the_cache(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/whoami', fixture_name='whoami/success'))
+
+        first = self.client.identity.whoami()
+        second = self.client.identity.whoami()
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual(first.data.account.id, second.data.account.id)
+        self.assertTrue(second.http_response.from_cache)
+        self.assertEqual(1, self.cache.metrics.hits)
+        self.assertEqual(1, self.cache.metrics.misses)
+
+    @responses.activate
+    def test_keys_on_the_query_params(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/tlds', fixture_name='listTlds/success'))
+
+        self.client.tlds.list_tlds()
+        self.client.tlds.list_tlds(sort='tld:asc')
+        self.client.tlds.list_tlds(sort='tld:asc')
+
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_sends_the_request_again_once_expired(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/whoami', fixture_name='whoami/success'))
+
+        self.client.identity.whoami()
+        self.clock.now += 300
+        self.client.identity.whoami()
+
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_does_not_cache_endpoints_without_ttl(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example.com/records',
+                                           fixture_name='listZoneRecords/success'))
+
+        self.client.zones.list_records(1010, 'example.com')
+        self.client.zones.list_records(1010, 'example.com')
+
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual(0, self.cache.metrics.misses)
+
+    @responses.activate
+    def test_writes_invalidate_the_paths_they_touch(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example.com',
+                                           fixture_name='getZone/success'))
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example.org',
+                                           fixture_name='getZone/success'))
+        responses.add(DNSimpleMockResponse(method=responses.POST, path='/1010/zones/example.com/records',
+                                           fixture_name='createZoneRecord/created'))
+
+        self.client.zones.get_zone(1010, 'example.com')
+        self.client.zones.get_zone(1010, 'example.org')
+        self.client.zones.create_record(1010, 'example.com', ZoneRecordInput('www', 'A', '192.0.2.1'))
+        self.client.zones.get_zone(1010, 'example.com')
+        self.client.zones.get_zone(1010, 'example.org')
+
+        self.assertEqual(['GET', 'GET', 'POST', 'GET'], [call.request.method for call in responses.calls])
+        self.assertEqual(1, self.cache.metrics.invalidations)
+
+    def test_invalidates_the_path_its_ancestors_and_the_children_of_its_parent(self):
+        for path in ['/1010/zones', '/1010/zones/example.com', '/1010/zones/example.com/records',
+                     '/1010/zones/example.com/records/5', '/1010/zones/example.com/records/6', '/1010/domains',
+                     '/1010/zones/example.org']:
+            self.cache.backend.set(path, CacheEntry(path, 200, {}, b'{}', path, 2000))
+
+        self.assertEqual(5, self.cache.invalidate('/1010/zones/example.com/records/5'))
+        self.assertEqual(2, len(self.cache.backend))
+
+    @responses.activate
+    def test_does_not_share_responses_between_credentials(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/whoami', fixture_name='whoami/success'))
+        other = Client(access_token='AnotherToken', sandbox=True, cache=self.cache)
+
+        self.client.identity.whoami()
+        other.identity.whoami()
+
+        self.assertEqual(2, len(responses.calls))
+
+
+NOT_MODIFIED_HEADERS = {'ETag': 'W/"2161245abd349a34cba32a970e6424ba"', 'X-RateLimit-Limit': '4000',
+                        'X-RateLimit-Remaining': '3990', 'X-RateLimit-Reset': '1453484046'}
+
+
+class ConditionalCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.conditional_cache = ConditionalCache()
+        self.client = Client(access_token='SomeMagicToken', sandbox=True, conditional_cache=self.conditional_cache)
+
+    def add_not_modified(self, path):
+        responses.add(responses.GET, 'https://api.sandbox.dnsimple.com/v2' + path, status=304,
+                      headers=NOT_MODIFIED_HEADERS)
+
+    @responses.activate
+    def test_reuses_the_payload_on_not_modified(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example-alpha.com',
+                                           fixture_name='getZone/success'))
+        self.add_not_modified('/1010/zones/example-alpha.com')
+
+        first = self.client.zones.get_zone(1010, 'example-alpha.com')
+        second = self.client.zones.get_zone(1010, 'example-alpha.com')
+
+        self.assertNotIn('If-None-Match', responses.calls[0].request.headers)
+        self.assertEqual(first.http_response.headers['ETag'], responses.calls[1].request.headers['If-None-Match'])
+        self.assertEqual(first.data.name, second.data.name)
+        self.assertEqual(first.http_response.dnsimple_json, second.http_response.dnsimple_json)
+        self.assertIsNot(first.http_response.dnsimple_json, second.http_response.dnsimple_json)
+        self.assertTrue(second.http_response.not_modified)
+        self.assertEqual(3990, second.rate_limit_remaining)
+
+        metrics = self.conditional_cache.metrics
+        self.assertEqual(1, metrics.requests)
+        self.assertEqual(1, metrics.not_modified)
+        self.assertEqual(len(first.http_response.content), metrics.bytes_saved)
+        self.assertGreater(metrics.parse_time_saved, 0)
+
+    @responses.activate
+    def test_does_not_share_nested_values_between_responses(self):
+        responses.add(responses.GET, 'https://api.sandbox.dnsimple.com/v2/1010/zones/example.com/records',
+                      json={'data': [{'id': 1, 'regions': ['global']}]}, headers=NOT_MODIFIED_HEADERS)
+        self.add_not_modified('/1010/zones/example.com/records')
+
+        first = self.client.zones.list_records(1010, 'example.com').data
+        first[0].regions.append('SV1')
+        second = self.client.zones.list_records(1010, 'example.com').data
+        second[0].regions.append('IAD')
+        third = self.client.zones.list_records(1010, 'example.com').data
+
+        self.assertEqual(['global', 'IAD'], second[0].regions)
+        self.assertEqual(['global'], third[0].regions)
+        self.assertEqual(2, self.conditional_cache.metrics.not_modified)
+
+    @responses.activate
+    def test_sends_if_modified_since(self):
+        responses.add(responses.GET, 'https://api.sandbox.dnsimple.com/v2/whoami', json={'data': {'account': None, 'user': None}},
+                      headers={'Last-Modified': 'Fri, 22 Jan 2016 16:54:14 GMT', 'X-RateLimit-Limit': '4000',
+                               'X-RateLimit-Remaining': '3995', 'X-RateLimit-Reset': '1453484046'})
+
+        self.client.identity.whoami()
+        self.client.identity.whoami()
+
+        self.assertEqual('Fri, 22 Jan 2016 16:54:14 GMT', responses.calls[1].request.headers['If-Modified-Since'])
+        self.assertEqual(0, self.conditional_cache.metrics.not_modified)
+
+    @responses.activate
+    def test_keeps_a_response_per_url(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example.com/records',
+                                           fixture_name='listZoneRecords/success'))
+
+        self.client.zones.list_records(1010, 'example.com', page=1)
+        self.client.zones.list_records(1010, 'example.com', page=2)
+
+        self.assertEqual(0, self.conditional_cache.metrics.requests)
+        self.assertEqual(2, len(self.conditional_cache))
+
+    @responses.activate
+    def test_revalidates_the_expired_entries_of_a_response_cache(self):
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        client = Client(access_token='SomeMagicToken', sandbox=True, cache=cache,
+                        conditional_cache=self.conditional_cache)
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example-alpha.com',
+                                           fixture_name='getZone/success'))
+        self.add_not_modified('/1010/zones/example-alpha.com')
+
+        client.zones.get_zone(1010, 'example-alpha.com')
+        client.zones.get_zone(1010, 'example-alpha.com')
+        clock.now += 60
+        zone = client.zones.get_zone(1010, 'example-alpha.com').data
+
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual('example-alpha.com', zone.name)
+        self.assertEqual(1, self.conditional_cache.metrics.not_modified)
+
+
+class MemoryBackendTest(unittest.TestCase):
+    def test_evicts_the_least_recently_used_entries(self):
+        backend = MemoryBackend(max_entries=2)
+        for key in ['a', 'b']:
+            backend.set(key, CacheEntry('/' + key, 200, {}, b'', key, 0))
+
+        backend.get('a')
+        backend.set('c', CacheEntry('/c', 200, {}, b'', 'c', 0))
+
+        self.assertIsNotNone(backend.get('a'))
+        self.assertIsNone(backend.get('b'))
+        self.assertIsNotNone(backend.get('c'))
+
+
+class SQLiteBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.db')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_persists_the_entries(self):
+        backend = SQLiteBackend(self.path)
+        backend.set('key', CacheEntry('/whoami', 200, {'X-RateLimit-Limit': '2400'}, b'{"data": {}}', 'url', 2000))
+        backend.close()
+
+        entry = SQLiteBackend(self.path).get('key')
+
+        self.assertEqual('/whoami', entry.path)
+        self.assertEqual({'X-RateLimit-Limit': '2400'}, entry.headers)
+        self.assertEqual(b'{"data": {}}', entry.content)
+        self.assertEqual(2000, entry.expires_at)
+
+    def test_evicts_and_invalidates(self):
+        backend = SQLiteBackend(self.path, max_entries=2)
+        for key, path in [('a', '/1010/zones/a'), ('b', '/1010/zones/b'), ('c', '/1010/domains')]:
+            backend.set(key, CacheEntry(path, 200, {}, b'', key, 0))
+
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(1, backend.invalidate({'/1010'}, '/1010/zones/'))
+        self.assertEqual(1, len(backend))
+
+    @responses.activate
+    def test_serves_a_client(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/services',
+                                           fixture_name='listServices/success'))
+        client = Client(access_token='SomeMagicToken', sandbox=True,
+                        cache=ResponseCache(backend=SQLiteBackend(self.path)))
+
+        first = client.services.list_services()
+        second = client.services.list_services()
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual([service.id for service in first.data], [service.id for service in second.data])
+        self.assertEqual(first.pagination.total_entries, second.pagination.total_entries)
+        client.cache.backend.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
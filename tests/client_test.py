@@ -1,4 +1,9 @@
+import json
 import unittest
+from unittest import mock
+
+import requests
+import responses
 
 from dnsimple.client import Client
 from dnsimple.version import version
@@ -43,6 +48,116 @@ class ClientTest(unittest.TestCase):
 
         self.assertEqual('MySuperAPP dnsimple-python/{version}'.format(version=version), client.user_agent)
 
+    def test_can_set_the_json_backend(self):
+        client = Client(json_backend='json')
+
+        self.assertEqual('json', client.json_backend)
+        self.assertIs(json.loads, client.json_loads)
+
+    def test_configures_the_connection_pool(self):
+        client = Client(pool_connections=4, pool_maxsize=32, pool_block=True)
+        adapter = client.session.get_adapter('https://api.dnsimple.com')
+
+        self.assertEqual(4, adapter._pool_connections)
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    def test_can_share_a_session(self):
+        session = requests.Session()
+        client = Client(session=session)
+        other_client = Client(session=client.session)
+
+        self.assertIs(session, client.session)
+        self.assertIs(session, other_client.session)
+
+    def test_sends_requests_with_the_timeout(self):
+        session = mock.Mock(spec=requests.Session)
+        client = Client(access_token='token', session=session, timeout=(3.05, 27))
+
+        client.get('/whoami')
+
+        self.assertEqual((3.05, 27), session.send.call_args.kwargs['timeout'])
+
+    def test_sends_requests_with_a_finite_timeout_by_default(self):
+        session = mock.Mock(spec=requests.Session)
+        client = Client(access_token='token', session=session)
+
+        client.get('/whoami')
+
+        self.assertEqual((5, 30), session.send.call_args.kwargs['timeout'])
+
+    def test_can_wait_forever(self):
+        session = mock.Mock(spec=requests.Session)
+        client = Client(access_token='token', session=session, timeout=None)
+
+        client.get('/whoami')
+
+        self.assertIsNone(session.send.call_args.kwargs['timeout'])
+
+    @responses.activate
+    def test_can_disable_keep_alive(self):
+        responses.add(responses.GET, 'https://api.dnsimple.com/v2/whoami', json={})
+        client = Client(access_token='token', keep_alive=False)
+
+        client.get('/whoami')
+
+        self.assertEqual('close', responses.calls[0].request.headers['Connection'])
+
+    def assert_prepared_like_requests(self, client, method, path, params=None, data=None):
+        expected = requests.Request(method=method, url=client.versioned(path), headers=client.headers,
+                                    auth=client.auth, params=params, data=data).prepare()
+
+        prepared = client.prepare_request(method, path, params=params, data=data)
+
+        self.assertEqual(expected.method, prepared.method)
+        self.assertEqual(expected.url, prepared.url)
+        self.assertEqual(dict(expected.headers), dict(prepared.headers))
+        self.assertEqual(*[body.encode() if isinstance(body, str) else body for body in (expected.body, prepared.body)])
+
+    def test_prepares_requests_like_requests_does(self):
+        client = Client(access_token='token', sandbox=True)
+
+        self.assert_prepared_like_requests(client, 'GET', '/1010/zones/example.com/records',
+                                           params={'page': 2, 'per_page': None, 'sort': 'name:asc',
+                                                   'name_like': 'www fr', 'ids': [1, 2]})
+        self.assert_prepared_like_requests(client, 'GET', '/whoami')
+        self.assert_prepared_like_requests(client, 'POST', '/1010/zones/example.com/records',
+                                           data=json.dumps({'name': 'café', 'type': 'TXT'}))
+        self.assert_prepared_like_requests(client, 'PUT', '/1010/zones/example.com/activation')
+        self.assert_prepared_like_requests(client, 'DELETE', '/1010/zones/example.com/records/1')
+        self.assert_prepared_like_requests(client, 'POST', '/oauth/access_token', data={'code': 'abc'})
+        self.assert_prepared_like_requests(Client(email='example-user@example.com', password='secret'), 'GET',
+                                           '/whoami')
+
+    def test_prepares_requests_with_an_empty_body_like_requests_does(self):
+        client = Client(access_token='token', sandbox=True)
+
+        for method in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            for data in ('', b''):
+                with self.subTest(method=method, data=data):
+                    self.assert_prepared_like_requests(client, method, '/1010/zones/example.com/records', data=data)
+        self.assertEqual('0', client.prepare_request('POST', '/1010/zones/example.com/records', data='')
+                         .headers['Content-Length'])
+
+    def test_recomputes_the_headers_when_they_change(self):
+        client = Client(access_token='token')
+        client.prepare_request('GET', '/whoami')
+
+        client.auth = Client(access_token='other-token').auth
+        client.headers['X-Custom'] = 'value'
+        prepared = client.prepare_request('GET', '/whoami')
+
+        self.assertEqual('Bearer other-token', prepared.headers['Authorization'])
+        self.assertEqual('value', prepared.headers['X-Custom'])
+
+    def test_recomputes_the_versioned_url_when_the_base_url_changes(self):
+        client = Client()
+        client.versioned('/whoami')
+
+        client.base_url = 'http://api.example.com'
+
+        self.assertEqual('http://api.example.com/v2/whoami', client.versioned('/whoami'))
+
 
 if __name__ == '__main__':
     unittest.main()
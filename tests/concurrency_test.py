@@ -0,0 +1,169 @@
+import unittest
+
+import responses
+
+from dnsimple import DNSimpleException
+from dnsimple.struct import (
+    AccessToken,
+    Account,
+    Certificate,
+    Charge,
+    Contact,
+    DnsAnalytics,
+    Domain,
+    DomainCheck,
+    Service,
+    Template,
+    Tld,
+    VanityNameServer,
+    Webhook,
+    Whoami,
+    Zone,
+    ZoneRecord,
+)
+from tests.helpers import DNSimpleTest, DNSimpleMockResponse
+
+
+class ConcurrencyTest(DNSimpleTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.fixtures = [
+            (responses.GET, '/whoami', 'whoami/success-user'),
+            (responses.GET, '/accounts', 'listAccounts/success-user'),
+            (responses.GET, '/1010/contacts', 'listContacts/success'),
+            (responses.GET, '/1010/domains', 'listDomains/success'),
+            (responses.GET, '/1010/domains/example-alpha.com', 'getDomain/success'),
+            (responses.GET, '/1010/zones', 'listZones/success'),
+            (responses.GET, '/1010/zones/example.com', 'getZone/success'),
+            (responses.GET, '/1010/zones/example.com/records', 'listZoneRecords/success'),
+            (responses.GET, '/1010/zones/example.com/records/5', 'getZoneRecord/success'),
+            (responses.GET, '/1010/domains/example.com/certificates', 'listCertificates/success'),
+            (responses.GET, '/1010/templates', 'listTemplates/success'),
+            (responses.GET, '/tlds', 'listTlds/success'),
+            (responses.GET, '/services', 'listServices/success'),
+            (responses.GET, '/1010/webhooks', 'listWebhooks/success'),
+            (responses.GET, '/1010/registrar/domains/ruby.codes/check', 'checkDomain/success'),
+            (responses.GET, '/1010/billing/charges', 'listCharges/success'),
+            (responses.GET, '/1010/dns_analytics', 'dnsAnalytics/success'),
+            (responses.PUT, '/1010/vanity/example.com', 'enableVanityNameServers/success'),
+            (responses.POST, '/oauth/access_token', 'oauthAccessToken/success'),
+        ]
+
+    def add_fixtures(self):
+        for method, path, fixture_name in self.fixtures:
+            responses.add(DNSimpleMockResponse(method=method, path=path, fixture_name=fixture_name))
+
+    def calls(self, repeat):
+        return [
+            (self.identity.whoami,),
+            (self.accounts.list_accounts,),
+            (self.contacts.list_contacts, 1010),
+            (self.domains.list_domains, 1010),
+            (self.domains.get_domain, 1010, 'example-alpha.com'),
+            (self.zones.list_zones, 1010),
+            (self.zones.get_zone, 1010, 'example.com'),
+            (self.zones.list_records, 1010, 'example.com'),
+            (self.zones.get_record, 1010, 'example.com', 5),
+            (self.certificates.list_certificates, 1010, 'example.com'),
+            (self.templates.list_templates, 1010),
+            (self.tlds.list_tlds,),
+            (self.services.list_services,),
+            (self.webhooks.list_webhooks, 1010),
+            (self.registrar.check_domain, 1010, 'ruby.codes'),
+            (self.billing.list_charges, 1010),
+            (self.dns_analytics.query, 1010),
+            (self.vanity_name_servers.enable_vanity_name_servers, 1010, 'example.com'),
+            (self.oauth.exchange_authorization_for_token, 'code', 'client-id', 'client-secret', 'state',
+             'https://example.com'),
+        ] * repeat
+
+    @responses.activate
+    def test_parallel_calls_across_services_return_isolated_data(self):
+        self.add_fixtures()
+
+        results = self.client.map(self.calls(repeat=20), max_workers=16)
+
+        self.assertEqual(380, len(results))
+        for index in range(0, len(results), 19):
+            (whoami, accounts, contacts, domains, domain, zones, zone, records, record, certificates, templates, tlds,
+             services, webhooks, check, charges, analytics, vanity_name_servers, token) = results[index:index + 19]
+
+            self.assertIsInstance(whoami.data, Whoami)
+            self.assertEqual(1, whoami.data.user.id)
+            self.assertIsInstance(accounts.data[0], Account)
+            self.assertEqual(2, len(contacts.data))
+            self.assertIsInstance(contacts.data[0], Contact)
+            self.assertEqual(2, len(domains.data))
+            self.assertIsInstance(domains.data[0], Domain)
+            self.assertIsInstance(domain.data, Domain)
+            self.assertEqual('example-alpha.com', domain.data.name)
+            self.assertEqual(2, len(zones.data))
+            self.assertIsInstance(zones.data[0], Zone)
+            self.assertIsInstance(zone.data, Zone)
+            self.assertEqual('example-alpha.com', zone.data.name)
+            self.assertEqual(5, len(records.data))
+            self.assertIsInstance(records.data[0], ZoneRecord)
+            self.assertEqual(5, record.data.id)
+            self.assertIsNone(whoami.pagination)
+            self.assertEqual(5, records.pagination.total_entries)
+            self.assertIsInstance(certificates.data[0], Certificate)
+            self.assertEqual('www2', certificates.data[0].name)
+            self.assertIsInstance(templates.data[0], Template)
+            self.assertEqual('Alpha', templates.data[0].name)
+            self.assertIsInstance(tlds.data[0], Tld)
+            self.assertEqual('ac', tlds.data[0].tld)
+            self.assertIsInstance(services.data[0], Service)
+            self.assertEqual('Service 1', services.data[0].name)
+            self.assertEqual(2, len(webhooks.data))
+            self.assertIsInstance(webhooks.data[0], Webhook)
+            self.assertIsInstance(check.data, DomainCheck)
+            self.assertEqual('ruby.codes', check.data.domain)
+            self.assertEqual(4, len(charges.data))
+            self.assertIsInstance(charges.data[0], Charge)
+            self.assertEqual(12, len(analytics.data))
+            self.assertIsInstance(analytics.data[0], DnsAnalytics)
+            self.assertEqual('bar.com', analytics.data[0].zone_name)
+            self.assertEqual(4, len(vanity_name_servers.data))
+            self.assertIsInstance(vanity_name_servers.data[0], VanityNameServer)
+            self.assertIsInstance(token.data, AccessToken)
+            self.assertEqual(1, token.data.account_id)
+
+    @responses.activate
+    def test_responses_do_not_share_state(self):
+        self.add_fixtures()
+
+        whoami = self.identity.whoami()
+        records = self.zones.list_records(1010, 'example.com')
+
+        self.assertIsInstance(whoami.data, Whoami)
+        self.assertIsNone(whoami.pagination)
+        self.assertIsNot(whoami.http_response, records.http_response)
+        self.assertIsNone(type(whoami).data)
+        self.assertIsNone(type(whoami).pagination)
+
+    @responses.activate
+    def test_map_raises_the_first_error(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/domains/example.com',
+                                           fixture_name='notfound-domain'))
+        self.add_fixtures()
+
+        with self.assertRaises(DNSimpleException):
+            self.client.map([(self.identity.whoami,), (self.domains.get_domain, 1010, 'example.com')])
+
+    @responses.activate
+    def test_map_can_return_exceptions(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/domains/example.com',
+                                           fixture_name='notfound-domain'))
+        self.add_fixtures()
+
+        whoami, error = self.client.map([lambda: self.identity.whoami(),
+                                         lambda: self.domains.get_domain(1010, 'example.com')],
+                                        max_workers=2, return_exceptions=True)
+
+        self.assertIsInstance(whoami.data, Whoami)
+        self.assertIsInstance(error, DNSimpleException)
+        self.assertEqual(404, error.status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import threading
+import unittest
+
+import responses
+
+from dnsimple import DistributionWaiter, wait_for_distribution
+from tests.helpers import DNSimpleTest, DNSimpleMockResponse
+
+
+class FakeClock(object):
+    def __init__(self, now=1000):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class DistributionWaiterTest(DNSimpleTest):
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+
+    def waiter(self, **options):
+        return DistributionWaiter(self.client, jitter=0, clock=self.clock, sleep=self.clock.sleep, **options)
+
+    def add_checks(self, fixtures, path='/1010/zones/example.com/distribution', kind='checkZoneDistribution'):
+        for fixture in fixtures:
+            responses.add(DNSimpleMockResponse(method=responses.GET, path=path,
+                                               fixture_name='{kind}/{fixture}'.format(kind=kind, fixture=fixture)))
+
+    @responses.activate
+    def test_polls_with_an_exponential_backoff_until_distributed(self):
+        self.add_checks(['failure', 'failure', 'success'])
+
+        result = self.waiter().wait([(1010, 'example.com')])[(1010, 'example.com')]
+
+        self.assertTrue(result.distributed)
+        self.assertEqual(3, result.polls)
+        self.assertEqual([1, 2, 4], self.clock.sleeps)
+        self.assertEqual(7, result.elapsed)
+        self.assertFalse(result.timed_out)
+
+    @responses.activate
+    def test_caps_the_delay_and_gives_up_at_the_deadline(self):
+        self.add_checks(['failure'])
+
+        result = self.waiter(max_delay=3, timeout=10).wait([(1010, 'example.com')])[(1010, 'example.com')]
+
+        self.assertFalse(result.distributed)
+        self.assertTrue(result.timed_out)
+        self.assertEqual([1, 2, 3, 3, 1], self.clock.sleeps)
+        self.assertEqual(5, result.polls)
+        self.assertEqual(10, result.elapsed)
+
+    @responses.activate
+    def test_keeps_polling_when_the_name_servers_cannot_be_queried(self):
+        self.add_checks(['error', 'success'])
+
+        result = self.waiter().wait([(1010, 'example.com')])[(1010, 'example.com')]
+
+        self.assertTrue(result.distributed)
+        self.assertEqual(1, result.errors)
+        self.assertEqual(2, result.polls)
+
+    @responses.activate
+    def test_stops_on_other_errors(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example.com/distribution',
+                                           fixture_name='notfound-zone'))
+
+        result = self.waiter().wait([(1010, 'example.com')])[(1010, 'example.com')]
+
+        self.assertFalse(result.distributed)
+        self.assertFalse(result.timed_out)
+        self.assertEqual(404, result.error.status)
+        self.assertEqual(1, result.polls)
+
+    @responses.activate
+    def test_waits_for_zones_and_records_through_one_scheduler(self):
+        self.add_checks(['failure', 'success'])
+        self.add_checks(['success'], path='/1010/zones/example.com/records/5/distribution',
+                        kind='checkZoneRecordDistribution')
+
+        results = self.waiter().wait([(1010, 'example.com'), (1010, 'example.com', 5), (1010, 'example.com')])
+
+        self.assertEqual({(1010, 'example.com'): (True, 2), (1010, 'example.com', 5): (True, 1)},
+                         {target: (result.distributed, result.polls) for target, result in results.items()})
+        self.assertEqual([1, 2], self.clock.sleeps)
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_coalesces_the_waits_of_several_threads(self):
+        self.add_checks(['failure', 'success'])
+        waiter = self.waiter()
+        polling = threading.Event()
+        release = threading.Event()
+        original_sleep = self.clock.sleep
+
+        def sleep(seconds):
+            polling.set()
+            release.wait(5)
+            original_sleep(seconds)
+
+        waiter.sleep = sleep
+        results = []
+        first = threading.Thread(target=lambda: results.append(waiter.wait([(1010, 'example.com')])))
+        first.start()
+        polling.wait(5)
+        second = threading.Thread(target=lambda: results.append(waiter.wait([(1010, 'example.com')])))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(2, len(results))
+        self.assertIs(results[0][(1010, 'example.com')], results[1][(1010, 'example.com')])
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_waits_for_one_record(self):
+        self.add_checks(['success'], path='/1010/zones/example.com/records/5/distribution',
+                        kind='checkZoneRecordDistribution')
+
+        result = wait_for_distribution(self.client, 1010, 'example.com', 5, jitter=0, clock=self.clock,
+                                       sleep=self.clock.sleep)
+
+        self.assertTrue(result.distributed)
+        self.assertEqual((1010, 'example.com', 5), result.target)
+
+    @responses.activate
+    def test_shares_a_waiter_per_client_between_threads(self):
+        self.add_checks(['failure', 'success'])
+        polling = threading.Event()
+        release = threading.Event()
+
+        def sleep(seconds):
+            polling.set()
+            release.wait(5)
+            self.clock.sleep(seconds)
+
+        def wait(timeout):
+            results.append(wait_for_distribution(self.client, 1010, 'example.com', timeout=timeout, jitter=0,
+                                                  clock=self.clock, sleep=sleep))
+
+        results = []
+        first = threading.Thread(target=wait, args=(60,))
+        first.start()
+        polling.wait(5)
+        second = threading.Thread(target=wait, args=(120,))
+        second.start()
+        second.join(0.2)  # lets the second thread join the wait in progress
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(2, len(results))
+        self.assertIs(results[0], results[1])
+        self.assertTrue(results[0].distributed)
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual(1, len(self.client.distribution_waiters))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import tempfile
+import unittest
+
+from dnsimple import Client, DNSimpleException, ZoneReconciler
+from dnsimple.fake import FakeDNSimple
+from dnsimple.response import Response
+from dnsimple.struct import (
+    BatchChangeZoneRecordsDeleteInput,
+    BatchChangeZoneRecordsInput,
+    ZoneRecordInput,
+    ZoneRecordUpdateInput,
+)
+from dnsimple.transport import SessionTransport, Transport, build_response
+
+
+class RecordingTransport(Transport):
+    def __init__(self):
+        self.sent = []
+
+    def send(self, request, timeout=None):
+        self.sent.append((request, timeout))
+        return build_response(request, 200, {'X-RateLimit-Limit': '2400', 'X-RateLimit-Remaining': '2399',
+                                             'X-RateLimit-Reset': '1475662531'}, '{"data": {"distributed": true}}')
+
+
+class TransportTest(unittest.TestCase):
+    def test_defaults_to_the_session_of_the_client(self):
+        client = Client()
+
+        self.assertIsInstance(client.transport, SessionTransport)
+        self.assertIs(client.session, client.transport.session)
+
+    def test_sends_the_requests_through_the_transport(self):
+        transport = RecordingTransport()
+        client = Client(access_token='SomeMagicToken', sandbox=True, transport=transport, timeout=5)
+
+        self.assertTrue(client.zones.check_zone_distribution(1010, 'example.com').data.distributed)
+        request, timeout = transport.sent[0]
+        self.assertEqual('https://api.sandbox.dnsimple.com/v2/1010/zones/example.com/distribution', request.url)
+        self.assertEqual('Bearer SomeMagicToken', request.headers['Authorization'])
+        self.assertEqual(5, timeout)
+        self.assertIsNone(client.session)
+
+
+class FakeDNSimpleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = FakeDNSimple(clock=lambda: 1475662531)
+        self.server.add_zone(1010, 'example.com')
+        self.client = Client(access_token='SomeMagicToken', sandbox=True, transport=self.server)
+
+    def test_serves_the_fixtures(self):
+        self.assertEqual(1, self.client.identity.whoami().data.account.id)
+        self.assertEqual('example-alpha.com', self.client.domains.get_domain(1010, 'example-alpha.com').data.name)
+
+    def test_answers_501_when_the_fixtures_are_missing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            server = FakeDNSimple(fixtures_path=directory)
+            server.add_zone(1010, 'example.com')
+            client = Client(access_token='SomeMagicToken', sandbox=True, transport=server)
+
+            with self.assertRaises(DNSimpleException) as error:
+                client.identity.whoami()
+
+            self.assertEqual(501, error.exception.status)
+            self.assertIn('No fixture at', error.exception.message)
+            self.assertEqual('example.com', client.zones.get_zone(1010, 'example.com').data.name)
+
+    def test_answers_unknown_endpoints_and_methods_with_errors(self):
+        with self.assertRaises(DNSimpleException) as not_found:
+            Response(self.client.get('/1010/unknown'))
+        with self.assertRaises(DNSimpleException) as not_allowed:
+            Response(self.client.delete('/whoami'))
+
+        self.assertEqual(404, not_found.exception.status)
+        self.assertEqual(405, not_allowed.exception.status)
+
+    def test_counts_the_rate_limit_down(self):
+        self.client.zones.get_zone(1010, 'example.com')
+        response = self.client.zones.get_zone(1010, 'example.com')
+
+        self.assertEqual(2400, response.rate_limit)
+        self.assertEqual(2398, response.rate_limit_remaining)
+        self.assertEqual([('GET', '/1010/zones/example.com')] * 2, self.server.requests)
+
+    def test_creates_the_zones_with_their_system_records(self):
+        records = self.client.zones.list_records(1010, 'example.com').data
+
+        self.assertEqual(['SOA', 'NS', 'NS', 'NS', 'NS'], [record.type for record in records])
+        self.assertTrue(all(record.system_record for record in records))
+
+    def test_raises_not_found_for_unknown_zones_and_records(self):
+        with self.assertRaises(DNSimpleException) as zone:
+            self.client.zones.get_zone(1010, 'example.org')
+        with self.assertRaises(DNSimpleException) as record:
+            self.client.zones.get_record(1010, 'example.com', 999)
+
+        self.assertEqual('Zone `example.org` not found', zone.exception.message)
+        self.assertEqual(404, record.exception.status)
+
+    def test_creates_updates_and_deletes_records(self):
+        created = self.client.zones.create_record(1010, 'example.com', ZoneRecordInput('www', 'A', '192.0.2.1')).data
+        updated = self.client.zones.update_record(1010, 'example.com', created.id,
+                                                  ZoneRecordUpdateInput(content='192.0.2.2', ttl=60)).data
+
+        self.assertEqual('192.0.2.2', updated.content)
+        self.assertEqual(60, updated.ttl)
+        self.assertEqual('192.0.2.2', self.client.zones.get_record(1010, 'example.com', created.id).data.content)
+
+        self.client.zones.delete_record(1010, 'example.com', created.id)
+
+        self.assertEqual(5, len(self.server.records(1010, 'example.com')))
+
+    def test_filters_sorts_and_paginates_records(self):
+        for index in range(5):
+            self.server.add_record(1010, 'example.com', 'host{index}'.format(index=index), 'A',
+                                   '192.0.2.{index}'.format(index=index))
+
+        response = self.client.zones.list_records(1010, 'example.com', filter={'type': 'A'}, sort='name:desc',
+                                                  page=2, per_page=2)
+
+        self.assertEqual(['host2', 'host1'], [record.name for record in response.data])
+        self.assertEqual(3, response.pagination.total_pages)
+        self.assertEqual(10, len(list(self.client.zones.iter_records(1010, 'example.com', per_page=3))))
+
+    def test_applies_batch_changes(self):
+        record = self.server.add_record(1010, 'example.com', 'old', 'A', '192.0.2.1')
+
+        result = self.client.zones.batch_change_records(1010, 'example.com', BatchChangeZoneRecordsInput(
+            creates=[ZoneRecordInput('new', 'A', '192.0.2.2')],
+            deletes=[BatchChangeZoneRecordsDeleteInput(record['id'])])).data
+
+        self.assertEqual('new', result.creates[0].name)
+        self.assertEqual(record['id'], result.deletes[0].id)
+        self.assertEqual(['new'], [record['name'] for record in self.server.records(1010, 'example.com')
+                                   if not record['system_record']])
+
+    def test_rejects_batch_changes_of_unknown_records(self):
+        with self.assertRaises(DNSimpleException) as error:
+            self.client.zones.batch_change_records(1010, 'example.com', BatchChangeZoneRecordsInput(
+                deletes=[BatchChangeZoneRecordsDeleteInput(999)]))
+
+        self.assertEqual(400, error.exception.status)
+        self.assertEqual(5, len(self.server.records(1010, 'example.com')))
+
+    def test_serves_a_zone_reconciler(self):
+        self.server.add_record(1010, 'example.com', 'www', 'A', '192.0.2.1')
+        self.server.add_record(1010, 'example.com', 'old', 'CNAME', 'example.com')
+        desired = [ZoneRecordInput('www', 'A', '192.0.2.9'), ZoneRecordInput('api', 'A', '192.0.2.10')]
+
+        plan, _ = ZoneReconciler(self.client).apply(1010, 'example.com', desired)
+
+        self.assertEqual((1, 1, 1), (len(plan.creates), len(plan.updates), len(plan.deletes)))
+        self.assertFalse(ZoneReconciler(self.client).plan(1010, 'example.com', desired))
+
+    def test_generates_the_zone_file(self):
+        self.server.add_record(1010, 'example.com', '', 'MX', 'mx.example.com', priority=10)
+
+        zone_file = self.client.zones.get_zone_file(1010, 'example.com').data
+
+        self.assertIn('example.com. 3600 IN MX 10 mx.example.com.', zone_file.zone)
+        self.assertEqual(6, len(list(zone_file.records('example.com'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,26 +5,54 @@ import responses
 
 from dnsimple import Client
 
+API_URL = 'https://api.sandbox.dnsimple.com/v2'
+"""The URL of the API the clients of DNSimpleTest point to"""
+
+RATE_LIMIT_HEADERS = {'X-RateLimit-Limit': '2400', 'X-RateLimit-Remaining': '2399', 'X-RateLimit-Reset': '1475662531'}
+"""The rate limit headers of the responses built by the tests"""
+
+
+def read_fixture(fixture_name):
+    """Returns the status code, headers and body of a fixture"""
+    headers = {}
+    dirname = os.path.abspath(os.path.dirname(__file__))
+    fixture_path = os.path.join(dirname, 'fixtures/v2/api/{fixture_name}.http'.format(fixture_name=fixture_name))
+
+    with open(fixture_path) as f:
+        http_payload = f.read()
+    split_payload = http_payload.splitlines()
+    for header in split_payload:
+        if not header:
+            break
+        if header.__contains__(':'):
+            header_dic = header.split(':')
+            headers[header_dic[0]] = header_dic[1]
+
+    content = split_payload[len(split_payload) - 1]
+    status_code = int(split_payload[0].split(' ')[1])
+    return status_code, headers, content
+
+
+def page(entries, current_page=1, per_page=100):
+    """Returns a page of entries, as a list endpoint of the API does"""
+    return {'data': entries[(current_page - 1) * per_page:current_page * per_page],
+            'pagination': {'current_page': current_page, 'per_page': per_page, 'total_entries': len(entries),
+                           'total_pages': max(1, -(-len(entries) // per_page))}}
+
+
+def zone_record_data(id, zone='example.com', name='www', type='A', content='192.0.2.1', **attributes):
+    """Returns a zone record, as the API does"""
+    data = {'id': id, 'zone_id': zone, 'parent_id': None, 'name': name, 'type': type, 'content': content, 'ttl': 3600,
+            'priority': None, 'regions': ['global'], 'system_record': False, 'created_at': '2016-03-22T10:20:53Z',
+            'updated_at': '2016-03-22T10:20:53Z'}
+    data.update(attributes)
+    return data
+
 
 class DNSimpleMockResponse(responses.Response):
     def __init__(self, url='https://api.sandbox.dnsimple.com/v2', path='', method=None, fixture_name=None):
         url = f'{url}{path}'
-        headers = {}
-        dirname = os.path.abspath(os.path.dirname(__file__))
-        fixture_path = os.path.join(dirname, 'fixtures/v2/api/{fixture_name}.http'.format(fixture_name=fixture_name))
-
-        with open(fixture_path) as f:
-            http_payload = f.read()
-        split_payload = http_payload.splitlines()
-        for header in split_payload:
-            if not header:
-                break
-            if header.__contains__(':'):
-                header_dic = header.split(':')
-                headers[header_dic[0]] = header_dic[1]
-
-        content = split_payload[len(split_payload) - 1]
-        status_code = int(split_payload[0].split(' ')[1])
+        status_code, headers, content = read_fixture(fixture_name)
         super(DNSimpleMockResponse, self).__init__(method, url, body=content, headers=headers,
                                                    status=status_code)
 
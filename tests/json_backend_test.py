@@ -0,0 +1,54 @@
+import json
+import unittest
+
+import requests
+import responses
+
+from dnsimple.json_backend import decode, load_json_backend
+from dnsimple.response import Response
+from dnsimple.struct import Domain
+from tests.helpers import DNSimpleMockResponse
+
+
+class JsonBackendTest(unittest.TestCase):
+    def test_loads_the_standard_library_backend(self):
+        self.assertIs(json.loads, load_json_backend('json'))
+
+    def test_picks_an_installed_backend_by_default(self):
+        self.assertEqual({'a': 1}, load_json_backend()(b'{"a": 1}'))
+
+    def test_rejects_unknown_backends(self):
+        with self.assertRaises(ValueError):
+            load_json_backend('yaml')
+
+    @responses.activate
+    def test_decodes_the_body_once(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET,
+                                           url='https://api.sandbox.dnsimple.com/v2/1010/domains',
+                                           fixture_name='listDomains/success'))
+        http_response = requests.get('https://api.sandbox.dnsimple.com/v2/1010/domains')
+        calls = []
+
+        def loads(content):
+            calls.append(content)
+            return json.loads(content)
+
+        http_response.json_loads = loads
+        response = Response(http_response, Domain)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(2, len(response.data))
+        self.assertEqual(1, response.pagination.total_pages)
+        self.assertIs(decode(http_response), decode(http_response))
+
+    @responses.activate
+    def test_decodes_empty_bodies_to_none(self):
+        responses.add(responses.Response(method=responses.DELETE, url='https://api.sandbox.dnsimple.com/v2/1010/domains/1',
+                                         status=204))
+        http_response = requests.delete('https://api.sandbox.dnsimple.com/v2/1010/domains/1')
+
+        self.assertIsNone(decode(http_response))
+
+
+if __name__ == '__main__':
+    unittest.main()
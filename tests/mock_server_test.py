@@ -0,0 +1,76 @@
+import unittest
+
+from dnsimple import Client, DNSimpleException, RetryPolicy
+from dnsimple.mock_server import MockServer, populate
+
+
+class MockServerTest(unittest.TestCase):
+    def serve(self, **options):
+        server = MockServer(seed=1, **options).start()
+        self.addCleanup(server.stop)
+        return server, Client(access_token='SomeMagicToken', base_url=server.url)
+
+    def test_serves_the_fixtures_and_the_zones_over_http(self):
+        server, client = self.serve()
+        populate(server.fake, 1010, zones=2, records=250)
+
+        self.assertEqual(1, client.identity.whoami().data.account.id)
+        self.assertEqual(['zone0.example', 'zone1.example'], [zone.name for zone in client.zones.iter_zones(1010)])
+        self.assertEqual(255, len(list(client.zones.iter_records(1010, 'zone1.example', parallel=3))))
+        self.assertEqual(5, server.stats.requests)
+
+    def test_sends_the_rate_limit_headers_and_enforces_the_limit(self):
+        server, client = self.serve(rate_limit=2)
+
+        first = client.identity.whoami()
+        second = client.identity.whoami()
+        with self.assertRaises(DNSimpleException) as error:
+            client.identity.whoami()
+
+        self.assertEqual((2, 1), (first.rate_limit, first.rate_limit_remaining))
+        self.assertEqual(0, second.rate_limit_remaining)
+        self.assertEqual(429, error.exception.status)
+        self.assertEqual(1, server.stats.rate_limited)
+
+    def test_injects_failures(self):
+        server, client = self.serve(error_rates={502: 1.0})
+
+        with self.assertRaises(DNSimpleException) as error:
+            client.identity.whoami()
+
+        self.assertEqual(502, error.exception.status)
+        self.assertEqual({502: 1}, dict(server.stats.injected))
+
+    def test_injects_failures_with_the_page_of_their_status(self):
+        server, client = self.serve(error_rates={503: 1.0})
+
+        with self.assertRaises(DNSimpleException) as error:
+            client.identity.whoami()
+        status, headers, body = server.respond('GET', '/v2/whoami', None)
+
+        self.assertEqual(503, error.exception.status)
+        self.assertEqual(503, status)
+        self.assertEqual('text/html', headers['Content-Type'])
+        self.assertIn(b'<title>503 Service Unavailable</title>', body)
+        self.assertNotIn(b'502', body)
+
+    def test_injected_429_are_retried_after_retry_after(self):
+        server, client = self.serve(error_rates={429: 0.5}, retry_after=0)
+        client.retry = RetryPolicy(max_attempts=20, backoff_factor=0)
+
+        for _ in range(10):
+            client.identity.whoami()
+
+        self.assertEqual(server.stats.injected[429], client.retry.metrics.retries)
+        self.assertGreater(client.retry.metrics.retries, 0)
+
+    def test_applies_latency(self):
+        server, client = self.serve(latency=0.05)
+
+        response = client.identity.whoami()
+
+        self.assertGreaterEqual(response.http_response.elapsed.total_seconds(), 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import inspect
+import json
+import time
+import unittest
+from unittest import mock
+
+import responses
+
+from dnsimple.paginator import iterate
+from dnsimple.struct import Domain
+from tests.helpers import DNSimpleTest, DNSimpleMockResponse
+
+
+class PaginatorTest(DNSimpleTest):
+    def add_pages(self):
+        for page in range(1, 4):
+            responses.add(DNSimpleMockResponse(method=responses.GET,
+                                               path='/1010/domains?page={page}&per_page=2'.format(page=page),
+                                               fixture_name='pages-{page}of3'.format(page=page)))
+
+    @responses.activate
+    def test_iterates_over_every_page(self):
+        self.add_pages()
+
+        domains = list(iterate(self.domains.list_domains, 1010, per_page=2))
+
+        self.assertEqual([1, 2, 3, 4, 5], [domain.id for domain in domains])
+        self.assertIsInstance(domains[0], Domain)
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_requests_pages_lazily(self):
+        self.add_pages()
+
+        domains = iterate(self.domains.list_domains, 1010, per_page=2)
+        next(domains)
+        next(domains)
+
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_prefetches_the_next_pages(self):
+        self.add_pages()
+
+        domains = iterate(self.domains.list_domains, 1010, per_page=2, prefetch=2)
+
+        self.assertEqual([1, 2, 3, 4, 5], [domain.id for domain in domains])
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_fetches_pages_in_parallel_in_order(self):
+        for page in range(1, 11):
+            body = {'data': [{'id': page * 10 + index} for index in range(2)],
+                    'pagination': {'current_page': page, 'per_page': 2, 'total_entries': 20, 'total_pages': 10}}
+            responses.add(responses.Response(method=responses.GET,
+                                             url=self.url('/1010/domains?page={page}&per_page=2', page),
+                                             body=json.dumps(body), headers=self.rate_limit_headers(remaining=4000 - page)))
+
+        domains = list(self.domains.iter_domains(1010, per_page=2, parallel=4))
+
+        self.assertEqual([page * 10 + index for page in range(1, 11) for index in range(2)],
+                         [domain.id for domain in domains])
+        self.assertEqual(10, len(responses.calls))
+
+    @responses.activate
+    def test_waits_for_the_rate_limit_reset_when_exhausted(self):
+        reset = int(time.time()) + 30
+        for page in range(1, 4):
+            body = {'data': [{'id': page}], 'pagination': {'current_page': page, 'per_page': 1, 'total_entries': 3,
+                                                           'total_pages': 3}}
+            responses.add(responses.Response(method=responses.GET,
+                                             url=self.url('/1010/domains?page={page}&per_page=1', page),
+                                             body=json.dumps(body), headers=self.rate_limit_headers(remaining=0, reset=reset)))
+
+        with mock.patch('dnsimple.paginator.time.sleep') as sleep:
+            domains = list(self.domains.iter_domains(1010, per_page=1, parallel=4))
+
+        self.assertEqual([1, 2, 3], [domain.id for domain in domains])
+        self.assertEqual(1, sleep.call_count)
+        self.assertLessEqual(sleep.call_args[0][0], 30)
+
+    @staticmethod
+    def url(path, page):
+        return 'https://api.sandbox.dnsimple.com/v2' + path.format(page=page)
+
+    @staticmethod
+    def rate_limit_headers(remaining, reset=1450272970):
+        return {'X-RateLimit-Limit': '4000', 'X-RateLimit-Remaining': str(remaining),
+                'X-RateLimit-Reset': str(reset)}
+
+    @responses.activate
+    def test_stops_after_a_single_page(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET,
+                                           path='/1010/domains?page=1&per_page=100',
+                                           fixture_name='listDomains/success'))
+
+        domains = list(self.domains.iter_domains(1010, prefetch=1))
+
+        self.assertEqual(2, len(domains))
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_passes_sort_and_filter_to_every_page(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET,
+                                           path='/1010/zones/example.com/records?page=1&per_page=100&sort=id:asc&type=A',
+                                           fixture_name='listZoneRecords/success'))
+
+        records = list(self.zones.iter_records(1010, 'example.com', sort='id:asc', filter={'type': 'A'}))
+
+        self.assertEqual(5, len(records))
+
+    def test_every_paginated_list_method_has_an_iterator(self):
+        for service in vars(self.client).values():
+            for name, method in inspect.getmembers(service, inspect.ismethod):
+                if 'page' not in inspect.signature(method).parameters:
+                    continue
+                iterator = 'iter_' + name.removeprefix('list_')
+                with self.subTest(service=type(service).__name__, method=name):
+                    self.assertTrue(hasattr(service, iterator), iterator)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+import responses
+
+from dnsimple import Client, RateLimiter, RateLimitExceeded
+from dnsimple.rate_limiter import credential_key
+from tests.helpers import DNSimpleMockResponse
+
+
+class FakeClock(object):
+    def __init__(self, now=1000000):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(burst=2, clock=self.clock, sleep=self.clock.sleep)
+
+    def headers(self, remaining, reset_in, limit=2400):
+        return {'X-RateLimit-Limit': str(limit), 'X-RateLimit-Remaining': str(remaining),
+                'X-RateLimit-Reset': str(self.clock.now + reset_in)}
+
+    def test_does_not_wait_before_knowing_the_budget(self):
+        for _ in range(10):
+            self.assertEqual(0, self.limiter.acquire('token'))
+
+    def test_spreads_the_remaining_budget_until_the_reset(self):
+        self.limiter.update('token', self.headers(remaining=100, reset_in=100))
+
+        self.assertEqual(0, self.limiter.acquire('token'))
+        self.assertEqual(0, self.limiter.acquire('token'))
+        waited = self.limiter.acquire('token')
+
+        self.assertGreater(waited, 0.9)
+        self.assertLess(waited, 1.1)
+
+    def test_waits_for_the_reset_once_the_reserve_is_reached(self):
+        limiter = RateLimiter(reserve=5, clock=self.clock, sleep=self.clock.sleep)
+        limiter.update('token', self.headers(remaining=5, reset_in=600))
+
+        waited = limiter.acquire('token')
+
+        self.assertEqual(600, waited)
+        self.assertEqual(2399, limiter.state('token').remaining)
+
+    def test_raises_instead_of_waiting_when_not_blocking(self):
+        self.limiter.update('token', self.headers(remaining=0, reset_in=30))
+
+        with self.assertRaises(RateLimitExceeded) as context:
+            self.limiter.acquire('token', block=False)
+
+        self.assertEqual(30, context.exception.retry_after)
+
+    def test_tracks_budgets_per_token(self):
+        self.limiter.update('token', self.headers(remaining=0, reset_in=30))
+
+        self.assertEqual(0, self.limiter.acquire('other-token'))
+
+    def test_projects_the_drain_time(self):
+        limiter = RateLimiter(burst=100, clock=self.clock, sleep=self.clock.sleep)
+        limiter.update('token', self.headers(remaining=60, reset_in=3600))
+        for _ in range(30):
+            limiter.acquire('token')
+
+        state = limiter.state('token')
+
+        self.assertEqual(2400, state.limit)
+        self.assertEqual(30, state.remaining)
+        self.assertEqual(0.5, state.request_rate)
+        self.assertEqual(self.clock.now + 60, state.projected_drain_time)
+        self.assertTrue(state.will_drain_before_reset)
+
+    @responses.activate
+    def test_client_feeds_the_limiter_with_the_response_headers(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/whoami', fixture_name='whoami/success-user'))
+        limiter = RateLimiter()
+        client = Client(access_token='SomeMagicToken', sandbox=True, rate_limiter=limiter)
+
+        client.identity.whoami()
+
+        state = limiter.state(client.rate_limit_key)
+        self.assertEqual(4000, state.limit)
+        self.assertEqual(3991, state.remaining)
+        self.assertEqual(1450451976, state.reset)
+
+    def test_keys_the_budgets_of_the_clients_by_a_fingerprint_of_their_credentials(self):
+        limiter = RateLimiter()
+        client = Client(access_token='SomeMagicToken', rate_limiter=limiter)
+        other_client = Client(email='example-user@example.com', password='secret', rate_limiter=limiter)
+
+        self.assertEqual(credential_key('SomeMagicToken'), client.rate_limit_key)
+        self.assertNotIn('SomeMagicToken', client.rate_limit_key)
+        self.assertNotIn('example-user', other_client.rate_limit_key)
+        self.assertNotEqual(client.rate_limit_key, other_client.rate_limit_key)
+        self.assertEqual(client.rate_limit_key, Client(access_token='SomeMagicToken').rate_limit_key)
+        self.assertEqual(client.rate_limit_key, limiter.state(client.rate_limit_key).key)
+
+
+if __name__ == '__main__':
+    unittest.main()
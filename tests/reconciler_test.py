@@ -0,0 +1,135 @@
+import json
+import unittest
+
+import responses
+
+from dnsimple import ZoneReconciler
+from dnsimple.reconciler import diff_records
+from dnsimple.struct import ZoneRecord, ZoneRecordInput
+from tests.helpers import API_URL, RATE_LIMIT_HEADERS, DNSimpleTest, page, zone_record_data
+
+
+def zone_record(id, name, type, content, ttl=3600, priority=None, regions=None, system_record=False):
+    return ZoneRecord(zone_record_data(id, 'example.com', name, type, content, ttl=ttl, priority=priority,
+                                       regions=regions or ['global'], system_record=system_record))
+
+
+CURRENT = [
+    zone_record(1, '', 'SOA', 'ns1.dnsimple.com admin.dnsimple.com 1458642070 86400 7200 604800 300',
+                system_record=True),
+    zone_record(2, '', 'NS', 'ns1.dnsimple.com', system_record=True),
+    zone_record(3, 'www', 'A', '1.2.3.4'),
+    zone_record(4, 'www', 'A', '1.2.3.5'),
+    zone_record(5, '', 'MX', 'mx1.example.com', priority=10),
+    zone_record(6, 'old', 'CNAME', 'example.com'),
+    zone_record(7, 'api', 'A', '10.0.0.1'),
+]
+
+
+class DiffRecordsTest(unittest.TestCase):
+    def test_an_identical_record_set_needs_no_change(self):
+        desired = [ZoneRecordInput(record.name, record.type, record.content, ttl=record.ttl, priority=record.priority)
+                   for record in CURRENT[2:]]
+
+        plan = diff_records(CURRENT, desired)
+
+        self.assertFalse(plan)
+        self.assertEqual(5, plan.unchanged)
+
+    def test_computes_the_minimal_plan(self):
+        desired = [
+            ZoneRecordInput('www', 'A', '1.2.3.4'),
+            ZoneRecordInput('', 'MX', 'mx1.example.com', priority=20),
+            ZoneRecordInput('api', 'A', '10.0.0.2'),
+            ZoneRecordInput('new', 'TXT', 'hello'),
+        ]
+
+        plan = diff_records(CURRENT, desired)
+
+        self.assertEqual([('new', 'TXT', 'hello')], [(r['name'], r['type'], r['content']) for r in plan.creates])
+        self.assertEqual({5: {'priority': 20}, 7: {'content': '10.0.0.2'}},
+                         {update.record.id: update.changes for update in plan.updates})
+        self.assertEqual({4, 6}, {record.id for record in plan.deletes})
+        self.assertEqual(1, plan.unchanged)
+
+    def test_never_changes_system_records(self):
+        plan = diff_records(CURRENT, [ZoneRecordInput('', 'NS', 'ns9.example.com')])
+
+        self.assertEqual([], plan.updates)
+        self.assertNotIn(1, {record.id for record in plan.deletes})
+        self.assertNotIn(2, {record.id for record in plan.deletes})
+
+    def test_keeps_the_extra_records_without_prune(self):
+        plan = diff_records(CURRENT, [ZoneRecordInput('new', 'A', '1.1.1.1')], prune=False)
+
+        self.assertEqual([], plan.deletes)
+        self.assertEqual(1, len(plan.creates))
+
+    def test_compares_types_case_insensitively(self):
+        plan = diff_records(CURRENT, [{'name': 'www', 'type': 'a', 'content': '1.2.3.4'}], prune=False)
+
+        self.assertFalse(plan)
+
+    def test_describes_the_changes(self):
+        desired = [ZoneRecordInput(record.name, record.type, record.content) for record in CURRENT[2:6]]
+        desired.append(ZoneRecordInput('api', 'A', '10.0.0.2', ttl=60))
+
+        plan = diff_records(CURRENT, desired)
+
+        self.assertEqual(["~ api A 10.0.0.1 (content: '10.0.0.1' -> '10.0.0.2', ttl: 3600 -> 60)",
+                          '0 to create, 1 to update, 0 to delete, 4 unchanged'], plan.describe())
+
+    def test_builds_the_batch_change(self):
+        plan = diff_records(CURRENT, [ZoneRecordInput('www', 'A', '1.2.3.4'), ZoneRecordInput('api', 'A', '10.0.0.2'),
+                                      ZoneRecordInput('', 'TXT', 'hello', ttl=60)])
+
+        batch_change = json.loads(plan.to_batch_change().to_json())
+
+        self.assertEqual([{'name': '', 'type': 'TXT', 'content': 'hello', 'ttl': 60}], batch_change['creates'])
+        self.assertEqual([{'id': 7, 'content': '10.0.0.2'}], batch_change['updates'])
+        self.assertEqual([{'id': 4}, {'id': 5}, {'id': 6}], sorted(batch_change['deletes'], key=lambda d: d['id']))
+
+
+class ZoneReconcilerTest(DNSimpleTest):
+    def add_records(self):
+        responses.add(responses.GET, API_URL + '/1010/zones/example.com/records?page=1&per_page=100',
+                      json=page([{**vars(record)} for record in CURRENT]), headers=RATE_LIMIT_HEADERS)
+
+    @responses.activate
+    def test_dry_run_only_fetches_the_records(self):
+        self.add_records()
+
+        plan, response = ZoneReconciler(self.client).apply(1010, 'example.com', [], dry_run=True)
+
+        self.assertIsNone(response)
+        self.assertEqual(5, len(plan.deletes))
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_applies_the_plan_with_one_batch_change(self):
+        self.add_records()
+        responses.add(responses.POST, API_URL + '/1010/zones/example.com/batch',
+                      json={'data': {'creates': [], 'updates': [], 'deletes': [{'id': 6}]}},
+                      headers=RATE_LIMIT_HEADERS)
+        desired = [ZoneRecordInput(record.name, record.type, record.content) for record in CURRENT[2:]
+                   if record.id != 6]
+
+        plan, response = ZoneReconciler(self.client).apply(1010, 'example.com', desired)
+
+        self.assertEqual([6], [record.id for record in plan.deletes])
+        self.assertEqual([6], [delete.id for delete in response.data.deletes])
+        self.assertEqual({'deletes': [{'id': 6}]}, json.loads(responses.calls[1].request.body))
+
+    @responses.activate
+    def test_sends_nothing_when_the_zone_is_up_to_date(self):
+        self.add_records()
+        desired = [ZoneRecordInput(record.name, record.type, record.content) for record in CURRENT[2:]]
+
+        plan, response = ZoneReconciler(self.client).apply(1010, 'example.com', desired)
+
+        self.assertIsNone(response)
+        self.assertEqual(1, len(responses.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import unittest
+
+import responses
+
+from dnsimple import ZoneRecordIndex
+from dnsimple.struct import BatchChangeZoneRecordsInput, CompactZoneRecord, ZoneRecord
+from tests.helpers import DNSimpleTest, DNSimpleMockResponse
+
+
+def zone_record(id, name, type='A', content='192.0.2.1', zone='example.com'):
+    return ZoneRecord({'id': id, 'zone_id': zone, 'name': name, 'type': type, 'content': content, 'ttl': 3600})
+
+
+def webhook_event(name):
+    path = os.path.join(os.path.dirname(__file__), 'fixtures', 'v2', 'webhooks', name, 'example.http')
+    with open(path) as f:
+        return json.loads(f.read().splitlines()[-1])
+
+
+class ZoneRecordIndexTest(DNSimpleTest):
+    def setUp(self):
+        super().setUp()
+        self.index = ZoneRecordIndex([
+            zone_record(1, 'www', 'A', '192.0.2.1'),
+            zone_record(2, 'www', 'A', '192.0.2.2'),
+            zone_record(3, 'blog', 'CNAME', 'www.example.com'),
+            zone_record(4, 'www', 'A', '192.0.2.1', zone='example.org'),
+        ])
+
+    def test_looks_records_up(self):
+        self.assertEqual(4, len(self.index))
+        self.assertIn(3, self.index)
+        self.assertEqual('blog', self.index.get(3).name)
+        self.assertIsNone(self.index.get(5))
+        self.assertEqual([1, 2], [record.id for record in self.index.find('example.com', 'www', 'a')])
+        self.assertEqual([], self.index.find('example.com', 'www', 'CNAME'))
+        self.assertEqual([1, 4], [record.id for record in self.index.with_content('192.0.2.1')])
+        self.assertEqual([1, 2, 3], [record.id for record in self.index.in_zone('example.com')])
+
+    def test_upsert_moves_a_record_between_index_entries(self):
+        self.index.upsert(zone_record(1, 'api', 'A', '192.0.2.9'))
+
+        self.assertEqual(4, len(self.index))
+        self.assertEqual([2], [record.id for record in self.index.find('example.com', 'www', 'A')])
+        self.assertEqual([1], [record.id for record in self.index.find('example.com', 'api', 'A')])
+        self.assertEqual([4], [record.id for record in self.index.with_content('192.0.2.1')])
+
+    def test_removes_records(self):
+        self.assertEqual(3, self.index.remove(3).id)
+        self.assertIsNone(self.index.remove(3))
+        self.assertEqual([], self.index.find('example.com', 'blog', 'CNAME'))
+
+        self.assertEqual(2, self.index.remove_zone('example.com'))
+        self.assertEqual([4], [record.id for record in self.index])
+
+    def test_rejects_records_without_id(self):
+        with self.assertRaises(ValueError):
+            self.index.upsert(ZoneRecord({'zone_id': 'example.com', 'name': 'www', 'type': 'A', 'content': 'x'}))
+
+    def test_applies_webhook_events(self):
+        index = ZoneRecordIndex(struct=CompactZoneRecord)
+
+        self.assertTrue(index.apply_event(webhook_event('zone_record.create')))
+        created = index.find('example.zone', '', 'A')
+        self.assertEqual(1, len(created))
+        self.assertIsInstance(created[0], CompactZoneRecord)
+
+        self.assertTrue(index.apply_event(webhook_event('zone_record.update')))
+        self.assertTrue(index.apply_event(webhook_event('zone_record.delete')))
+        self.assertEqual(0, len(index))
+
+        self.assertFalse(index.apply_event(webhook_event('domain.create')))
+
+    @responses.activate
+    def test_applies_batch_change_responses(self):
+        responses.add(DNSimpleMockResponse(method=responses.POST, path='/1010/zones/example.com/batch',
+                                           fixture_name='batchChangeZoneRecords/success'))
+        index = ZoneRecordIndex([zone_record(67622509, 'old'), zone_record(67622534, 'update1')])
+
+        index.apply_batch(self.zones.batch_change_records(1010, 'example.com', BatchChangeZoneRecordsInput()))
+
+        self.assertNotIn(67622509, index)
+        self.assertEqual('update1-1757049890', index.get(67622534).name)
+        self.assertEqual([67623409, 67623410], [record.id for record in index.find('example.com', 'ab', 'A')])
+
+
+if __name__ == '__main__':
+    unittest.main()
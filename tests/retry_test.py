@@ -0,0 +1,133 @@
+import unittest
+
+import requests
+import responses
+
+from dnsimple import Client, DNSimpleException, RetryPolicy
+from dnsimple.struct import Whoami
+from tests.helpers import DNSimpleMockResponse
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.policy = RetryPolicy(max_attempts=3, backoff_factor=1, jitter=False, clock=lambda: 1000)
+
+    def test_does_not_retry_successful_or_client_errors(self):
+        self.assertIsNone(self.policy.retry_delay('GET', 1, response=FakeResponse(200)))
+        self.assertIsNone(self.policy.retry_delay('GET', 1, response=FakeResponse(404)))
+
+    def test_retries_idempotent_requests_with_exponential_backoff(self):
+        self.assertEqual(1, self.policy.retry_delay('GET', 1, response=FakeResponse(502)))
+        self.assertEqual(2, self.policy.retry_delay('DELETE', 2, response=FakeResponse(503)))
+
+    def test_caps_the_backoff(self):
+        policy = RetryPolicy(max_attempts=10, backoff_factor=1, max_backoff=5, jitter=False)
+
+        self.assertEqual(5, policy.retry_delay('GET', 8, response=FakeResponse(502)))
+
+    def test_applies_jitter_up_to_the_backoff(self):
+        policy = RetryPolicy(backoff_factor=4)
+
+        delay = policy.retry_delay('GET', 1, response=FakeResponse(502))
+
+        self.assertGreaterEqual(delay, 0)
+        self.assertLessEqual(delay, 4)
+
+    def test_does_not_retry_non_idempotent_requests_on_server_errors(self):
+        self.assertIsNone(self.policy.retry_delay('POST', 1, response=FakeResponse(502)))
+        self.assertIsNone(self.policy.retry_delay('PATCH', 1, error=requests.exceptions.ReadTimeout()))
+
+    def test_retries_non_idempotent_requests_not_processed(self):
+        self.assertEqual(1, self.policy.retry_delay('POST', 1, response=FakeResponse(429)))
+        self.assertEqual(1, self.policy.retry_delay('POST', 1, error=requests.exceptions.ConnectTimeout(),
+                                                    connect_error=True))
+
+    def test_gives_up_after_the_maximum_attempts(self):
+        self.assertIsNone(self.policy.retry_delay('GET', 3, response=FakeResponse(502)))
+        self.assertEqual(1, self.policy.metrics.exhausted)
+
+    def test_honours_retry_after(self):
+        self.assertEqual(7, self.policy.retry_delay('GET', 1, response=FakeResponse(503, {'Retry-After': '7'})))
+
+    def test_honours_the_rate_limit_reset_on_429(self):
+        response = FakeResponse(429, {'X-RateLimit-Reset': '1042'})
+
+        self.assertEqual(42, self.policy.retry_delay('GET', 1, response=response))
+
+    def test_gives_up_when_the_server_asks_to_wait_too_long(self):
+        response = FakeResponse(429, {'X-RateLimit-Reset': '5000'})
+
+        self.assertIsNone(self.policy.retry_delay('GET', 1, response=response))
+
+    def test_counts_the_retries(self):
+        self.policy.retry_delay('GET', 1, response=FakeResponse(502))
+        self.policy.retry_delay('GET', 2, response=FakeResponse(502))
+        self.policy.retry_delay('GET', 1, error=requests.exceptions.ReadTimeout())
+
+        self.assertEqual(3, self.policy.metrics.retries)
+        self.assertEqual(4, self.policy.metrics.waited)
+        self.assertEqual({502: 2, 'ReadTimeout': 1}, dict(self.policy.metrics.reasons))
+
+
+class ClientRetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sleeps = []
+        self.policy = RetryPolicy(max_attempts=3, jitter=False, sleep=self.sleeps.append)
+        self.client = Client(access_token='SomeMagicToken', sandbox=True, retry=self.policy)
+
+    @staticmethod
+    def bad_gateway(method, path):
+        return responses.Response(method, 'https://api.sandbox.dnsimple.com/v2' + path, status=502,
+                                  body='<html><body><h1>502 Bad Gateway</h1></body></html>',
+                                  content_type='text/html')
+
+    @responses.activate
+    def test_retries_bad_gateways(self):
+        responses.add(self.bad_gateway(responses.GET, '/whoami'))
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/whoami', fixture_name='whoami/success-user'))
+
+        whoami = self.client.identity.whoami().data
+
+        self.assertIsInstance(whoami, Whoami)
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual([0.5], self.sleeps)
+        self.assertEqual({502: 1}, dict(self.policy.metrics.reasons))
+
+    @responses.activate
+    def test_raises_once_the_attempts_are_exhausted(self):
+        for _ in range(3):
+            responses.add(self.bad_gateway(responses.GET, '/whoami'))
+
+        with self.assertRaises(DNSimpleException) as context:
+            self.client.identity.whoami()
+
+        self.assertEqual(502, context.exception.status)
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_retries_connection_errors(self):
+        responses.add(responses.GET, 'https://api.sandbox.dnsimple.com/v2/whoami',
+                      body=requests.exceptions.ConnectTimeout())
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/whoami', fixture_name='whoami/success-user'))
+
+        self.assertIsInstance(self.client.identity.whoami().data, Whoami)
+        self.assertEqual({'ConnectTimeout': 1}, dict(self.policy.metrics.reasons))
+
+    @responses.activate
+    def test_does_not_retry_posts_on_server_errors(self):
+        responses.add(self.bad_gateway(responses.POST, '/1010/domains'))
+
+        with self.assertRaises(DNSimpleException):
+            self.client.domains.create_domain(1010, 'example.com')
+
+        self.assertEqual(1, len(responses.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
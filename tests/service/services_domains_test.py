@@ -29,6 +29,17 @@ class TestName(DNSimpleTest):
 
         self.assertIsInstance(response.pagination, Pagination)
 
+    @responses.activate
+    def test_iter_applied_services(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET,
+                                           path='/1010/domains/example.com/services?page=1&per_page=100',
+                                           fixture_name='appliedServices/success'))
+
+        services = list(self.services.iter_applied_services(1010, 'example.com'))
+
+        self.assertEqual(1, len(services))
+        self.assertIsInstance(services[0], Service)
+
     @responses.activate
     def test_apply_service(self):
         responses.add(DNSimpleMockResponse(method=responses.POST,
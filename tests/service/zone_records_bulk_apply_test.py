@@ -0,0 +1,89 @@
+import json
+import unittest
+
+import responses
+
+from dnsimple import DNSimpleException, RecordOperation
+from dnsimple.struct import ZoneRecordInput, ZoneRecordUpdateInput
+from tests.helpers import API_URL, RATE_LIMIT_HEADERS, DNSimpleTest, DNSimpleMockResponse, zone_record_data
+
+
+def batch_callback(request):
+    body = json.loads(request.body)
+    zone = request.url.split('/zones/')[1].split('/')[0]
+    data = {
+        'creates': [zone_record_data(100 + index, zone, create['name'], content=create['content'])
+                    for index, create in enumerate(body.get('creates', []))],
+        'updates': [zone_record_data(update['id'], zone, 'updated', content=update['content']) for update in body.get('updates', [])],
+        'deletes': [{'id': delete['id']} for delete in body.get('deletes', [])],
+    }
+    return 200, RATE_LIMIT_HEADERS, json.dumps({'data': data})
+
+
+class ZoneRecordsBulkApplyTest(DNSimpleTest):
+    @responses.activate
+    def test_groups_the_operations_of_a_zone_in_batch_changes(self):
+        responses.add_callback(responses.POST, API_URL + '/1010/zones/example.com/batch', callback=batch_callback)
+        responses.add(DNSimpleMockResponse(method=responses.POST, path='/1010/zones/example.org/records',
+                                           fixture_name='createZoneRecord/created'))
+        responses.add(DNSimpleMockResponse(method=responses.DELETE, path='/1010/zones/example.net/records/6',
+                                           fixture_name='deleteZoneRecord/success'))
+        operations = [
+            RecordOperation.create(1010, 'example.com', ZoneRecordInput('www', 'A', '192.0.2.1')),
+            RecordOperation.create(1010, 'example.org', ZoneRecordInput('www', 'A', '192.0.2.1')),
+            RecordOperation.update(1010, 'example.com', 5, ZoneRecordUpdateInput(content='192.0.2.5')),
+            RecordOperation.delete(1010, 'example.net', 6),
+            RecordOperation.delete(1010, 'example.com', 7),
+        ]
+
+        report = self.zones.bulk_apply(operations, concurrency=3)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(3, report.requests)
+        self.assertEqual(operations, [outcome.operation for outcome in report])
+        self.assertEqual([True, False, True, False, True], [outcome.batched for outcome in report])
+        self.assertEqual([100, 1, 5, None, None],
+                         [None if outcome.record is None else outcome.record.id for outcome in report])
+        batch = [call for call in responses.calls if call.request.url.endswith('/batch')][0]
+        self.assertEqual({'creates': [{'name': 'www', 'type': 'A', 'content': '192.0.2.1'}],
+                          'updates': [{'id': 5, 'content': '192.0.2.5'}], 'deletes': [{'id': 7}]},
+                         json.loads(batch.request.body))
+
+    @responses.activate
+    def test_reports_the_failures_without_stopping(self):
+        responses.add(DNSimpleMockResponse(method=responses.PATCH, path='/1010/zones/example.com/records/5',
+                                           fixture_name='notfound-record'))
+        responses.add(DNSimpleMockResponse(method=responses.DELETE, path='/1010/zones/example.net/records/6',
+                                           fixture_name='deleteZoneRecord/success'))
+        operations = [
+            RecordOperation.update(1010, 'example.com', 5, ZoneRecordUpdateInput(content='192.0.2.5')),
+            RecordOperation.delete(1010, 'example.net', 6),
+        ]
+
+        report = self.zones.bulk_apply(operations)
+
+        self.assertFalse(report.ok)
+        self.assertEqual([operations[0]], [outcome.operation for outcome in report.failed])
+        self.assertIsInstance(report.failed[0].error, DNSimpleException)
+        self.assertEqual(404, report.failed[0].error.status)
+        self.assertEqual([operations[1]], [outcome.operation for outcome in report.succeeded])
+
+    @responses.activate
+    def test_reports_a_failed_batch_on_each_of_its_operations(self):
+        responses.add(responses.POST, API_URL + '/1010/zones/example.com/batch', status=400,
+                      json={'message': 'Validation failed'}, headers=RATE_LIMIT_HEADERS)
+        operations = [RecordOperation.delete(1010, 'example.com', record_id) for record_id in (1, 2, 3, 4)]
+
+        report = self.zones.bulk_apply(operations, chunk_size=2)
+
+        self.assertEqual(2, report.requests)
+        self.assertEqual(['Validation failed'] * 4, [outcome.error.message for outcome in report])
+        self.assertTrue(all(outcome.batched for outcome in report))
+
+    def test_rejects_unknown_actions(self):
+        with self.assertRaises(ValueError):
+            RecordOperation('rename', 1010, 'example.com')
+
+
+if __name__ == '__main__':
+    unittest.main()
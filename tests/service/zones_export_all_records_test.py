@@ -0,0 +1,79 @@
+import inspect
+import json
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import responses
+
+from dnsimple.struct import Zone, ZoneRecord
+from tests.helpers import API_URL, RATE_LIMIT_HEADERS, DNSimpleTest, page, zone_record_data
+
+# zone name: number of records
+ZONES = {'zone{index}.com'.format(index=index): index * 3 for index in range(7)}
+
+
+def api_callback(request):
+    url = urlparse(request.url)
+    query = {key: values[0] for key, values in parse_qs(url.query).items()}
+    current_page, per_page = int(query['page']), int(query['per_page'])
+    parts = url.path.split('/')
+    if parts[-1] == 'zones':
+        zones = [{'id': index, 'name': name} for index, name in enumerate(ZONES)]
+        return 200, RATE_LIMIT_HEADERS, json.dumps(page(zones, current_page, per_page))
+    zone = parts[-2]
+    records = [zone_record_data(index, zone, 'host{index}'.format(index=index)) for index in range(ZONES[zone])]
+    return 200, RATE_LIMIT_HEADERS, json.dumps(page(records, current_page, per_page))
+
+
+class ZonesExportAllRecordsTest(DNSimpleTest):
+    def setUp(self):
+        super().setUp()
+        responses.start()
+        responses.add_callback(responses.GET, API_URL + '/1010/zones', callback=api_callback)
+        for zone in ZONES:
+            responses.add_callback(responses.GET, API_URL + '/1010/zones/{zone}/records'.format(zone=zone),
+                                   callback=api_callback)
+
+    def tearDown(self):
+        responses.stop()
+        responses.reset()
+
+    def test_yields_every_record_zone_by_zone(self):
+        exported = list(self.zones.export_all_records(1010, concurrency=3, per_page=2))
+
+        expected = [(zone, index) for zone, count in ZONES.items() for index in range(count)]
+        self.assertEqual(expected, [(zone.name, record.id) for zone, record in exported])
+        self.assertIsInstance(exported[0][0], Zone)
+        self.assertIsInstance(exported[0][1], ZoneRecord)
+
+    def test_bounds_the_pages_in_flight(self):
+        exported = self.zones.export_all_records(1010, concurrency=1, per_page=2)
+        next(exported)
+
+        self.assertLessEqual(len(responses.calls), 1 + 2 + 1)
+        exported.close()
+
+    def test_closes_the_zone_listing_when_closed_early(self):
+        listings = []
+
+        def iter_zones(*args, **kwargs):
+            listings.append(self.client.iterate(self.zones.list_zones, *args, **kwargs))
+            return listings[-1]
+
+        with mock.patch.object(self.zones, 'iter_zones', side_effect=iter_zones):
+            exported = self.zones.export_all_records(1010, concurrency=1, per_page=2)
+            next(exported)
+            exported.close()
+
+        self.assertEqual(inspect.GEN_CLOSED, inspect.getgeneratorstate(listings[0]))
+
+    def test_sends_one_request_per_page(self):
+        list(self.zones.export_all_records(1010, concurrency=4, per_page=2))
+
+        record_pages = sum(max(1, -(-count // 2)) for count in ZONES.values())
+        self.assertEqual(record_pages + 1, len(responses.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import responses
+
+from dnsimple import Client, SingleFlight
+from tests.helpers import read_fixture
+
+WHOAMI_URL = 'https://api.sandbox.dnsimple.com/v2/whoami'
+RECORDS_URL = 'https://api.sandbox.dnsimple.com/v2/1010/zones/example.com/records'
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.single_flight = SingleFlight()
+        self.client = Client(access_token='SomeMagicToken', sandbox=True, single_flight=self.single_flight)
+        self.release = threading.Event()
+
+    def add_blocking_whoami(self, error=None):
+        self.add_blocking(WHOAMI_URL, 'whoami/success', error)
+
+    def add_blocking(self, url, fixture_name, error=None):
+        status, headers, body = read_fixture(fixture_name)
+
+        def callback(request):
+            self.release.wait(5)
+            if error is not None:
+                raise error
+            return status, headers, body
+
+        responses.add_callback(responses.GET, url, callback=callback)
+
+    def run_concurrently(self, calls, coalesced):
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            deadline = time.monotonic() + 5
+            while self.single_flight.metrics.coalesced < coalesced and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.release.set()
+            return [future.exception() or future.result() for future in futures]
+
+    @responses.activate
+    def test_identical_requests_in_flight_share_one_request(self):
+        self.add_blocking_whoami()
+
+        results = self.run_concurrently([self.client.identity.whoami] * 4, coalesced=3)
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual({1}, {result.data.account.id for result in results})
+        self.assertEqual(4, len({id(result.data) for result in results}))
+        self.assertEqual(1, self.single_flight.metrics.requests)
+        self.assertEqual(3, self.single_flight.metrics.coalesced)
+
+    @responses.activate
+    def test_does_not_share_nested_values_between_callers(self):
+        self.add_blocking(RECORDS_URL, 'listZoneRecords/success')
+
+        results = self.run_concurrently([lambda: self.client.zones.list_records(1010, 'example.com')] * 3,
+                                        coalesced=2)
+        results[0].data[0].regions.append('SV1')
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual([['global', 'SV1'], ['global'], ['global']], [result.data[0].regions for result in results])
+        self.assertEqual(3, len({id(result.http_response.dnsimple_json) for result in results}))
+
+    @responses.activate
+    def test_shares_the_error_of_the_request_in_flight(self):
+        self.add_blocking_whoami(error=requests.exceptions.ConnectionError('refused'))
+
+        results = self.run_concurrently([self.client.identity.whoami] * 3, coalesced=2)
+
+        self.assertEqual(1, len(responses.calls))
+        for result in results:
+            self.assertIsInstance(result, requests.exceptions.ConnectionError)
+
+    @responses.activate
+    def test_sends_the_request_again_once_completed(self):
+        self.release.set()
+        self.add_blocking_whoami()
+
+        self.client.identity.whoami()
+        self.client.identity.whoami()
+
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual(0, self.single_flight.metrics.coalesced)
+
+    @responses.activate
+    def test_can_be_disabled(self):
+        self.single_flight.enabled = False
+        self.add_blocking_whoami()
+
+        self.run_concurrently([self.client.identity.whoami] * 3, coalesced=0)
+
+        self.assertEqual(3, len(responses.calls))
+        self.assertEqual(0, self.single_flight.metrics.requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
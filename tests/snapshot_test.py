@@ -0,0 +1,125 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import responses
+
+from dnsimple.snapshot import Snapshot, SnapshotWriter, restore_zone, take_snapshot
+from dnsimple.struct import CompactZoneRecord, ZoneRecord
+from tests.helpers import API_URL, RATE_LIMIT_HEADERS, DNSimpleTest, page, zone_record_data
+
+COM = [zone_record_data(1, 'example.com', '', 'SOA', 'ns1.dnsimple.com admin.dnsimple.com 1 86400 7200 604800 300',
+                        system_record=True),
+       zone_record_data(2, 'example.com', 'www', priority=None, regions=['SV1', 'IAD']),
+       zone_record_data(3, 'example.com', '', 'MX', 'mx.example.com', priority=10, ttl=60)]
+ORG = [zone_record_data(4, 'example.org', 'www', content='héllo', regions=None, parent_id=2)]
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'account.snapshot')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self):
+        with SnapshotWriter(self.path, metadata={'account_id': 1010}) as writer:
+            writer.add_zone('example.com', [ZoneRecord(data) for data in COM])
+            writer.add_zone('example.org', [ZoneRecord(data) for data in ORG])
+
+    def test_reads_back_the_records_written(self):
+        self.write()
+
+        with Snapshot(self.path) as snapshot:
+            records = list(snapshot.records())
+
+            self.assertEqual(4, len(snapshot))
+            self.assertEqual(['example.com', 'example.org'], snapshot.zones)
+            self.assertEqual({'account_id': 1010}, snapshot.metadata)
+        self.assertEqual(COM + ORG, [vars(record) for record in records])
+
+    def test_reads_the_records_of_one_zone(self):
+        self.write()
+
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual([4], [record.id for record in snapshot.records('example.org')])
+            self.assertEqual([], list(snapshot.records('example.net')))
+            self.assertIsInstance(next(snapshot.records(struct=CompactZoneRecord)), CompactZoneRecord)
+
+    def test_interns_the_strings(self):
+        with SnapshotWriter(self.path) as writer:
+            writer.add_zone('example.com', [ZoneRecord(zone_record_data(index, 'example.com', 'www'))
+                                            for index in range(1, 1001)])
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(1, f.read().count(b'www'))
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\x80\x04not a snapshot file')
+
+        with self.assertRaises(ValueError):
+            Snapshot(self.path)
+
+
+class SnapshotClientTest(DNSimpleTest):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'account.snapshot')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def add_records(self, zone, records):
+        responses.add(responses.GET, API_URL + '/1010/zones/{zone}/records?page=1&per_page=100'.format(zone=zone),
+                      json=page(records), headers=RATE_LIMIT_HEADERS)
+
+    @responses.activate
+    def test_takes_a_snapshot_of_every_zone(self):
+        responses.add(responses.GET, API_URL + '/1010/zones?page=1&per_page=100',
+                      json=page([{'id': 1, 'name': 'example.com'}, {'id': 2, 'name': 'example.org'}]),
+                      headers=RATE_LIMIT_HEADERS)
+        self.add_records('example.com', COM)
+        self.add_records('example.org', ORG)
+
+        count = take_snapshot(self.client, 1010, self.path)
+
+        self.assertEqual(4, count)
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(['example.com', 'example.org'], snapshot.zones)
+            self.assertEqual({'account_id': 1010}, snapshot.metadata)
+
+    @responses.activate
+    def test_restores_a_zone_with_a_batch_change(self):
+        with SnapshotWriter(self.path) as writer:
+            writer.add_zone('example.com', [ZoneRecord(data) for data in COM])
+        self.add_records('example.com', [COM[0], zone_record_data(5, 'example.com', 'www', content='192.0.2.9')])
+        responses.add(responses.POST, API_URL + '/1010/zones/example.com/batch',
+                      json={'data': {'creates': [], 'updates': [], 'deletes': []}}, headers=RATE_LIMIT_HEADERS)
+
+        plan, response = restore_zone(self.client, 1010, self.path, 'example.com')
+
+        self.assertEqual({'creates': [{'name': '', 'type': 'MX', 'content': 'mx.example.com', 'ttl': 60,
+                                       'priority': 10, 'regions': ['global']}],
+                          'updates': [{'id': 5, 'content': '192.0.2.1', 'regions': ['SV1', 'IAD']}]},
+                         json.loads(responses.calls[1].request.body))
+
+    @responses.activate
+    def test_restore_dry_run_sends_no_change(self):
+        with SnapshotWriter(self.path) as writer:
+            writer.add_zone('example.com', [ZoneRecord(data) for data in COM])
+        self.add_records('example.com', COM)
+
+        plan, response = restore_zone(self.client, 1010, self.path, 'example.com', dry_run=True)
+
+        self.assertFalse(plan)
+        self.assertIsNone(response)
+        self.assertEqual(1, len(responses.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
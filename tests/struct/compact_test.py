@@ -0,0 +1,75 @@
+import pickle
+import unittest
+
+import responses
+
+from dnsimple import Client
+from dnsimple.struct import CompactDomain, CompactZoneRecord, Domain, ZoneRecord
+from tests.helpers import DNSimpleMockResponse
+
+RECORD = {'id': 1, 'zone_id': 'example.com', 'parent_id': None, 'name': 'www', 'content': '127.0.0.1', 'ttl': 600,
+          'priority': None, 'type': 'A', 'regions': ['global'], 'system_record': False,
+          'created_at': '2016-03-22T10:20:53Z', 'updated_at': '2016-10-05T09:26:38Z'}
+
+
+class CompactStructTest(unittest.TestCase):
+    def test_has_the_same_attributes_as_the_struct(self):
+        record = ZoneRecord(RECORD)
+        compact_record = CompactZoneRecord(RECORD)
+
+        for name in CompactZoneRecord.fields:
+            self.assertEqual(getattr(record, name), getattr(compact_record, name))
+
+    def test_uses_the_struct_defaults(self):
+        domain = CompactDomain({'id': 1, 'name': 'example.com'})
+
+        self.assertEqual('example.com', domain.name)
+        self.assertFalse(domain.auto_renew)
+        self.assertIsNone(domain.expires_at)
+
+    def test_keeps_attributes_not_declared_by_the_struct(self):
+        record = CompactZoneRecord({**RECORD, 'new_attribute': 'value'})
+
+        self.assertEqual('value', record.new_attribute)
+
+    def test_does_not_have_a_per_instance_dict(self):
+        record = CompactZoneRecord(RECORD)
+
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertIsNone(record._extra)
+        with self.assertRaises(AttributeError):
+            record.missing_attribute
+
+    def test_compares_and_pickles(self):
+        record = CompactZoneRecord(RECORD)
+
+        self.assertEqual(record, CompactZoneRecord(dict(RECORD)))
+        self.assertNotEqual(record, CompactZoneRecord({**RECORD, 'ttl': 3600}))
+        self.assertEqual(record, pickle.loads(pickle.dumps(record)))
+
+    @responses.activate
+    def test_client_can_opt_into_compact_structs(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/zones/example.com/records',
+                                           fixture_name='listZoneRecords/success'))
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/domains',
+                                           fixture_name='listDomains/success'))
+        client = Client(access_token='SomeMagicToken', sandbox=True, compact_structs=True)
+
+        records = client.zones.list_records(1010, 'example.com').data
+        domains = client.domains.list_domains(1010).data
+
+        self.assertIsInstance(records[0], CompactZoneRecord)
+        self.assertEqual(5, len(records))
+        self.assertIsInstance(domains[0], CompactDomain)
+
+    @responses.activate
+    def test_client_returns_regular_structs_by_default(self):
+        responses.add(DNSimpleMockResponse(method=responses.GET, path='/1010/domains',
+                                           fixture_name='listDomains/success'))
+        client = Client(access_token='SomeMagicToken', sandbox=True)
+
+        self.assertIsInstance(client.domains.list_domains(1010).data[0], Domain)
+
+
+if __name__ == '__main__':
+    unittest.main()
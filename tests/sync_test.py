@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import responses
+
+from dnsimple import SyncState, ZoneRecordIndex, ZoneSync
+from tests.helpers import API_URL, RATE_LIMIT_HEADERS, DNSimpleTest, page, zone_record_data
+
+
+def zone(id, name, updated_at):
+    return {'id': id, 'account_id': 1010, 'name': name, 'updated_at': updated_at}
+
+
+def record(id, zone, name, updated_at):
+    return zone_record_data(id, zone, name, updated_at=updated_at)
+
+
+class ZoneSyncTest(DNSimpleTest):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'sync.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def add_zones(self, zones):
+        responses.add(responses.GET, API_URL + '/1010/zones?page=1&per_page=100', json=page(zones),
+                      headers=RATE_LIMIT_HEADERS)
+
+    def add_records(self, zone, records):
+        responses.add(responses.GET, API_URL + '/1010/zones/{zone}/records?sort=id%3Aasc&page=1&per_page=100'.format(
+            zone=zone), json=page(records), headers=RATE_LIMIT_HEADERS)
+
+    @responses.activate
+    def test_first_run_fetches_every_zone(self):
+        self.add_zones([zone(1, 'example.com', '2024-01-01T00:00:00Z'), zone(2, 'example.org', '2024-01-01T00:00:00Z')])
+        self.add_records('example.com', [record(1, 'example.com', 'www', '2024-01-01T00:00:00Z')])
+        self.add_records('example.org', [])
+
+        result = ZoneSync(self.client, 1010, state=SyncState(self.path)).run()
+
+        self.assertEqual(2, result.zones_checked)
+        self.assertEqual(['example.com', 'example.org'], result.changed_zones)
+        self.assertEqual([1], [r.id for r in result.changed_records['example.com']])
+        self.assertEqual(3, result.requests)
+        self.assertEqual(3, len(responses.calls))
+        self.assertEqual({'updated_at': '2024-01-01T00:00:00Z', 'records_updated_at': '2024-01-01T00:00:00Z'},
+                         SyncState(self.path).zones['example.com'])
+
+    @responses.activate
+    def test_only_fetches_the_zones_that_moved(self):
+        index = ZoneRecordIndex()
+        state = SyncState(self.path)
+        self.add_zones([zone(1, 'example.com', '2024-01-01T00:00:00Z'), zone(2, 'example.org', '2024-01-01T00:00:00Z'),
+                        zone(3, 'example.net', '2024-01-01T00:00:00Z')])
+        self.add_records('example.com', [record(1, 'example.com', 'www', '2024-01-01T00:00:00Z'),
+                                         record(2, 'example.com', 'old', '2024-01-01T00:00:00Z')])
+        self.add_records('example.org', [record(3, 'example.org', 'www', '2024-01-01T00:00:00Z')])
+        self.add_records('example.net', [])
+        ZoneSync(self.client, 1010, state=state, index=index).run()
+
+        responses.reset()
+        self.add_zones([zone(1, 'example.com', '2024-02-01T00:00:00Z'), zone(2, 'example.org', '2024-01-01T00:00:00Z')])
+        self.add_records('example.com', [record(1, 'example.com', 'www', '2024-02-01T00:00:00Z'),
+                                         record(4, 'example.com', 'new', '2024-02-01T00:00:00Z')])
+        result = ZoneSync(self.client, 1010, state=SyncState(self.path), index=index).run()
+
+        self.assertEqual(['example.com'], result.changed_zones)
+        self.assertEqual(['example.net'], result.removed_zones)
+        self.assertEqual([1, 4], [r.id for r in result.changed_records['example.com']])
+        self.assertEqual({'example.com': [2]}, result.deleted_records)
+        self.assertEqual(2, result.requests)
+        self.assertEqual(2, len(responses.calls))
+        self.assertEqual([1, 3, 4], sorted(r.id for r in index))
+        self.assertNotIn('example.net', SyncState(self.path).zones)
+
+    @responses.activate
+    def test_counts_the_pages_fetched(self):
+        records = [record(1, 'example.com', 'www', '2024-01-01T00:00:00Z'),
+                   record(2, 'example.com', 'api', '2024-01-01T00:00:00Z')]
+        self.add_zones([zone(1, 'example.com', '2024-01-01T00:00:00Z')])
+        # the API answers with smaller pages than requested, the records take two requests
+        for current_page in (1, 2):
+            responses.add(responses.GET, API_URL + '/1010/zones/example.com/records?sort=id%3Aasc&page={page}'
+                          '&per_page=100'.format(page=current_page), json=page(records, current_page, per_page=1),
+                          headers=RATE_LIMIT_HEADERS)
+
+        result = ZoneSync(self.client, 1010).run()
+
+        self.assertEqual([1, 2], [r.id for r in result.records['example.com']])
+        self.assertEqual(3, result.requests)
+        self.assertEqual(3, len(responses.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import io
+import json
+import unittest
+
+from dnsimple.struct import CompactZoneRecord, ZoneFile, ZoneRecord
+from dnsimple.zone_file_parser import parse_ttl, parse_zone_file
+from tests.helpers import read_fixture
+
+ZONE_FILE = """$ORIGIN example.com.
+$TTL 1h
+@ IN SOA ns1.dnsimple.com. admin.dnsimple.com. (
+        1453132552 ; serial
+        86400      ; refresh
+        7200 604800 300 )
+@ 3600 IN NS ns1.dnsimple.com.
+  IN NS ns2
+www 300 A 192.0.2.1
+    A 192.0.2.2 ; second address
+mail.example.com. IN 1d MX 10 mx1
+@ MX 20 mx2.example.net.
+_sip._tcp SRV 10 60 5060 sip.example.com.
+blog CNAME www
+txt TXT "v=spf1 include:_spf.example.com ~all" "second; string"
+
+$ORIGIN sub.example.com.
+api AAAA 2001:db8::1
+"""
+
+
+def summary(record):
+    return record.name, record.type, record.content, record.ttl, record.priority
+
+
+class ParseZoneFileTest(unittest.TestCase):
+    def test_parses_the_records_like_the_api_returns_them(self):
+        records = list(parse_zone_file(ZONE_FILE))
+
+        self.assertEqual([
+            ('', 'SOA', 'ns1.dnsimple.com admin.dnsimple.com 1453132552 86400 7200 604800 300', 3600, None),
+            ('', 'NS', 'ns1.dnsimple.com', 3600, None),
+            ('', 'NS', 'ns2.example.com', 3600, None),
+            ('www', 'A', '192.0.2.1', 300, None),
+            ('www', 'A', '192.0.2.2', 3600, None),
+            ('mail', 'MX', 'mx1.example.com', 86400, 10),
+            ('', 'MX', 'mx2.example.net', 3600, 20),
+            ('_sip._tcp', 'SRV', '60 5060 sip.example.com', 3600, 10),
+            ('blog', 'CNAME', 'www.example.com', 3600, None),
+            ('txt', 'TXT', '"v=spf1 include:_spf.example.com ~all" "second; string"', 3600, None),
+            ('api.sub', 'AAAA', '2001:db8::1', 3600, None),
+        ], [summary(record) for record in records])
+        self.assertIsInstance(records[0], ZoneRecord)
+        self.assertEqual('example.com', records[0].zone_id)
+        self.assertEqual([True, True, True, False], [record.system_record for record in records[:4]])
+
+    def test_parses_the_zone_file_fixture(self):
+        zone_file = ZoneFile(json.loads(read_fixture('getZoneFile/success')[2])['data'])
+
+        records = list(zone_file.records())
+
+        self.assertEqual(['SOA', 'NS', 'NS', 'NS', 'NS'], [record.type for record in records])
+        self.assertTrue(all(record.system_record for record in records))
+
+    def test_reads_the_lines_lazily_from_a_file(self):
+        lines = iter(io.StringIO(ZONE_FILE))
+
+        records = parse_zone_file(lines)
+        next(records)
+
+        self.assertEqual('@ 3600 IN NS ns1.dnsimple.com.\n', next(lines))
+
+    def test_builds_the_given_struct(self):
+        records = list(parse_zone_file('www 60 IN A 192.0.2.1\n', zone='example.com', struct=CompactZoneRecord))
+
+        self.assertEqual([('www', 'A', '192.0.2.1', 60, None)], [summary(record) for record in records])
+        self.assertIsInstance(records[0], CompactZoneRecord)
+
+    def test_uses_the_zone_given_for_relative_names(self):
+        records = list(parse_zone_file('@ A 192.0.2.1\nwww A 192.0.2.2\n', zone='example.com.', default_ttl=60))
+
+        self.assertEqual([('', 'A', '192.0.2.1', 60, None), ('www', 'A', '192.0.2.2', 60, None)],
+                         [summary(record) for record in records])
+
+    def test_reports_the_line_of_errors(self):
+        for zone_file, message in [('www A 192.0.2.1\n', 'Line 1: The zone is unknown'),
+                                   ('$ORIGIN example.com.\nwww A\n', 'Line 2: Missing record data'),
+                                   ('$ORIGIN example.com.\n$INCLUDE other.zone\n', 'Line 2: Unsupported directive'),
+                                   ('$ORIGIN example.com.\nwww MX ten mx\n', 'Line 2:'),
+                                   ('$ORIGIN example.com.\n@ SOA ns1 admin ( 1 2\n', 'Unbalanced parentheses')]:
+            with self.assertRaises(ValueError) as context:
+                list(parse_zone_file(zone_file))
+            self.assertTrue(str(context.exception).startswith(message), str(context.exception))
+
+
+class ParseTtlTest(unittest.TestCase):
+    def test_parses_seconds_and_units(self):
+        self.assertEqual(300, parse_ttl('300'))
+        self.assertEqual(5400, parse_ttl('1h30m'))
+        self.assertEqual(1209600, parse_ttl('2W'))
+
+    def test_rejects_invalid_ttls(self):
+        for value in ('h', '1x', '1h30'):
+            with self.assertRaises(ValueError):
+                parse_ttl(value)
+
+
+if __name__ == '__main__':
+    unittest.main()